@@ -1,8 +1,15 @@
 import sys
+from LabviewToPython.core.runtime.startup_profiler import StartupProfiler
+
+# Before the heavy imports so they show up in the trace (--profile-startup / LABAPP_PROFILE_STARTUP).
+profiler = StartupProfiler.from_argv(sys.argv)
+
 from PySide6.QtWidgets import QApplication
+from LabviewToPython.core.abstractions.i_eventbus import IEventBus
+from LabviewToPython.core.di.container import Container
 from LabviewToPython.core.runtime.module_manager import ModuleManager
 from LabviewToPython.core.events.eventbus import EventBus
-from LabviewToPython.views.main_window import MainWindow
+from LabviewToPython.ui.main_window import MainWindow
 
 def main() -> int:
     app = QApplication(sys.argv)
@@ -10,11 +17,19 @@ def main() -> int:
     app.setApplicationName("LabApp")
 
     bus = EventBus()
+    Container.register(IEventBus, bus)
     modules_manager = ModuleManager()
     modules_manager.load_all()  # discover & instantiate feature modules
 
-    win = MainWindow(modules_manager, bus)   # shell only knows the manager
+    if profiler is not None:
+        with profiler.span("MainWindow"):
+            win = MainWindow(modules_manager, bus)
+        profiler.finish_on_first_paint(win, lambda: modules_manager.timings, Container.timings)
+    else:
+        win = MainWindow(modules_manager, bus)   # shell only knows the manager
     win.show()
+    if profiler is not None:
+        print(modules_manager.startup_report())
     return app.exec()
 
 if __name__ == "__main__":
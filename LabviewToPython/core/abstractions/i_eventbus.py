@@ -6,6 +6,6 @@ class IEventBus(ABC):
     @abstractmethod
     def publish(self, topic: str, payload: Any | None = None) -> None: ...
     @abstractmethod
-    def subscribe(self, topic: str, handler: Callable[[Any], None]) -> object: ...
+    def subscribe(self, topic: str, handler: Callable[[Any], None], **options: Any) -> object: ...
     @abstractmethod
     def unsubscribe(self, topic: str, handler: Callable[[Any], None]) -> None: ...
\ No newline at end of file
@@ -4,6 +4,10 @@ from typing import List
 from LabviewToPython.core.types.host import DockSpec, HostServices, AppContext
 
 class IModule(ABC):
+    # True if start() may run on a worker thread, concurrently with other modules
+    # (no QObject/QWidget creation, no shared state without locking).
+    thread_safe_start: bool = False
+
     def start(self, ctx: AppContext) -> None: ...
     def stop(self) -> None: ...
 
@@ -1,25 +1,252 @@
-# labapp/core/service_container.py
+# core/di/container.py
 from __future__ import annotations
-from typing import Any, Optional, Type, TypeVar, cast
+import inspect
+import threading
+import time
+import typing
+from dataclasses import dataclass
 from threading import RLock
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, cast
+
+from LabviewToPython.core.domain.enums.service_lifetime import ServiceLifetime
 
 T = TypeVar("T")
+_MISSING = object()
+
+
+class ResolutionError(KeyError):
+    """Service not registered, not constructible, or a dependency cycle."""
+
+
+@dataclass
+class ServiceTiming:
+    service: str
+    lifetime: ServiceLifetime
+    start_s: float      # time.perf_counter()
+    duration_s: float   # own construction, dependencies excluded
+    thread: str
+    scope: str = ""
+
+
+@dataclass
+class _Registration:
+    key: type
+    lifetime: ServiceLifetime
+    factory: Optional[Callable[..., Any]]
+    deps: Optional[Tuple[Tuple[str, type], ...]] = None   # (parameter, key), planned on first build
+    planned_for: int = -1     # Container._generation the plan was made for
+
 
 class Container:
-    _services: dict[type, Any] = {}
+    """
+    Global service registry.
+
+    - register(key, instance): ready-made instance (as before).
+    - register_singleton / register_scoped / register_factory: the factory
+      (default: `key` itself) runs on first use. Its parameters annotated with
+      registered keys are injected; that plan is worked out once per service
+      and redone after any (re)registration, so an optional dependency
+      registered later is picked up.
+    - Singletons and instances live in a copy-on-write dict, so get() after
+      warm-up is a plain dict lookup without taking the lock.
+    Every construction is timed, see timings().
+    """
+    _registrations: Dict[type, _Registration] = {}
+    _singletons: Dict[type, Any] = {}          # replaced, never mutated
+    _timings: List[ServiceTiming] = []
+    _generation = 0                            # bumped on every registration change
     _lock = RLock()
+    _local = threading.local()
 
+    # ---- registration ----
     @classmethod
     def register(cls, key: type[T], instance: T) -> None:
+        cls._add(_Registration(key, ServiceLifetime.INSTANCE, None), instance)
+
+    @classmethod
+    def register_singleton(cls, key: type[T], factory: Optional[Callable[..., T]] = None) -> None:
+        cls._add(_Registration(key, ServiceLifetime.SINGLETON, factory or key))
+
+    @classmethod
+    def register_scoped(cls, key: type[T], factory: Optional[Callable[..., T]] = None) -> None:
+        cls._add(_Registration(key, ServiceLifetime.SCOPED, factory or key))
+
+    @classmethod
+    def register_factory(cls, key: type[T], factory: Optional[Callable[..., T]] = None,
+                         lifetime: ServiceLifetime = ServiceLifetime.TRANSIENT) -> None:
+        if lifetime == ServiceLifetime.INSTANCE:
+            raise ValueError("use register(key, instance) for ready-made instances")
+        cls._add(_Registration(key, lifetime, factory or key))
+
+    @classmethod
+    def is_registered(cls, key: type) -> bool:
+        return key in cls._registrations
+
+    @classmethod
+    def clear(cls) -> None:
         with cls._lock:
-            cls._services[key] = instance
+            cls._registrations = {}
+            cls._singletons = {}
+            cls._timings = []
+            cls._generation += 1
 
     @classmethod
-    def get(cls, key: type[T]) -> T:
+    def _add(cls, reg: _Registration, instance: Any = _MISSING) -> None:
         with cls._lock:
-            return cast(T, cls._services[key])
+            regs = dict(cls._registrations)
+            regs[reg.key] = reg
+            singletons = dict(cls._singletons)
+            singletons.pop(reg.key, None)
+            if instance is not _MISSING:
+                singletons[reg.key] = instance
+            cls._registrations = regs
+            cls._singletons = singletons
+            cls._generation += 1
+
+    # ---- resolution ----
+    @classmethod
+    def get(cls, key: type[T]) -> T:
+        inst = cls._singletons.get(key, _MISSING)
+        if inst is not _MISSING:
+            return cast(T, inst)
+        return cast(T, cls._resolve(key, None))
 
     @classmethod
     def try_get(cls, key: type[T]) -> Optional[T]:
+        inst = cls._singletons.get(key, _MISSING)
+        if inst is not _MISSING:
+            return cast(T, inst)
+        if key not in cls._registrations:
+            return None
+        return cast(T, cls._resolve(key, None))
+
+    @classmethod
+    def scope(cls, name: str = "") -> "Scope":
+        return Scope(name)
+
+    @classmethod
+    def timings(cls) -> List[ServiceTiming]:
         with cls._lock:
-            return cast(Optional[T], cls._services.get(key))
+            return list(cls._timings)
+
+    @classmethod
+    def _resolve(cls, key: type, scope: Optional["Scope"]) -> Any:
+        reg = cls._registrations.get(key)
+        if reg is None:
+            raise ResolutionError(f"{_name(key)} is not registered")
+        if reg.lifetime == ServiceLifetime.SINGLETON:
+            with cls._lock:   # double-checked: one construction even with concurrent first gets
+                inst = cls._singletons.get(key, _MISSING)
+                if inst is _MISSING:
+                    inst = cls._build(reg, None)
+                    singletons = dict(cls._singletons)
+                    singletons[key] = inst
+                    cls._singletons = singletons
+            return inst
+        if reg.lifetime == ServiceLifetime.SCOPED:
+            if scope is None:
+                raise ResolutionError(f"{_name(key)} is scoped; resolve it through Container.scope()")
+            return scope._get_or_build(reg)
+        if reg.lifetime == ServiceLifetime.INSTANCE:
+            return cls._singletons[key]
+        return cls._build(reg, scope)
+
+    @classmethod
+    def _build(cls, reg: _Registration, scope: Optional["Scope"]) -> Any:
+        stack: List[type] = cls._local.__dict__.setdefault("stack", [])
+        if reg.key in stack:
+            chain = " -> ".join(_name(k) for k in stack[stack.index(reg.key):] + [reg.key])
+            raise ResolutionError(f"dependency cycle: {chain}")
+        stack.append(reg.key)
+        try:
+            generation = cls._generation
+            if reg.deps is None or reg.planned_for != generation:
+                reg.deps = _plan(reg.factory)
+                reg.planned_for = generation
+            kwargs = {}
+            for param, dep in reg.deps:
+                if reg.lifetime == ServiceLifetime.SINGLETON and \
+                        cls._registrations[dep].lifetime == ServiceLifetime.SCOPED:
+                    raise ResolutionError(f"singleton {_name(reg.key)} depends on scoped {_name(dep)}")
+                kwargs[param] = cls._resolve(dep, scope)
+            t0 = time.perf_counter()
+            inst = cast(Callable[..., Any], reg.factory)(**kwargs)
+            dt = time.perf_counter() - t0
+        finally:
+            stack.pop()
+        timing = ServiceTiming(_name(reg.key), reg.lifetime, t0, dt,
+                               threading.current_thread().name, scope.name if scope else "")
+        with cls._lock:
+            cls._timings.append(timing)
+        return inst
+
+
+class Scope:
+    """
+    Lifetime for SCOPED services (e.g. one measurement run). Singletons and
+    transients resolve as usual; close() (or leaving the `with` block) calls
+    close() on the scoped instances, newest first.
+    """
+    def __init__(self, name: str = "") -> None:
+        self.name = name
+        self._instances: Dict[type, Any] = {}
+        self._order: List[Any] = []
+        self._lock = RLock()
+
+    def get(self, key: type[T]) -> T:
+        return cast(T, Container._resolve(key, self))
+
+    def try_get(self, key: type[T]) -> Optional[T]:
+        return self.get(key) if Container.is_registered(key) else None
+
+    def close(self) -> None:
+        with self._lock:
+            order, self._order, self._instances = self._order, [], {}
+        for inst in reversed(order):
+            close = getattr(inst, "close", None)
+            if callable(close):
+                try: close()
+                except Exception: pass
+
+    def __enter__(self) -> "Scope":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _get_or_build(self, reg: _Registration) -> Any:
+        inst = self._instances.get(reg.key, _MISSING)
+        if inst is _MISSING:
+            with self._lock:
+                inst = self._instances.get(reg.key, _MISSING)
+                if inst is _MISSING:
+                    inst = Container._build(reg, self)
+                    self._instances[reg.key] = inst
+                    self._order.append(inst)
+        return inst
+
+
+def _plan(factory: Any) -> Tuple[Tuple[str, type], ...]:
+    """Parameters to inject: annotated with a registered key, or required (then they must be)."""
+    target = factory.__init__ if inspect.isclass(factory) else factory
+    try:
+        hints = typing.get_type_hints(target)
+    except Exception:
+        hints = {}
+    deps: List[Tuple[str, type]] = []
+    for p in inspect.signature(factory).parameters.values():
+        if p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD):
+            continue
+        hint = hints.get(p.name)
+        if hint is not None and Container.is_registered(hint):
+            deps.append((p.name, hint))
+        elif p.default is p.empty:
+            raise ResolutionError(
+                f"{_name(factory)}: parameter {p.name!r} ({_name(hint) if hint else 'no annotation'}) "
+                f"is not a registered service; register it or pass a factory"
+            )
+    return tuple(deps)
+
+
+def _name(obj: Any) -> str:
+    return getattr(obj, "__qualname__", None) or repr(obj)
@@ -0,0 +1,6 @@
+from enum import Enum
+
+class DispatchMode(str, Enum):
+    SYNC   = "sync"     # handler runs on the publishing thread (default)
+    THREAD = "thread"   # own queue, drained in order by the subscriber's own worker thread
+    QT     = "qt"       # own queue, drained in a Qt thread (GUI thread by default)
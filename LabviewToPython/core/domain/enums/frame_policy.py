@@ -0,0 +1,6 @@
+from enum import Enum
+
+class FramePolicy(str, Enum):
+    NEWEST_ONLY = "newest_only"   # keep only the latest frame, replace older ones
+    BLOCK       = "block"         # producer waits until the consumer catches up
+    DROP_OLDEST = "drop_oldest"   # ring: discard the oldest queued frame
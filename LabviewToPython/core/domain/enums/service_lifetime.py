@@ -0,0 +1,7 @@
+from enum import Enum
+
+class ServiceLifetime(str, Enum):
+    INSTANCE  = "instance"    # registered ready-made
+    SINGLETON = "singleton"   # built on first get(), then shared
+    SCOPED    = "scoped"      # one instance per Container.scope()
+    TRANSIENT = "transient"   # built on every get()
@@ -0,0 +1,196 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Any, Dict, Iterable, Optional, Tuple, Type, TypeVar, Union, overload
+
+import numpy as np
+
+from LabviewToPython.core.domain.enums.units.length_system import LengthSystem
+from LabviewToPython.core.domain.enums.units.pressure_unit import PressureUnit
+from LabviewToPython.core.domain.quantities.length import Length
+from LabviewToPython.core.domain.quantities.pressure import Pressure
+from LabviewToPython.core.domain.quantities.units_context import M_PER_UNIT, PA_PER_UNIT, UNITS, UnitsContext
+
+A = TypeVar("A", bound="_QuantityArray")
+
+
+class _QuantityArray(ABC):
+    """
+    Immutable series of one quantity, stored as a contiguous 1-D float64
+    array of SI values (read-only); a scalar becomes a series of one,
+    anything with more than one dimension is rejected (ValueError).
+    Conversions are one vectorized multiply/divide; per-sample units go
+    through the factor table (see from_mixed).
+
+    from_pa()/from_meters() copy by default. With copy=False a float64
+    buffer is wrapped as-is: no copy, but later writes to it through the
+    caller's own reference show up in the series.
+    """
+    __slots__ = ("_si", "_units")
+
+    _factors: Dict[Any, float]      # unit -> SI per unit
+    _table: np.ndarray              # factors in unit_code order
+    _codes: Dict[Any, int]
+
+    def __init__(self, values: Any, unit: Any, units: Optional[UnitsContext] = None) -> None:
+        si = _series(np.multiply(np.atleast_1d(values), self._factors[unit], dtype=np.float64))
+        si.flags.writeable = False
+        self._si = si
+        self._units = units or UNITS
+
+    @classmethod
+    def _from_si(cls: Type[A], si: Any, units: Optional[UnitsContext], copy: bool) -> A:
+        # both paths return at least 1-D (ascontiguousarray does by definition)
+        arr = np.array(si, dtype=np.float64, copy=True, ndmin=1) if copy else np.ascontiguousarray(si, dtype=np.float64)
+        _series(arr)
+        if arr.flags.writeable:
+            arr = arr.view()
+            arr.flags.writeable = False
+        self = cls.__new__(cls)
+        self._si = arr
+        self._units = units or UNITS
+        return self
+
+    @classmethod
+    def unit_code(cls, unit: Any) -> int:
+        """Index of `unit` in the factor table, for from_mixed()."""
+        return cls._codes[unit]
+
+    @classmethod
+    def from_mixed(cls: Type[A], values: Any, codes: Any, units: Optional[UnitsContext] = None) -> A:
+        """values[i] is in the unit with code codes[i] (e.g. gauges set to different units)."""
+        return cls._from_si(np.multiply(values, cls._table[np.asarray(codes)], dtype=np.float64), units, copy=False)
+
+    @classmethod
+    def concatenate(cls: Type[A], parts: Iterable[A], units: Optional[UnitsContext] = None) -> A:
+        parts = list(parts)
+        ctx = units or (parts[0]._units if parts else None)
+        if not parts:
+            return cls._from_si(np.empty(0), ctx, copy=False)
+        return cls._from_si(np.concatenate([p._si for p in parts]), ctx, copy=False)
+
+    # ---- SI access (writers, numerics) ----
+    @property
+    def si(self) -> np.ndarray:
+        return self._si
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        if dtype is None or np.dtype(dtype) == self._si.dtype:
+            return self._si.copy() if copy else self._si
+        return self._si.astype(dtype)
+
+    # ---- display (plots) ----
+    @abstractmethod
+    def _display_unit(self) -> Tuple[float, str]:
+        """(SI per display unit, label) from the units context."""
+
+    @property
+    def values(self) -> np.ndarray:
+        """Values in the current display unit (new array)."""
+        return self._si / self._display_unit()[0]
+
+    @property
+    def unit(self) -> str:
+        return self._display_unit()[1]
+
+    def display(self) -> Tuple[np.ndarray, str]:
+        factor, label = self._display_unit()
+        return self._si / factor, label
+
+    def as_unit(self, unit: Any) -> np.ndarray:
+        return self._si / self._factors[unit]
+
+    # ---- sequence ----
+    def __len__(self) -> int:
+        return self._si.shape[0]
+
+    @abstractmethod
+    def _scalar(self, si: float) -> Any:
+        """One sample as the scalar quantity (Pressure, Length)."""
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+    @overload
+    def __getitem__(self: A, index: Union[slice, np.ndarray]) -> A: ...
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, (int, np.integer)):
+            return self._scalar(float(self._si[index]))
+        return type(self)._from_si(self._si[index], self._units, copy=False)
+
+    def __iter__(self) -> Any:
+        scalar = self._scalar
+        return (scalar(v) for v in self._si.tolist())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(n={len(self)})"
+
+
+def _series(arr: np.ndarray) -> np.ndarray:
+    if arr.ndim != 1:
+        raise ValueError(f"quantity arrays are 1-D, got shape {arr.shape}")
+    return arr
+
+
+def _factor_table(enum: Type[Enum], factors: Dict[Any, float]) -> Tuple[np.ndarray, Dict[Any, int]]:
+    members = list(enum)
+    return np.array([factors[m] for m in members], dtype=np.float64), {m: i for i, m in enumerate(members)}
+
+
+class PressureArray(_QuantityArray):
+    """Pressure series in Pa."""
+    __slots__ = ()
+    _factors = PA_PER_UNIT
+    _table, _codes = _factor_table(PressureUnit, PA_PER_UNIT)
+
+    def __init__(self, values: Any, unit: PressureUnit = PressureUnit.PA,
+                 units: Optional[UnitsContext] = None) -> None:
+        super().__init__(values, unit, units)
+
+    @classmethod
+    def from_pa(cls, pa: Any, units: Optional[UnitsContext] = None, copy: bool = True) -> "PressureArray":
+        return cls._from_si(pa, units, copy)
+
+    @classmethod
+    def from_quantities(cls, items: Iterable[Pressure], units: Optional[UnitsContext] = None) -> "PressureArray":
+        return cls._from_si(np.fromiter((p.pa() for p in items), dtype=np.float64), units, copy=False)
+
+    @property
+    def pa(self) -> np.ndarray:
+        return self._si
+
+    def _display_unit(self) -> Tuple[float, str]:
+        _, factor, label = self._units.pressure
+        return factor, label
+
+    def _scalar(self, si: float) -> Pressure:
+        return Pressure.from_pa(si, self._units)
+
+
+class LengthArray(_QuantityArray):
+    """Length series in m (e.g. stage trajectories)."""
+    __slots__ = ()
+    _factors = M_PER_UNIT
+    _table, _codes = _factor_table(LengthSystem, M_PER_UNIT)
+
+    def __init__(self, values: Any, system: LengthSystem = LengthSystem.METRIC,
+                 units: Optional[UnitsContext] = None) -> None:
+        super().__init__(values, system, units)
+
+    @classmethod
+    def from_meters(cls, meters: Any, units: Optional[UnitsContext] = None, copy: bool = True) -> "LengthArray":
+        return cls._from_si(meters, units, copy)
+
+    @classmethod
+    def from_quantities(cls, items: Iterable[Length], units: Optional[UnitsContext] = None) -> "LengthArray":
+        return cls._from_si(np.fromiter((l.meters() for l in items), dtype=np.float64), units, copy=False)
+
+    @property
+    def meters(self) -> np.ndarray:
+        return self._si
+
+    def _display_unit(self) -> Tuple[float, str]:
+        _, factor, label = self._units.length
+        return factor, label
+
+    def _scalar(self, si: float) -> Length:
+        return Length.from_meters(si, self._units)
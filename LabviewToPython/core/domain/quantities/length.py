@@ -1,63 +1,71 @@
-# -------------------------------
-# Length (intern immer in m)
-# -------------------------------
-from typing import Optional
+from __future__ import annotations
+from typing import Any, Optional
 
-from LabviewToPython.modules.menu.menu_services.units_service import UnitsService
+from LabviewToPython.core.domain.enums.units.length_system import LengthSystem
+from LabviewToPython.core.domain.quantities.units_context import LENGTH_LABELS, M_PER_UNIT, UNITS, UnitsContext
 
 
-@dataclass(frozen=True)
+# -------------------------------
+# Length (intern immer in m)
+# -------------------------------
 class Length:
-    _m: float
-    _provider: Optional[UnitsService] = None
+    """Immutable length in m, displayed in the length system of its UnitsContext."""
+    __slots__ = ("_m", "_units")
 
-    def __init__(self, value: float, system: LengthSystem, provider: Optional[UnitsProvider] = None) -> None:
+    def __init__(self, value: float, system: LengthSystem = LengthSystem.METRIC,
+                 units: Optional[UnitsContext] = None) -> None:
         # interpret value gemäß übergebenem System (metric:=m, imperial:=inch)
-        object.__setattr__(self, "_m", display_to_meters(value, system))
-        object.__setattr__(self, "_provider", provider)
+        self._m = value * M_PER_UNIT[system]
+        self._units = units or UNITS
 
     @classmethod
-    def from_meters(cls, meters: float, provider: Optional[UnitsProvider] = None) -> "Length":
-        return cls.__new_with_state(meters, provider)
+    def from_meters(cls, meters: float, units: Optional[UnitsContext] = None) -> "Length":
+        self = cls.__new__(cls)
+        self._m = meters
+        self._units = units or UNITS
+        return self
 
     # value in aktuell eingestelltem System (m oder in)
     @property
     def value(self) -> float:
-        sys = self._display_length_system()
-        v, _ = meters_to_display(self._m, sys)
-        return v
+        return self._m / self._units.length[1]
 
     @property
     def unit(self) -> str:
-        sys = self._display_length_system()
-        return "m" if sys == LengthSystem.METRIC else "in"
- 
+        return self._units.length[2]
+
+    def display(self) -> tuple[float, str]:
+        _, factor, label = self._units.length
+        return self._m / factor, label
+
     # explizit in Meter oder in gewünschtes System
     def meters(self) -> float:
         return self._m
 
     def as_system(self, system: LengthSystem) -> float:
-        v, _ = meters_to_display(self._m, system)
-        return v
+        return self._m / M_PER_UNIT[system]
 
     def __add__(self, other: "Length") -> "Length":
-        return Length.from_meters(self._m + other._m, self._provider or other._provider)
+        return Length.from_meters(self._m + other._m, self._units)
 
     def __sub__(self, other: "Length") -> "Length":
-        return Length.from_meters(self._m - other._m, self._provider or other._provider)
+        return Length.from_meters(self._m - other._m, self._units)
 
-    @classmethod
-    def __new_with_state(cls, meters: float, provider: Optional[UnitsProvider]) -> "Length":
-        self = object.__new__(cls)
-        object.__setattr__(self, "_m", meters)
-        object.__setattr__(self, "_provider", provider)
-        return self
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Length) and self._m == other._m
+
+    def __lt__(self, other: "Length") -> bool:
+        return self._m < other._m
+
+    def __hash__(self) -> int:
+        return hash(self._m)
+
+    def __repr__(self) -> str:
+        return f"Length({self._m!r} m)"
+
+
+def meters_to_display(meters: float, system: LengthSystem) -> tuple[float, str]:
+    return meters / M_PER_UNIT[system], LENGTH_LABELS[system]
 
-    def _display_length_system(self) -> LengthSystem:
-        if self._provider is not None:
-            return self._provider.length_system()
-        val = QSettings().value("units/length_system", LengthSystem.METRIC.value)
-        try:
-            return LengthSystem(str(val))
-        except Exception:
-            return LengthSystem.METRIC
+def display_to_meters(value: float, system: LengthSystem) -> float:
+    return value * M_PER_UNIT[system]
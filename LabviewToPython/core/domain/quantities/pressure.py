@@ -1,56 +1,75 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Optional, cast
+from typing import Any, Optional
 
-from LabviewToPython.core.enums.pressure_unit import PressureUnit
-from LabviewToPython.core.di.container import Container
-from LabviewToPython.modules.menu.menu_services.units_service import UnitsService
+from LabviewToPython.core.domain.enums.units.pressure_unit import PressureUnit
+from LabviewToPython.core.domain.quantities.units_context import PA_PER_UNIT, UNITS, UnitsContext
 
 # ---- pressure helpers ----
-PA_PER_BAR = 1.0e5
-PA_PER_TORR = 133.322368
-PA_PER_PSI = 6894.757293
-PA_PER_INHG = 3386.389
+PA_PER_BAR = PA_PER_UNIT[PressureUnit.BAR]
+PA_PER_TORR = PA_PER_UNIT[PressureUnit.TORR]
+PA_PER_PSI = PA_PER_UNIT[PressureUnit.PSI]
+PA_PER_INHG = PA_PER_UNIT[PressureUnit.INHG]
 
 
 # -------------------------------
 # Pressure (intern immer in Pa)
 # -------------------------------
-@dataclass(frozen=True)
 class Pressure:
-    _pa: float
-    _provider: UnitsService
+    """
+    Immutable pressure value. Stores Pa plus the UnitsContext it is displayed
+    in; value/unit follow that context, so nothing is looked up per instance
+    and construction is two slot stores (cheap enough per gauge sample).
+    """
+    __slots__ = ("_pa", "_units")
 
-    def __init__(self, value: float, unit: PressureUnit, provider: UnitsService) -> None:
-        object.__setattr__(self, "_pa", unit_to_pa(value, unit))
-        provider = Container.try_get(UnitsService)
-        object.__setattr__(self, "_provider", provider)
+    def __init__(self, value: float, unit: PressureUnit = PressureUnit.PA,
+                 units: Optional[UnitsContext] = None) -> None:
+        self._pa = value * PA_PER_UNIT[unit]
+        self._units = units or UNITS
+
+    @classmethod
+    def from_pa(cls, pa: float, units: Optional[UnitsContext] = None) -> "Pressure":
+        self = cls.__new__(cls)
+        self._pa = pa
+        self._units = units or UNITS
+        return self
 
     # value in aktuell eingestellter Einheit
     @property
     def value(self) -> float:
-        u = self._provider.pressure_unit()
-        v, _ = pa_to_unit(self._pa, u)
-        return v
+        return self._pa / self._units.pressure[1]
 
     # Einheit als String (z. B. "bar")
     @property
     def unit(self) -> str:
-        return self._provider.pressure_unit()
+        return self._units.pressure[2]
+
+    def display(self) -> tuple[float, str]:
+        """(value, label) from one read of the context."""
+        _, factor, label = self._units.pressure
+        return self._pa / factor, label
+
+    def pa(self) -> float:
+        return self._pa
+
+    def as_unit(self, unit: PressureUnit) -> float:
+        return self._pa / PA_PER_UNIT[unit]
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Pressure) and self._pa == other._pa
+
+    def __lt__(self, other: "Pressure") -> bool:
+        return self._pa < other._pa
+
+    def __hash__(self) -> int:
+        return hash(self._pa)
+
+    def __repr__(self) -> str:
+        return f"Pressure({self._pa!r} Pa)"
 
 
 def pa_to_unit(value_pa: float, unit: PressureUnit) -> tuple[float, str]:
-    if unit == PressureUnit.PA:   return value_pa, "Pa"
-    if unit == PressureUnit.BAR:  return value_pa / PA_PER_BAR, "bar"
-    if unit == PressureUnit.TORR: return value_pa / PA_PER_TORR, "Torr"
-    if unit == PressureUnit.PSI:  return value_pa / PA_PER_PSI, "psi"
-    if unit == PressureUnit.INHG: return value_pa / PA_PER_INHG, "inHg"
-    return value_pa, "Pa"
+    return value_pa / PA_PER_UNIT[unit], PressureUnit(unit).value
 
 def unit_to_pa(value: float, unit: PressureUnit) -> float:
-    if unit == PressureUnit.PA:   return value
-    if unit == PressureUnit.BAR:  return value * PA_PER_BAR
-    if unit == PressureUnit.TORR: return value * PA_PER_TORR
-    if unit == PressureUnit.PSI:  return value * PA_PER_PSI
-    if unit == PressureUnit.INHG: return value * PA_PER_INHG
-    return value
+    return value * PA_PER_UNIT[unit]
@@ -0,0 +1,112 @@
+from __future__ import annotations
+import threading
+from typing import Callable, Dict, List, Tuple
+
+from LabviewToPython.core.domain.enums.units.length_system import LengthSystem
+from LabviewToPython.core.domain.enums.units.pressure_unit import PressureUnit
+
+# ---- factor tables (SI base unit per display unit) ----
+PA_PER_UNIT: Dict[PressureUnit, float] = {
+    PressureUnit.PA:   1.0,
+    PressureUnit.BAR:  1.0e5,
+    PressureUnit.TORR: 133.322368,
+    PressureUnit.PSI:  6894.757293,
+    PressureUnit.INHG: 3386.389,
+}
+M_PER_UNIT: Dict[LengthSystem, float] = {
+    LengthSystem.METRIC:   1.0,
+    LengthSystem.IMPERIAL: 0.0254,   # inches
+}
+LENGTH_LABELS: Dict[LengthSystem, str] = {
+    LengthSystem.METRIC:   "m",
+    LengthSystem.IMPERIAL: "in",
+}
+
+UnitsListener = Callable[["UnitsContext"], None]
+
+
+class UnitsContext:
+    """
+    Current display units, shared by all quantities.
+
+    Reads are plain attribute loads: each setting is stored as one
+    (enum, factor, label) tuple that a setter replaces as a whole, so a
+    reader never sees a unit with the factor of another. Listeners are called
+    on the thread that changed the setting, only on an actual change.
+    """
+    def __init__(
+        self,
+        pressure_unit: PressureUnit = PressureUnit.BAR,
+        length_system: LengthSystem = LengthSystem.METRIC,
+    ) -> None:
+        self._pressure: Tuple[PressureUnit, float, str] = _pressure_entry(pressure_unit)
+        self._length: Tuple[LengthSystem, float, str] = _length_entry(length_system)
+        self._listeners: Tuple[UnitsListener, ...] = ()
+        self._lock = threading.Lock()
+
+    # ---- pressure ----
+    @property
+    def pressure_unit(self) -> PressureUnit:
+        return self._pressure[0]
+
+    @property
+    def pressure(self) -> Tuple[PressureUnit, float, str]:
+        """(unit, Pa per unit, label) in one consistent read."""
+        return self._pressure
+
+    def set_pressure_unit(self, unit: PressureUnit) -> None:
+        unit = PressureUnit(unit)
+        with self._lock:
+            if unit == self._pressure[0]:
+                return
+            self._pressure = _pressure_entry(unit)
+        self._notify()
+
+    # ---- length ----
+    @property
+    def length_system(self) -> LengthSystem:
+        return self._length[0]
+
+    @property
+    def length(self) -> Tuple[LengthSystem, float, str]:
+        """(system, m per unit, label) in one consistent read."""
+        return self._length
+
+    def set_length_system(self, system: LengthSystem) -> None:
+        system = LengthSystem(system)
+        with self._lock:
+            if system == self._length[0]:
+                return
+            self._length = _length_entry(system)
+        self._notify()
+
+    # ---- change notification ----
+    def subscribe(self, listener: UnitsListener) -> None:
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners = self._listeners + (listener,)
+
+    def unsubscribe(self, listener: UnitsListener) -> None:
+        with self._lock:
+            self._listeners = tuple(l for l in self._listeners if l != listener)
+
+    def _notify(self) -> None:
+        errors: List[BaseException] = []
+        for listener in self._listeners:
+            try:
+                listener(self)
+            except Exception as e:   # one broken listener must not starve the others
+                errors.append(e)
+        if errors:
+            raise errors[0]
+
+
+def _pressure_entry(unit: PressureUnit) -> Tuple[PressureUnit, float, str]:
+    return unit, PA_PER_UNIT[unit], unit.value
+
+def _length_entry(system: LengthSystem) -> Tuple[LengthSystem, float, str]:
+    return system, M_PER_UNIT[system], LENGTH_LABELS[system]
+
+
+# Process-wide context; UnitsService loads the saved settings into it once.
+UNITS = UnitsContext()
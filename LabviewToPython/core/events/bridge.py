@@ -0,0 +1,477 @@
+from __future__ import annotations
+import json
+import os
+import pickle
+import socket
+import struct
+import sys
+import tempfile
+import threading
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from LabviewToPython.core.abstractions.i_eventbus import IEventBus
+from LabviewToPython.core.events.topics import topic_spec
+
+# Wire messages (one Connection.send_bytes frame each, little endian):
+#   EVENT    u8 | u16 topic_len | topic | EventCodec body
+#   PICKLE   u8 | u16 topic_len | topic | u32 n_buffers | u64 len + pickle | buffer*
+#              buffer: u8 0 | u64 len | bytes                    (inline)
+#                      u8 1 | u16 name_len | name | u64 nbytes   (shared memory block)
+#   RELEASE  u8 | name                                           (receiver is done with a block)
+#   HELLO    u8 | JSON {"export": [...]}
+MSG_EVENT, MSG_PICKLE, MSG_RELEASE, MSG_HELLO = 0, 1, 2, 3
+
+AUTHKEY_ENV = "LABAPP_BUS_AUTHKEY"   # hex session key, set by BridgeServer.child_env()
+SHM_THRESHOLD = 64 * 1024       # buffers at least this large go through shared memory
+SHM_MAX_IN_FLIGHT = 32          # blocks the peer may hold before falling back to inline
+
+_HEAD = struct.Struct("<BH")
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+
+def default_address(name: str = "labapp-bus") -> str:
+    """Named pipe on Windows, elsewhere a Unix socket in the user's own runtime dir."""
+    if sys.platform == "win32":
+        return rf"\\.\pipe\{name}"
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime:
+        runtime = os.path.join(tempfile.gettempdir(), f"labapp-{os.getuid()}")
+        os.makedirs(runtime, mode=0o700, exist_ok=True)
+    return os.path.join(runtime, f"{name}.sock")
+
+
+def _remove_stale_socket(address: Any) -> None:
+    """Unlink a Unix socket left behind by a crashed server; a live one is left alone."""
+    if sys.platform == "win32" or not isinstance(address, str) or not os.path.exists(address):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(address)
+    except (ConnectionRefusedError, FileNotFoundError):
+        try:
+            os.unlink(address)
+        except FileNotFoundError:
+            pass
+    except OSError:
+        pass
+    finally:
+        probe.close()
+
+
+def session_authkey() -> bytes:
+    """
+    Key of the bridge session this process belongs to: the one its parent
+    passed in AUTHKEY_ENV. Messages are unpickled, so there is no fixed
+    default; a process without a session key has to be given one.
+    """
+    key = os.environ.get(AUTHKEY_ENV)
+    if not key:
+        raise RuntimeError(f"no bridge authkey: pass authkey= or set {AUTHKEY_ENV} (BridgeServer.child_env())")
+    return bytes.fromhex(key)
+
+
+@dataclass
+class BridgeStats:
+    sent: int = 0
+    received: int = 0
+    bytes_sent: int = 0
+    shm_sent: int = 0           # buffers passed through shared memory
+    shm_bytes: int = 0
+    inline_fallback: int = 0    # large buffers sent inline because every block was in flight
+    dropped: int = 0            # send queue full
+    errors: int = 0             # messages that could not be encoded / decoded / published
+    queued: int = 0
+
+
+class _ShmPool:
+    """Sender-side blocks, reused by power-of-two size class once the peer releases them."""
+    def __init__(self, max_in_flight: int) -> None:
+        self._free: Dict[int, List[shared_memory.SharedMemory]] = {}
+        self._busy: Dict[str, shared_memory.SharedMemory] = {}
+        self._lock = threading.Lock()
+        self._max_in_flight = max_in_flight
+
+    def acquire(self, nbytes: int) -> Optional[shared_memory.SharedMemory]:
+        size = 1 << max(12, (nbytes - 1).bit_length())
+        with self._lock:
+            if len(self._busy) >= self._max_in_flight:
+                return None
+            free = self._free.get(size)
+            shm = free.pop() if free else shared_memory.SharedMemory(create=True, size=size)
+            self._busy[shm.name] = shm
+            return shm
+
+    def release(self, name: str) -> None:
+        with self._lock:
+            shm = self._busy.pop(name, None)
+            if shm is not None:
+                self._free.setdefault(shm.size, []).append(shm)
+
+    def close(self) -> None:
+        with self._lock:
+            blocks = list(self._busy.values()) + [s for lst in self._free.values() for s in lst]
+            self._busy.clear()
+            self._free.clear()
+        for shm in blocks:
+            try:
+                shm.close()
+            except BufferError:
+                pass   # a view is still exported; the mapping goes with the process
+            finally:
+                try:
+                    shm.unlink()
+                except FileNotFoundError:
+                    pass
+
+
+def _attach_shm(name: str) -> shared_memory.SharedMemory:
+    # Python >= 3.13: the sender owns the block, keep our resource tracker out of it
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+class BusBridge:
+    """
+    Mirrors topics between the buses of two local processes over one Connection.
+
+    Topics (or patterns) in `export` are sent to the peer under the topic
+    they were published on; everything the peer sends is published on the
+    local bus, so modules on either side keep using plain IEventBus
+    subscribe/publish. Local handlers only append to a bounded
+    send queue (the oldest message is dropped when it is full), a sender
+    thread encodes and writes. Registered event types use their compact
+    codec; other payloads are pickled, and their large buffers (frames,
+    NumPy arrays) are copied once into shared memory instead of through
+    the socket. A message received from the peer is not sent back on the
+    same topic (handlers may still publish derived topics that are exported).
+    """
+    def __init__(
+        self,
+        bus: IEventBus,
+        conn: Connection,
+        export: Iterable[str] = (),
+        max_queue: int = 1024,
+        shm_threshold: int = SHM_THRESHOLD,
+    ) -> None:
+        self._bus = bus
+        self._conn = conn
+        self._export = list(export)
+        self._max_queue = max(1, int(max_queue))
+        self._shm_threshold = shm_threshold
+
+        self._pool = _ShmPool(SHM_MAX_IN_FLIGHT)
+        self._attached: Dict[str, shared_memory.SharedMemory] = {}
+        self._queue: Deque[Tuple[str, Any]] = deque()
+        self._cond = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._inbound = threading.local()
+        self._handlers: List[Tuple[str, Callable[[str, Any], None]]] = []
+        self._threads: List[threading.Thread] = []
+        self._running = False
+        self._stats = BridgeStats()
+        self.peer_export: List[str] = []
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._send(_U8.pack(MSG_HELLO) + json.dumps({"export": self._export}).encode("utf-8"))
+        for target, name in ((self._sender, "bus-bridge-send"), (self._receiver, "bus-bridge-recv")):
+            t = threading.Thread(target=target, name=name, daemon=True)
+            t.start()
+            self._threads.append(t)
+        handler = self._make_handler()
+        for topic in self._export:
+            self._bus.subscribe(topic, handler, with_topic=True)
+            self._handlers.append((topic, handler))
+
+    def stop(self) -> None:
+        for topic, handler in self._handlers:
+            self._bus.unsubscribe(topic, handler)
+        self._handlers.clear()
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        try:
+            self._conn.close()
+        except OSError:
+            pass
+        for t in self._threads:
+            if t is not threading.current_thread():
+                t.join(2.0)
+        self._threads.clear()
+        self._pool.close()
+        for shm in self._attached.values():
+            try:
+                shm.close()
+            except BufferError:
+                pass
+        self._attached.clear()
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def stats(self) -> BridgeStats:
+        with self._cond:
+            s = BridgeStats(**vars(self._stats))
+            s.queued = len(self._queue)
+        return s
+
+    # ---- local bus -> peer ----
+    def _make_handler(self) -> Callable[[str, Any], None]:
+        def on_event(topic: str, payload: Any) -> None:
+            # topic is the published one, also for pattern exports ('pressure/*')
+            if getattr(self._inbound, "topic", None) == topic:
+                return  # came from the peer: don't echo it back
+            with self._cond:
+                if len(self._queue) >= self._max_queue:
+                    self._queue.popleft()
+                    self._stats.dropped += 1
+                self._queue.append((topic, payload))
+                if len(self._queue) == 1:
+                    self._cond.notify()
+        return on_event
+
+    def _sender(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._queue:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                batch = list(self._queue)
+                self._queue.clear()
+            for topic, payload in batch:
+                try:
+                    n = self._send(self._encode(topic, payload))
+                except (OSError, EOFError):
+                    self._closed()
+                    return
+                except Exception:
+                    with self._cond:
+                        self._stats.errors += 1
+                    continue
+                with self._cond:
+                    self._stats.sent += 1
+                    self._stats.bytes_sent += n
+
+    def _encode(self, topic: str, payload: Any) -> bytes:
+        name = topic.encode("utf-8")
+        spec = topic_spec(topic)
+        if spec is not None and spec.codec is not None and isinstance(payload, spec.event_type):
+            return _HEAD.pack(MSG_EVENT, len(name)) + name + spec.codec.encode(payload)
+
+        buffers: List[pickle.PickleBuffer] = []
+        data = pickle.dumps(payload, protocol=5, buffer_callback=buffers.append)
+        parts = [_HEAD.pack(MSG_PICKLE, len(name)), name, _U32.pack(len(buffers)), _U64.pack(len(data)), data]
+        for b in buffers:
+            raw = b.raw()
+            shm = self._pool.acquire(raw.nbytes) if raw.nbytes >= self._shm_threshold else None
+            if shm is None:
+                if raw.nbytes >= self._shm_threshold:
+                    self._stats.inline_fallback += 1
+                parts += [_U8.pack(0), _U64.pack(raw.nbytes), raw]
+                continue
+            shm.buf[:raw.nbytes] = raw
+            shm_name = shm.name.encode("utf-8")
+            parts += [_U8.pack(1), _U16.pack(len(shm_name)), shm_name, _U64.pack(raw.nbytes)]
+            self._stats.shm_sent += 1
+            self._stats.shm_bytes += raw.nbytes
+        return b"".join(parts)
+
+    def _send(self, msg: bytes) -> int:
+        with self._send_lock:
+            self._conn.send_bytes(msg)
+        return len(msg)
+
+    # ---- peer -> local bus ----
+    def _receiver(self) -> None:
+        while self._running:
+            try:
+                msg = self._conn.recv_bytes()
+            except (OSError, EOFError):
+                self._closed()
+                return
+            try:
+                self._dispatch(memoryview(msg))
+            except (OSError, EOFError):
+                self._closed()
+                return
+            except Exception:
+                with self._cond:
+                    self._stats.errors += 1
+
+    def _dispatch(self, msg: memoryview) -> None:
+        kind = msg[0]
+        if kind == MSG_RELEASE:
+            self._pool.release(bytes(msg[1:]).decode("utf-8"))
+            return
+        if kind == MSG_HELLO:
+            self.peer_export = json.loads(bytes(msg[1:]).decode("utf-8")).get("export", [])
+            return
+
+        _, n = _HEAD.unpack_from(msg, 0)
+        pos = _HEAD.size
+        topic = bytes(msg[pos:pos + n]).decode("utf-8")
+        pos += n
+        if kind == MSG_EVENT:
+            spec = topic_spec(topic)
+            if spec is None or spec.codec is None:
+                raise KeyError(f"topic {topic!r} is not registered on this side")
+            payload = spec.codec.decode(msg, pos)
+        else:
+            payload = self._decode_pickle(msg, pos)
+
+        with self._cond:
+            self._stats.received += 1
+        self._inbound.topic = topic
+        try:
+            self._bus.publish(topic, payload)
+        finally:
+            self._inbound.topic = None
+
+    def _decode_pickle(self, msg: memoryview, pos: int) -> Any:
+        (count,) = _U32.unpack_from(msg, pos)
+        (size,) = _U64.unpack_from(msg, pos + _U32.size)
+        pos += _U32.size + _U64.size
+        data = msg[pos:pos + size]
+        pos += size
+        buffers: List[Any] = []
+        for _ in range(count):
+            where = msg[pos]
+            pos += 1
+            if where == 0:
+                (size,) = _U64.unpack_from(msg, pos)
+                pos += _U64.size
+                buffers.append(msg[pos:pos + size])
+                pos += size
+            else:
+                (n,) = _U16.unpack_from(msg, pos)
+                pos += _U16.size
+                name = bytes(msg[pos:pos + n]).decode("utf-8")
+                pos += n
+                (size,) = _U64.unpack_from(msg, pos)
+                pos += _U64.size
+                shm = self._attached.get(name)
+                if shm is None:
+                    shm = self._attached[name] = _attach_shm(name)
+                # own copy, so the block can go straight back to the sender
+                buffers.append(bytearray(shm.buf[:size]))
+                self._send(_U8.pack(MSG_RELEASE) + name.encode("utf-8"))
+        return pickle.loads(data, buffers=buffers)
+
+    def _closed(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+
+class BridgeServer:
+    """
+    Accepts bridge connections from other processes; one BusBridge per client.
+
+    Without an explicit authkey a random one is generated per server; start
+    child processes with env=child_env() so their connect_bridge() finds it.
+    """
+    def __init__(
+        self,
+        bus: IEventBus,
+        address: Optional[str] = None,
+        export: Iterable[str] = (),
+        authkey: Optional[bytes] = None,
+        **bridge_options: Any,
+    ) -> None:
+        self._bus = bus
+        self._export = list(export)
+        self._options = bridge_options
+        self._authkey = authkey if authkey is not None else os.urandom(32)
+        address = address or default_address()
+        _remove_stale_socket(address)
+        self._listener = Listener(address, authkey=self._authkey)
+        self._bridges: List[BusBridge] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    @property
+    def address(self) -> Any:
+        return self._listener.address
+
+    @property
+    def authkey(self) -> bytes:
+        return self._authkey
+
+    def child_env(self, base: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Environment for a child process (subprocess / QProcess) that connects back."""
+        env = dict(os.environ if base is None else base)
+        env[AUTHKEY_ENV] = self._authkey.hex()
+        return env
+
+    @property
+    def bridges(self) -> List[BusBridge]:
+        with self._lock:
+            self._bridges = [b for b in self._bridges if b.running]
+            return list(self._bridges)
+
+    def start(self) -> None:
+        self._running = True
+        self._thread = threading.Thread(target=self._accept, name="bus-bridge-accept", daemon=True)
+        self._thread.start()
+
+    def _accept(self) -> None:
+        while self._running:
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError):
+                if not self._running:
+                    return
+                continue  # failed handshake (wrong authkey, ...)
+            bridge = BusBridge(self._bus, conn, self._export, **self._options)
+            bridge.start()
+            with self._lock:
+                self._bridges.append(bridge)
+
+    def stop(self) -> None:
+        self._running = False
+        try:
+            self._listener.close()
+        except OSError:
+            pass
+        # unblock accept() on platforms where close() does not
+        try:
+            Client(self._listener.address, authkey=b"").close()
+        except Exception:
+            pass
+        if self._thread is not None:
+            self._thread.join(2.0)
+            self._thread = None
+        with self._lock:
+            bridges, self._bridges = self._bridges, []
+        for b in bridges:
+            b.stop()
+
+
+def connect_bridge(
+    bus: IEventBus,
+    address: Optional[str] = None,
+    export: Iterable[str] = (),
+    authkey: Optional[bytes] = None,
+    **bridge_options: Any,
+) -> BusBridge:
+    """Client side: connect to a BridgeServer and start mirroring (authkey defaults to session_authkey())."""
+    if authkey is None:
+        authkey = session_authkey()
+    bridge = BusBridge(bus, Client(address or default_address(), authkey=authkey), export, **bridge_options)
+    bridge.start()
+    return bridge
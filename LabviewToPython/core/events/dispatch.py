@@ -0,0 +1,214 @@
+from __future__ import annotations
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Deque, Optional, Tuple
+
+from LabviewToPython.core.domain.enums.dispatch_mode import DispatchMode
+
+if TYPE_CHECKING:
+    from LabviewToPython.core.events.instrumentation import BusInstrumentation
+
+Handler = Callable[[Any], None]
+
+
+@dataclass
+class SubscriberStats:
+    topic: str
+    handler: str
+    mode: str
+    delivered: int = 0      # handler calls (queued modes; SYNC calls are not counted)
+    coalesced: int = 0      # payloads replaced by a newer one before delivery (latest only)
+    dropped: int = 0        # payloads discarded because the queue was full
+    errors: int = 0         # handler exceptions (swallowed)
+    depth: int = 0          # payloads waiting
+    max_depth: int = 0      # high-water mark
+    lag_s: float = 0.0      # publish -> handler start, last delivery
+    max_lag_s: float = 0.0
+
+
+class Subscription:
+    """
+    One handler on one topic.
+
+    SYNC calls the handler on the publishing thread. THREAD and QT put
+    (topic, payload) into the subscription's own bounded queue and drain it
+    in order on its executor, so a slow handler only delays itself. With
+    latest_only, an undelivered payload is replaced by the next one of the
+    same topic instead of queueing behind it.
+
+    with_topic: the handler is called as handler(topic, payload) with the
+    concrete published topic, which matters for pattern subscriptions
+    (recorders, bridges). Ordinary handlers only get the payload.
+    """
+    def __init__(
+        self,
+        topic: str,
+        handler: Handler,
+        mode: DispatchMode = DispatchMode.SYNC,
+        latest_only: Optional[bool] = None,
+        max_queue: int = 1024,
+        executor: Optional[Executor] = None,
+        thread: Any = None,
+        with_topic: bool = False,
+    ) -> None:
+        self.topic = topic
+        self.handler = handler
+        self.with_topic = with_topic
+        self.mode = DispatchMode(mode)
+        self.latest_only = latest_only      # None: follow the bus per-topic setting
+        self._max_queue = max(1, int(max_queue))
+
+        self._lock = Lock()
+        self._queue: Deque[Tuple[str, Any, float]] = deque()
+        self._latest: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._scheduled = False
+        self._closed = False
+        self.name = _handler_name(handler)
+        self._stats = SubscriberStats(topic, self.name, self.mode.value)
+        self.counters = self._stats   # live counters; EventBus updates them inline for SYNC
+        self.instrumentation: Optional[BusInstrumentation] = None   # set by EventBus.instrument()
+
+        self._owned_executor: Optional[Executor] = None
+        self._invoker: Any = None
+        if self.mode == DispatchMode.THREAD:
+            if executor is None:
+                executor = self._owned_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix=f"bus[{topic}]"
+                )
+            self._schedule: Callable[[Callable[[], None]], Any] = executor.submit
+        elif self.mode == DispatchMode.QT:
+            self._invoker = _qt_invoker(thread)
+            self._schedule = self._invoker.posted.emit
+
+    def matches(self, handler: Handler) -> bool:
+        return self.handler == handler or self is handler
+
+    # ---- delivery ----
+    def deliver(self, topic: str, payload: Any, coalesce: bool = False) -> None:
+        if self.mode == DispatchMode.SYNC:
+            self._call(topic, payload, 0.0)
+            return
+
+        latest_only = coalesce if self.latest_only is None else self.latest_only
+        now = time.perf_counter()
+        with self._lock:
+            if self._closed:
+                return
+            st = self._stats
+            if latest_only:
+                if topic in self._latest:
+                    st.coalesced += 1
+                self._latest[topic] = (payload, now)
+            else:
+                if len(self._queue) >= self._max_queue:
+                    self._queue.popleft()
+                    st.dropped += 1
+                self._queue.append((topic, payload, now))
+            st.max_depth = max(st.max_depth, len(self._queue) + len(self._latest))
+            if self._scheduled:
+                return
+            self._scheduled = True
+        try:
+            self._schedule(self._drain)
+        except RuntimeError:
+            # executor already shut down
+            with self._lock:
+                self._scheduled = False
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                if self._closed:
+                    self._scheduled = False
+                    return
+                if self._queue:
+                    topic, payload, t = self._queue.popleft()
+                elif self._latest:
+                    topic, (payload, t) = self._latest.popitem(last=False)
+                else:
+                    self._scheduled = False
+                    return
+            self._call(topic, payload, time.perf_counter() - t)
+
+    def _call(self, topic: str, payload: Any, lag: float) -> None:
+        instr = self.instrumentation
+        args = (topic, payload) if self.with_topic else (payload,)
+        if instr is None:
+            try:
+                self.handler(*args)
+            except Exception:
+                self._stats.errors += 1
+        else:
+            exc: Optional[Exception] = None
+            t0 = time.perf_counter()
+            try:
+                self.handler(*args)
+            except Exception as e:
+                exc = e
+                self._stats.errors += 1
+            instr.handled(topic, self.name, time.perf_counter() - t0, exc)
+        st = self._stats
+        st.delivered += 1
+        st.lag_s = lag
+        if lag > st.max_lag_s:
+            st.max_lag_s = lag
+
+    # ---- lifecycle / stats ----
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._queue.clear()
+            self._latest.clear()
+        if self._owned_executor is not None:
+            self._owned_executor.shutdown(wait=False)
+        self._invoker = None
+
+    @property
+    def stats(self) -> SubscriberStats:
+        with self._lock:
+            s = SubscriberStats(**vars(self._stats))
+            s.depth = len(self._queue) + len(self._latest)
+        return s
+
+
+def _handler_name(handler: Handler) -> str:
+    name = getattr(handler, "__qualname__", None) or type(handler).__qualname__
+    owner = getattr(handler, "__self__", None)
+    if owner is not None and "." not in name:
+        name = f"{type(owner).__qualname__}.{name}"
+    return name
+
+
+_Invoker: Any = None
+
+
+def _qt_invoker(thread: Any = None) -> Any:
+    """QObject living in `thread` (default: the application thread); posted.emit(fn) runs fn there."""
+    global _Invoker
+    from PySide6.QtCore import QCoreApplication, QObject, Signal, Slot
+
+    if _Invoker is None:
+        class _QtInvoker(QObject):
+            posted = Signal(object)
+
+            def __init__(self) -> None:
+                super().__init__()
+                self.posted.connect(self._run)
+
+            @Slot(object)
+            def _run(self, fn: Callable[[], None]) -> None:
+                fn()
+
+        _Invoker = _QtInvoker
+
+    inv = _Invoker()
+    if thread is None:
+        app = QCoreApplication.instance()
+        if app is None:
+            raise RuntimeError("DispatchMode.QT needs a QCoreApplication")
+        thread = app.thread()
+    inv.moveToThread(thread)
+    return inv
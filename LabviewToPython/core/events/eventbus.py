@@ -1,29 +1,208 @@
 from __future__ import annotations
-from typing import Callable, Any, DefaultDict, List
-from collections import defaultdict
+from concurrent.futures import Executor
+from typing import Callable, Any, Dict, FrozenSet, List, Optional, Tuple
 from threading import RLock
+import time
+
+from LabviewToPython.core.abstractions.i_eventbus import IEventBus
+from LabviewToPython.core.domain.enums.dispatch_mode import DispatchMode
+from LabviewToPython.core.events.dispatch import SubscriberStats, Subscription
+from LabviewToPython.core.events.instrumentation import BusInstrumentation
+from LabviewToPython.core.events.topics import check_payload
+
+# (SYNC handler(payload), SYNC handler(topic, payload), queued subs, coalesce)
+_Route = Tuple[Tuple[Subscription, ...], Tuple[Subscription, ...], Tuple[Subscription, ...], bool]
+
+WILDCARD = "*"   # matches exactly one topic level: 'pressure/*', '*/status'
+
+
+def is_pattern(topic: str) -> bool:
+    return WILDCARD in topic.split("/")
+
+
+def topic_matches(pattern: str, topic: str) -> bool:
+    p, t = pattern.split("/"), topic.split("/")
+    return len(p) == len(t) and all(a == WILDCARD or a == b for a, b in zip(p, t))
 
-from LabviewToPython.core.interfaces.i_eventbus import IEventBus
 
 class EventBus(IEventBus):
-    def __init__(self) -> None:
-        self._subs: DefaultDict[str, List[Callable[[Any], None]]] = defaultdict(list)
+    """
+    Topic -> handlers. subscribe(mode=...) decides where a handler runs:
+    SYNC on the publishing thread (default), THREAD / QT through the
+    subscriber's own queue, so a slow subscriber never stalls the device
+    thread that publishes. set_latest_only(topic) makes queued subscribers
+    of that topic keep only the newest payload. subscriber_stats() shows
+    queue depth and lag per subscriber.
+
+    Topics are '/'-separated; subscribe() and set_latest_only() also take
+    patterns where '*' stands for one level. The subscribers of a published
+    topic are resolved once and cached until the next (un)subscribe, so
+    publish costs O(matching subscribers), not O(patterns). Handlers only
+    see the payload; subscribe(with_topic=True) passes (topic, payload) so
+    a pattern subscriber knows which topic it got.
+
+    Copy-on-write: every container below is immutable once published and
+    is replaced (never mutated) under _lock. publish() therefore reads them
+    without a lock and without allocating; only writers serialize.
+
+    instrument() switches on BusInstrumentation (per-topic rates, handler
+    latency histograms, exception counts and tracebacks); until then the
+    only cost on publish is one attribute check.
+
+    validate=True checks payloads of topics registered in core/events/topics.py
+    against their event type and raises TypeError on the publishing side.
+    """
+    def __init__(self, validate: bool = False) -> None:
+        self._subs: Dict[str, Tuple[Subscription, ...]] = {}   # topic or pattern -> subs
+        self._latest_only: FrozenSet[str] = frozenset()
+        self._resolved: Dict[str, _Route] = {}   # topic -> (sync subs, queued subs, coalesce)
+        self._instr: Optional[BusInstrumentation] = None
+        self._validate = validate
         self._lock = RLock()
 
-    def subscribe(self, topic: str, handler: Callable[[Any], None]) -> None:
+    def subscribe(
+        self,
+        topic: str,
+        handler: Callable[[Any], None],
+        mode: DispatchMode = DispatchMode.SYNC,
+        latest_only: Optional[bool] = None,
+        max_queue: int = 1024,
+        executor: Optional[Executor] = None,
+        thread: Any = None,
+        with_topic: bool = False,
+    ) -> Subscription:
+        """
+        mode:        SYNC | THREAD (own worker thread, or `executor`) | QT (`thread`, default GUI)
+        latest_only: coalesce undelivered payloads; None follows set_latest_only(topic)
+        max_queue:   queued payloads kept per subscriber, the oldest are dropped beyond that
+        with_topic:  call handler(topic, payload) with the published topic (for patterns)
+        """
+        sub = Subscription(topic, handler, mode, latest_only, max_queue, executor, thread, with_topic)
+        sub.instrumentation = self._instr
         with self._lock:
-            self._subs[topic].append(handler)
+            subs = dict(self._subs)
+            subs[topic] = subs.get(topic, ()) + (sub,)
+            self._subs = subs
+            self._resolved = {}
+        return sub
 
     def unsubscribe(self, topic: str, handler: Callable[[Any], None]) -> None:
+        """handler may also be the Subscription returned by subscribe()."""
         with self._lock:
-            if handler in self._subs.get(topic, []):
-                self._subs[topic].remove(handler)
+            current = self._subs.get(topic, ())
+            gone = [s for s in current if s.matches(handler)]
+            if not gone:
+                return
+            subs = dict(self._subs)
+            keep = tuple(s for s in current if s not in gone)
+            if keep:
+                subs[topic] = keep
+            else:
+                del subs[topic]
+            self._subs = subs
+            self._resolved = {}
+        for s in gone:
+            s.close()
 
-    def publish(self, topic: str, payload: Any| None = None) -> None:
+    def set_latest_only(self, topic: str, enabled: bool = True) -> None:
+        """Per-topic (or pattern) coalescing for queued subscribers that did not choose latest_only themselves."""
         with self._lock:
-            handlers = list(self._subs.get(topic, []))
-        for h in handlers:
+            if enabled:
+                self._latest_only = self._latest_only | {topic}
+            else:
+                self._latest_only = self._latest_only - {topic}
+            self._resolved = {}
+
+    def publish(self, topic: str, payload: Any| None = None) -> None:
+        if self._validate:
+            check_payload(topic, payload)
+        # fast path: one dict lookup on an immutable snapshot, no lock
+        route = self._resolved.get(topic)
+        if route is None:
+            route = self._resolve_cached(topic)
+        sync, sync_topic, queued, coalesce = route
+        instr = self._instr
+        if instr is not None:
+            self._publish_instrumented(instr, topic, payload, sync + sync_topic)
+            sync = sync_topic = ()
+        # SYNC handlers inline: no extra call or counter update per subscriber
+        for s in sync:
             try:
-                h(payload)
+                s.handler(payload)
             except Exception:
-                pass
+                s.counters.errors += 1
+        for s in sync_topic:
+            try:
+                s.handler(topic, payload)
+            except Exception:
+                s.counters.errors += 1
+        for s in queued:
+            s.deliver(topic, payload, coalesce)
+
+    @staticmethod
+    def _publish_instrumented(
+        instr: BusInstrumentation, topic: str, payload: Any, sync: Tuple[Subscription, ...]
+    ) -> None:
+        instr.published(topic)
+        for s in sync:
+            exc: Optional[Exception] = None
+            t0 = time.perf_counter()
+            try:
+                if s.with_topic:
+                    s.handler(topic, payload)
+                else:
+                    s.handler(payload)
+            except Exception as e:
+                exc = e
+                s.counters.errors += 1
+            instr.handled(topic, s.name, time.perf_counter() - t0, exc)
+
+    def _resolve_cached(self, topic: str) -> _Route:
+        """First publish of a topic since the last change: resolve it and publish a new snapshot."""
+        with self._lock:
+            entry = self._resolved.get(topic)
+            if entry is None:
+                entry = self._resolve(topic)
+                self._resolved = {**self._resolved, topic: entry}
+            return entry
+
+    def _resolve(self, topic: str) -> _Route:
+        """Exact subscribers first, then pattern subscribers in subscription order."""
+        subs = list(self._subs.get(topic, ()))
+        for pattern, lst in self._subs.items():
+            if pattern != topic and is_pattern(pattern) and topic_matches(pattern, topic):
+                subs.extend(lst)
+        coalesce = any(p == topic or (is_pattern(p) and topic_matches(p, topic)) for p in self._latest_only)
+        sync = tuple(s for s in subs if s.mode == DispatchMode.SYNC and not s.with_topic)
+        sync_topic = tuple(s for s in subs if s.mode == DispatchMode.SYNC and s.with_topic)
+        queued = tuple(s for s in subs if s.mode != DispatchMode.SYNC)
+        return sync, sync_topic, queued, coalesce
+
+    # ---- diagnostics ----
+    def instrument(self, enabled: bool = True) -> Optional[BusInstrumentation]:
+        """Enable (or disable) instrumentation; returns the active BusInstrumentation."""
+        with self._lock:
+            if enabled and self._instr is None:
+                self._instr = BusInstrumentation()
+            elif not enabled:
+                self._instr = None
+            for lst in self._subs.values():
+                for s in lst:
+                    s.instrumentation = self._instr
+            return self._instr
+
+    @property
+    def instrumentation(self) -> Optional[BusInstrumentation]:
+        return self._instr
+
+    def subscriber_stats(self) -> List[SubscriberStats]:
+        return [s.stats for lst in self._subs.values() for s in lst]
+
+    def shutdown(self) -> None:
+        """Drop every subscription and stop their worker threads."""
+        with self._lock:
+            subs = [s for lst in self._subs.values() for s in lst]
+            self._subs = {}
+            self._resolved = {}
+        for s in subs:
+            s.close()
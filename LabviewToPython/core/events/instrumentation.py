@@ -0,0 +1,159 @@
+from __future__ import annotations
+import json
+import time
+import traceback
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+# latency histogram bin edges in seconds: 1 us .. 10 s, 4 bins per decade (+ overflow bin)
+LATENCY_EDGES_S: Tuple[float, ...] = tuple(10.0 ** (e / 4.0) for e in range(-24, 5))
+
+
+class LatencyHistogram:
+    """Fixed log-spaced bins; cheap to record, good enough for percentiles."""
+    __slots__ = ("counts", "total_s", "max_s")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_EDGES_S) + 1)
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    def record(self, dt: float) -> None:
+        self.counts[bisect_right(LATENCY_EDGES_S, dt)] += 1
+        self.total_s += dt
+        if dt > self.max_s:
+            self.max_s = dt
+
+    @property
+    def n(self) -> int:
+        return sum(self.counts)
+
+    def percentile(self, q: float) -> float:
+        """Upper edge of the bin holding the q-th percentile (0..100)."""
+        n = self.n
+        if n == 0:
+            return 0.0
+        rank = q / 100.0 * n
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank and c:
+                return LATENCY_EDGES_S[i] if i < len(LATENCY_EDGES_S) else self.max_s
+        return self.max_s
+
+
+@dataclass
+class _Rate:
+    count: int = 0
+    ref_count: int = 0
+    ref_t: float = field(default_factory=time.perf_counter)
+    rate_hz: float = 0.0
+
+    def update(self, now: float, min_interval: float) -> float:
+        dt = now - self.ref_t
+        if dt >= min_interval:
+            self.rate_hz = (self.count - self.ref_count) / dt
+            self.ref_count, self.ref_t = self.count, now
+        return self.rate_hz
+
+
+@dataclass
+class _HandlerEntry:
+    topic: str
+    handler: str
+    calls: _Rate = field(default_factory=_Rate)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    errors: int = 0
+    last_error: Optional[str] = None
+    last_traceback: Optional[str] = None
+    last_error_time: Optional[float] = None
+
+
+class BusInstrumentation:
+    """
+    Per-topic publish counts and per-(topic, handler) latency histograms,
+    exception counts and the last traceback. Filled by EventBus once
+    enabled with bus.instrument(); snapshot() is what the diagnostics dock
+    shows, dump() writes the same to a JSON file.
+
+    Rates are computed between snapshot() calls (at least `rate_interval_s`
+    apart), so the publish path only increments counters.
+    """
+    def __init__(self, rate_interval_s: float = 1.0) -> None:
+        self._lock = Lock()
+        self._topics: Dict[str, _Rate] = {}
+        self._handlers: Dict[Tuple[str, str], _HandlerEntry] = {}
+        self._rate_interval_s = rate_interval_s
+        self._t0 = time.time()
+
+    # ---- recording (publish path) ----
+    def published(self, topic: str) -> None:
+        r = self._topics.get(topic)
+        if r is None:
+            with self._lock:
+                r = self._topics.setdefault(topic, _Rate())
+        r.count += 1
+
+    def handled(self, topic: str, handler: str, dt: float, exc: Optional[BaseException] = None) -> None:
+        key = (topic, handler)
+        e = self._handlers.get(key)
+        if e is None:
+            with self._lock:
+                e = self._handlers.setdefault(key, _HandlerEntry(topic, handler))
+        e.calls.count += 1
+        e.latency.record(dt)
+        if exc is not None:
+            e.errors += 1
+            e.last_error = f"{type(exc).__name__}: {exc}"
+            e.last_traceback = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+            e.last_error_time = time.time()
+
+    # ---- reading ----
+    def snapshot(self) -> Dict[str, Any]:
+        now = time.perf_counter()
+        with self._lock:
+            topics = list(self._topics.items())
+            handlers = list(self._handlers.values())
+        iv = self._rate_interval_s
+        return {
+            "since": self._t0,
+            "time": time.time(),
+            "topics": [
+                {"topic": t, "published": r.count, "rate_hz": r.update(now, iv)}
+                for t, r in sorted(topics)
+            ],
+            "handlers": [
+                {
+                    "topic": e.topic,
+                    "handler": e.handler,
+                    "calls": e.calls.count,
+                    "rate_hz": e.calls.update(now, iv),
+                    "mean_ms": 1e3 * e.latency.total_s / max(1, e.latency.n),
+                    "p50_ms": 1e3 * e.latency.percentile(50),
+                    "p99_ms": 1e3 * e.latency.percentile(99),
+                    "max_ms": 1e3 * e.latency.max_s,
+                    "histogram": {"edges_s": list(LATENCY_EDGES_S), "counts": list(e.latency.counts)},
+                    "errors": e.errors,
+                    "last_error": e.last_error,
+                    "last_error_time": e.last_error_time,
+                    "last_traceback": e.last_traceback,
+                }
+                for e in sorted(handlers, key=lambda e: (e.topic, e.handler))
+            ],
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._topics = {}
+            self._handlers = {}
+            self._t0 = time.time()
+
+    def dump(self, path: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        data = self.snapshot()
+        if extra:
+            data.update(extra)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, default=str)
+
@@ -0,0 +1,329 @@
+from __future__ import annotations
+import json
+import os
+import pickle
+import struct
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Callable, Deque, Iterable, Iterator, List, Optional, Tuple
+
+from LabviewToPython.core.abstractions.i_eventbus import IEventBus
+from LabviewToPython.core.events.eventbus import topic_matches
+from LabviewToPython.core.events.topics import topic_spec
+
+# File layout (little endian, append-only; several sessions may follow each other):
+#   MAGIC
+#   record*:  u32 body_len | u8 kind | f64 t | u16 topic_len | topic | body
+# t is seconds since the session marker that precedes the record.
+MAGIC = b"LABBUS1\n"
+KIND_EVENT = 0     # registered topic, body = EventCodec bytes (core/events/topics.py)
+KIND_PICKLE = 1    # anything else: u32 n_buffers | u64 len + pickle | (u64 len + raw buffer)*
+KIND_SESSION = 2   # session marker, body = JSON {"wall_time", "topics"}
+
+_REC = struct.Struct("<IBdH")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+
+@dataclass
+class Record:
+    t: float            # seconds since session start
+    topic: str
+    payload: Any
+    session: int        # 0-based session number in the file
+
+
+@dataclass
+class RecorderStats:
+    recorded: int = 0
+    dropped: int = 0        # queue full: the writer could not keep up
+    errors: int = 0         # records that could not be encoded/written (e.g. unpicklable payload)
+    bytes_written: int = 0
+    queued: int = 0
+    last_error: str = ""
+
+
+class BusRecorder:
+    """
+    Records selected topics to an append-only file.
+
+    `topics` may contain patterns ('pressure/*'); every record is stored
+    under the concrete published topic (subscribe(with_topic=True)), so it
+    is encoded with that topic's codec and replays to exact subscribers.
+
+    Subscriptions are SYNC and only timestamp + append to a bounded queue,
+    so publishers never wait for the disk; a writer thread encodes and
+    writes. Registered event types use their compact codec, everything else
+    (frames, dicts, NumPy arrays) is pickled with out-of-band buffers, so
+    array data is written straight from the payload without an extra copy.
+    """
+    def __init__(
+        self,
+        bus: IEventBus,
+        path: str,
+        topics: Iterable[str],
+        max_queue: int = 10000,
+        flush_interval_s: float = 0.5,
+    ) -> None:
+        self._bus = bus
+        self._path = path
+        self._topics = list(topics)
+        self._max_queue = max(1, int(max_queue))
+        self._flush_interval_s = flush_interval_s
+
+        self._queue: Deque[Tuple[float, str, Any]] = deque()
+        self._cond = threading.Condition()
+        self._handlers: List[Tuple[str, Callable[[str, Any], None]]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._t0 = 0.0
+        self._stats = RecorderStats()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def start(self) -> None:
+        if self._running:
+            return
+        f = open(self._path, "ab")
+        if f.tell() == 0:
+            f.write(MAGIC)
+        self._t0 = time.perf_counter()
+        marker = json.dumps({"wall_time": time.time(), "topics": self._topics}).encode("utf-8")
+        f.write(_REC.pack(len(marker), KIND_SESSION, 0.0, 0))
+        f.write(marker)
+
+        self._running = True
+        self._thread = threading.Thread(target=self._writer, args=(f,), name="bus-recorder", daemon=True)
+        self._thread.start()
+        handler = self._make_handler()
+        for topic in self._topics:
+            self._bus.subscribe(topic, handler, with_topic=True)
+            self._handlers.append((topic, handler))
+
+    def stop(self) -> None:
+        """Unsubscribe, write what is queued, close the file."""
+        for topic, handler in self._handlers:
+            self._bus.unsubscribe(topic, handler)
+        self._handlers.clear()
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def stats(self) -> RecorderStats:
+        with self._cond:
+            s = RecorderStats(**vars(self._stats))
+            s.queued = len(self._queue)
+        return s
+
+    # ---- publisher side ----
+    def _make_handler(self) -> Callable[[str, Any], None]:
+        queue, cond, perf = self._queue, self._cond, time.perf_counter
+
+        def on_event(topic: str, payload: Any) -> None:
+            t = perf() - self._t0
+            with cond:
+                if len(queue) >= self._max_queue:
+                    self._stats.dropped += 1
+                    return
+                queue.append((t, topic, payload))
+                if len(queue) == 1:
+                    cond.notify()
+        return on_event
+
+    # ---- writer thread ----
+    def _writer(self, f: BinaryIO) -> None:
+        next_flush = time.monotonic() + self._flush_interval_s
+        try:
+            while True:
+                with self._cond:
+                    if not self._queue and self._running:
+                        self._cond.wait(self._flush_interval_s)
+                    batch = list(self._queue)
+                    self._queue.clear()
+                    running = self._running
+                written = recorded = errors = 0
+                error = ""
+                for t, topic, payload in batch:
+                    try:
+                        written += _write_record(f, t, topic, payload)
+                        recorded += 1
+                    except Exception as e:   # one bad record must not stop the recording
+                        errors += 1
+                        error = f"{topic}: {type(e).__name__}: {e}"
+                with self._cond:
+                    self._stats.recorded += recorded
+                    self._stats.bytes_written += written
+                    if errors:
+                        self._stats.errors += errors
+                        self._stats.last_error = error
+                if time.monotonic() >= next_flush:
+                    f.flush()
+                    next_flush = time.monotonic() + self._flush_interval_s
+                if not running and not batch:
+                    return
+        finally:
+            f.close()
+
+
+def _write_record(f: BinaryIO, t: float, topic: str, payload: Any) -> int:
+    """Encodes before the first write, so a payload that fails leaves no partial record."""
+    name = topic.encode("utf-8")
+    spec = topic_spec(topic)
+    if spec is not None and spec.codec is not None and isinstance(payload, spec.event_type):
+        body = spec.codec.encode(payload)
+        f.write(_REC.pack(len(name) + len(body), KIND_EVENT, t, len(name)))
+        f.write(name)
+        f.write(body)
+        return _REC.size + len(name) + len(body)
+
+    buffers: List[pickle.PickleBuffer] = []
+    data = pickle.dumps(payload, protocol=5, buffer_callback=buffers.append)
+    raws = [b.raw() for b in buffers]
+    body_len = _U32.size + _U64.size + len(data) + sum(_U64.size + r.nbytes for r in raws)
+    f.write(_REC.pack(len(name) + body_len, KIND_PICKLE, t, len(name)))
+    f.write(name)
+    f.write(_U32.pack(len(raws)))
+    f.write(_U64.pack(len(data)))
+    f.write(data)
+    for r in raws:
+        f.write(_U64.pack(r.nbytes))
+        f.write(r)
+    return _REC.size + len(name) + body_len
+
+
+# ---- reading ----
+def read_records(path: str, topics: Optional[Iterable[str]] = None) -> Iterator[Record]:
+    """
+    Records in file order; a truncated last record (recorder killed) is ignored.
+    `topics` may contain patterns ('pressure/*').
+    NumPy arrays in pickled payloads are read-only views on the record bytes.
+    """
+    wanted = list(topics) if topics is not None else None
+    session = -1
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path}: not a bus recording")
+        while True:
+            head = f.read(_REC.size)
+            if len(head) < _REC.size:
+                return
+            body_len, kind, t, name_len = _REC.unpack(head)
+            raw = f.read(body_len)
+            if len(raw) < body_len:
+                return
+            if kind == KIND_SESSION:
+                session += 1
+                continue
+            topic = raw[:name_len].decode("utf-8")
+            if wanted is not None and not any(topic_matches(w, topic) for w in wanted):
+                continue
+            yield Record(t, topic, _decode_body(kind, topic, memoryview(raw)[name_len:]), max(session, 0))
+
+
+def _decode_body(kind: int, topic: str, body: memoryview) -> Any:
+    if kind == KIND_EVENT:
+        spec = topic_spec(topic)
+        if spec is None or spec.codec is None:
+            raise KeyError(f"recorded topic {topic!r} is not registered in core/events/topics.py")
+        return spec.codec.decode(body)
+    if kind == KIND_PICKLE:
+        (n,) = _U32.unpack_from(body, 0)
+        (size,) = _U64.unpack_from(body, _U32.size)
+        pos = _U32.size + _U64.size
+        data = body[pos:pos + size]
+        pos += size
+        buffers = []
+        for _ in range(n):
+            (size,) = _U64.unpack_from(body, pos)
+            pos += _U64.size
+            buffers.append(body[pos:pos + size])
+            pos += size
+        return pickle.loads(data, buffers=buffers)
+    raise ValueError(f"unknown record kind {kind}")
+
+
+# ---- replay ----
+@dataclass
+class ReplayStats:
+    published: int = 0
+    duration_s: float = 0.0
+    max_late_s: float = 0.0     # worst delay behind the (scaled) original schedule
+
+
+class BusReplayer:
+    """
+    Publishes a recording again, in order, on any bus.
+
+    speed: 1.0 original timing, 2.0 twice as fast, 0.5 half speed,
+    0 (or inf) as fast as possible. Sessions are replayed back to back.
+    run() blocks; start() runs it in a thread.
+    """
+    def __init__(
+        self,
+        bus: IEventBus,
+        path: str,
+        speed: float = 1.0,
+        topics: Optional[Iterable[str]] = None,
+    ) -> None:
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        self._bus = bus
+        self._path = path
+        self._speed = float(speed)
+        self._topics = list(topics) if topics is not None else None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = ReplayStats()
+
+    def run(self) -> ReplayStats:
+        paced = 0.0 < self._speed < float("inf")
+        stats = ReplayStats()
+        start = time.perf_counter()
+        offset = 0.0            # end of the previous sessions (recording time)
+        session, last_t = 0, 0.0
+        for rec in read_records(self._path, self._topics):
+            if self._stop.is_set():
+                break
+            if rec.session != session:
+                offset += last_t
+                session = rec.session
+            last_t = rec.t
+            if paced:
+                due = start + (offset + rec.t) / self._speed
+                wait = due - time.perf_counter()
+                if wait > 0:
+                    if self._stop.wait(wait):
+                        break
+                else:
+                    stats.max_late_s = max(stats.max_late_s, -wait)
+            self._bus.publish(rec.topic, rec.payload)
+            stats.published += 1
+        stats.duration_s = time.perf_counter() - start
+        self.stats = stats
+        return stats
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="bus-replay", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """True once a start()ed replay has finished."""
+        if self._thread is None:
+            return True
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
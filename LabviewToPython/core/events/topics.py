@@ -0,0 +1,195 @@
+from __future__ import annotations
+import struct
+import typing
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type
+
+# ---- topic names ----
+CAMERA_HEARTBEAT = "camera/heartbeat"
+CAMERA_FRAME = "camera/frame"        # CameraFrame (devices/base.py), not encodable
+CAMERA_STATS = "camera/stats"        # dict, see CameraService.stats()
+PRESSURE_VALUE = "pressure/value"
+PRESSURE_BATCH = "pressure/batch"    # PressureBatch, all readings since the last batch
+PRESSURE_STATS = "pressure/stats"    # dict, see PressureService.stats()
+TEMPERATURE_VALUE = "temperature/value"
+MOTION_POSITION = "motion/position"
+SCAN_STATUS = "scan/status"
+PUMP_STATUS = "pump/status"
+ANALYSIS_RESULT = "analysis/result"
+STORE_META = "store/meta"
+STORE_RESULT = "store/result"
+
+
+# ---- event payloads ----
+class CameraHeartbeat(NamedTuple):
+    ok: bool = True
+
+class PressureValue(NamedTuple):
+    channel: str
+    value: float
+    unit: str = "Pa"
+    timestamp: float = 0.0
+
+class PressureBatch(NamedTuple):
+    readings: Tuple[PressureValue, ...]
+
+class TemperatureValue(NamedTuple):
+    channel: str                     # e.g. "A", "B" (Lakeshore KRDG? inputs)
+    value: float
+    unit: str = "K"
+    timestamp: float = 0.0
+
+class MotionPosition(NamedTuple):
+    position: float
+
+class ScanStatus(NamedTuple):
+    state: str
+
+class PumpStatus(NamedTuple):
+    running: bool
+
+class AnalysisResult(NamedTuple):
+    ok: bool
+
+class StoreWritten(NamedTuple):
+    written: bool = True
+
+
+# ---- binary encoding ----
+_NUMERIC_CODES = {float: "d", int: "q", bool: "?"}
+_LEN = struct.Struct("<H")
+
+
+class EventCodec:
+    """
+    Little-endian struct encoding of one NamedTuple event type.
+
+    Numeric fields go into one precompiled struct in field order; str fields
+    follow as u16 length + UTF-8. A type with only numeric fields therefore
+    encodes with a single Struct.pack call.
+    """
+    def __init__(self, event_type: Type[Any]) -> None:
+        hints = typing.get_type_hints(event_type)
+        self.event_type = event_type
+        self.fields: Tuple[str, ...] = tuple(event_type._fields)
+        self._numeric: List[int] = []
+        self._strings: List[int] = []
+        codes = "<"
+        for i, name in enumerate(self.fields):
+            t = hints[name]
+            if t is str:
+                self._strings.append(i)
+            elif t in _NUMERIC_CODES:
+                self._numeric.append(i)
+                codes += _NUMERIC_CODES[t]
+            else:
+                raise TypeError(f"{event_type.__name__}.{name}: {t!r} has no binary encoding")
+        self._struct = struct.Struct(codes)
+
+    def encode(self, event: Any) -> bytes:
+        if not self._strings:
+            return self._struct.pack(*event)
+        parts = [self._struct.pack(*[event[i] for i in self._numeric])]
+        for i in self._strings:
+            raw = event[i].encode("utf-8")
+            parts.append(_LEN.pack(len(raw)))
+            parts.append(raw)
+        return b"".join(parts)
+
+    def decode(self, data: Any, offset: int = 0) -> Any:
+        numbers = self._struct.unpack_from(data, offset)
+        if not self._strings:
+            return self.event_type._make(numbers)
+        values: List[Any] = [None] * len(self.fields)
+        for i, v in zip(self._numeric, numbers):
+            values[i] = v
+        pos = offset + self._struct.size
+        for i in self._strings:
+            (n,) = _LEN.unpack_from(data, pos)
+            pos += _LEN.size
+            values[i] = bytes(data[pos:pos + n]).decode("utf-8")
+            pos += n
+        return self.event_type._make(values)
+
+
+# ---- registry ----
+@dataclass(frozen=True)
+class TopicSpec:
+    topic: str
+    event_type: Type[Any]
+    topic_id: int                   # wire id: CRC-32 of the name, same in every process
+    codec: Optional[EventCodec]     # None: payload is not binary-encodable
+
+
+_TOPICS: Dict[str, TopicSpec] = {}
+_BY_ID: Dict[int, TopicSpec] = {}
+_HEADER = struct.Struct("<I")   # topic id
+
+
+def _topic_id(topic: str) -> int:
+    """Derived from the name only, so processes that import in a different order agree."""
+    return zlib.crc32(topic.encode("utf-8"))
+
+
+def register_topic(topic: str, event_type: Type[Any], binary: bool = True) -> TopicSpec:
+    """Bind a payload type to a topic (idempotent for the same type)."""
+    spec = _TOPICS.get(topic)
+    if spec is not None:
+        if spec.event_type is not event_type:
+            raise ValueError(f"topic {topic!r} already registered with {spec.event_type.__name__}")
+        return spec
+    topic_id = _topic_id(topic)
+    clash = _BY_ID.get(topic_id)
+    if clash is not None:
+        raise ValueError(f"topic {topic!r} has the same wire id as {clash.topic!r}; rename one")
+    codec = EventCodec(event_type) if binary else None
+    spec = TopicSpec(topic, event_type, topic_id, codec)
+    _TOPICS[topic] = spec
+    _BY_ID[spec.topic_id] = spec
+    return spec
+
+
+def topic_spec(topic: str) -> Optional[TopicSpec]:
+    return _TOPICS.get(topic)
+
+
+def registered_topics() -> List[TopicSpec]:
+    return list(_TOPICS.values())
+
+
+def check_payload(topic: str, payload: Any) -> None:
+    """TypeError if `topic` is registered and payload is not its event type."""
+    spec = _TOPICS.get(topic)
+    if spec is not None and not isinstance(payload, spec.event_type):
+        raise TypeError(
+            f"{topic!r} expects {spec.event_type.__name__}, got {type(payload).__name__}"
+        )
+
+
+def encode(topic: str, payload: Any) -> bytes:
+    """topic id (u32) + encoded payload."""
+    spec = _TOPICS.get(topic)
+    if spec is None or spec.codec is None:
+        raise KeyError(f"topic {topic!r} has no binary encoding")
+    return _HEADER.pack(spec.topic_id) + spec.codec.encode(payload)
+
+
+def decode(data: Any, offset: int = 0) -> Tuple[str, Any]:
+    (topic_id,) = _HEADER.unpack_from(data, offset)
+    spec = _BY_ID.get(topic_id)
+    if spec is None or spec.codec is None:
+        raise KeyError(f"unknown topic id {topic_id}")
+    return spec.topic, spec.codec.decode(data, offset + _HEADER.size)
+
+
+register_topic(CAMERA_HEARTBEAT, CameraHeartbeat)
+register_topic(PRESSURE_VALUE, PressureValue)
+register_topic(MOTION_POSITION, MotionPosition)
+register_topic(SCAN_STATUS, ScanStatus)
+register_topic(PUMP_STATUS, PumpStatus)
+register_topic(ANALYSIS_RESULT, AnalysisResult)
+register_topic(STORE_META, StoreWritten)
+register_topic(STORE_RESULT, StoreWritten)
+register_topic(PRESSURE_BATCH, PressureBatch, binary=False)
+register_topic(TEMPERATURE_VALUE, TemperatureValue)
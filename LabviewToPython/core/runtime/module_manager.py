@@ -1,26 +1,94 @@
 # core/module_manager.py
 from __future__ import annotations
-from typing import List
-from LabviewToPython.core.interfaces.i_module import IDockModule, IMenuModule, IModule
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from LabviewToPython.core.abstractions.i_module import IDockModule, IMenuModule, IModule
 from LabviewToPython.core.types.host import AppContext, DockSpec, HostServices
-from LabviewToPython.modules import discover_modules
+from LabviewToPython.modules import ModuleRef, load_entry_point
+from LabviewToPython.modules.registry import MODULES
+
+MAX_START_WORKERS = 4
+
+log = logging.getLogger(__name__)
+
+@dataclass
+class PhaseTiming:
+    module: str
+    phase: str          # import | construct | start | create_docks | dock | menus | stop
+    start_s: float      # time.perf_counter()
+    duration_s: float
+    thread: str
+    detail: str = ""    # e.g. the dock object name
 
 class ModuleManager:
-    def __init__(self) -> None:
+    """
+    Loads modules from "package.module:Class" entry points (modules/registry.py)
+    and drives their lifecycle.
+
+    - Every module is imported and constructed eagerly on load_all(), before
+      the window exists; only dock contents are built lazily (DockSpec.lazy).
+      Modules load one at a time, so a broken one is logged (with traceback)
+      and kept in `failed` instead of aborting the import of the rest; if
+      none loads, load_all() raises.
+    - start_all() runs modules with thread_safe_start concurrently on a
+      worker pool while the others start on the calling (GUI) thread.
+    - Dock factories are wrapped so their deferred construction is timed too.
+    Every step lands in `timings`; startup_report() summarizes per module.
+    """
+    def __init__(self, entry_points: Optional[Sequence[ModuleRef]] = None) -> None:
+        self._entry_points: List[ModuleRef] = list(MODULES if entry_points is None else entry_points)
         self._mods: List[IModule] = []
+        self._timings: List[PhaseTiming] = []
+        self._timings_lock = threading.Lock()
+        self.failed: Dict[str, BaseException] = {}
 
     def load_all(self) -> None:
-        self._mods = discover_modules()
+        self._mods = []
+        for ref in self._entry_points:
+            name = ref if isinstance(ref, str) else f"{ref.__module__}:{ref.__qualname__}"
+            try:
+                t0 = time.perf_counter()
+                cls = load_entry_point(ref)
+                t1 = time.perf_counter()
+                mod = cls()
+                t2 = time.perf_counter()
+            except Exception as e:
+                log.exception("module %s failed to load", name)
+                self.failed[name] = e
+                continue
+            mid = _module_id(mod)
+            self._record(mid, "import", t0, t1 - t0, detail=name)
+            self._record(mid, "construct", t1, t2 - t1)
+            self._mods.append(mod)
+        if self._entry_points and not self._mods:
+            raise RuntimeError(f"no module could be loaded ({len(self.failed)} failed, see log)")
 
     def start_all(self, ctx: AppContext) -> None:
-        for m in self._mods:
-            m.start(ctx)
+        parallel = [m for m in self._mods if getattr(m, "thread_safe_start", False)]
+        serial = [m for m in self._mods if m not in parallel]
+        if not parallel:
+            for m in serial:
+                self._timed(_module_id(m), "start", m.start, ctx)
+            return
+        with ThreadPoolExecutor(max_workers=min(MAX_START_WORKERS, len(parallel)),
+                                thread_name_prefix="module-start") as pool:
+            futures = [pool.submit(self._timed, _module_id(m), "start", m.start, ctx) for m in parallel]
+            for m in serial:
+                self._timed(_module_id(m), "start", m.start, ctx)
+            for f in futures:
+                f.result()   # re-raise start() errors on the caller, like the serial path
 
     def create_all_docks(self, host: HostServices) -> List[DockSpec]:
         created: List[DockSpec] = []
         for m in self._mods:
             if isinstance(m, IDockModule):
-                for spec in m.create_docks():
+                mid = _module_id(m)
+                for spec in self._timed(mid, "create_docks", m.create_docks):
+                    spec = replace(spec, factory=self._timed_factory(mid, spec))
                     host.add_dock(spec)
                     created.append(spec)
         return created
@@ -28,12 +96,55 @@ class ModuleManager:
     def install_all_menus(self) -> None:
         for m in self._mods:
             if isinstance(m, IMenuModule):
-                m.install_menus()
+                self._timed(_module_id(m), "menus", m.install_menus)
 
     def stop_all(self) -> None:
         for m in self._mods:
-            try: m.stop()
+            try: self._timed(_module_id(m), "stop", m.stop)
             except Exception: pass
 
     def modules(self) -> List[IModule]:
         return list(self._mods)
+
+    # ---- timing ----
+    @property
+    def timings(self) -> List[PhaseTiming]:
+        with self._timings_lock:
+            return list(self._timings)
+
+    def startup_report(self) -> str:
+        """Per-module table (ms): import, construct, start, docks (spec + built factories), menus."""
+        cols = ("import", "construct", "start", "docks", "menus")
+        per: Dict[str, Dict[str, float]] = {}
+        for t in self.timings:
+            key = "docks" if t.phase in ("create_docks", "dock") else t.phase
+            if key in cols:
+                row = per.setdefault(t.module, dict.fromkeys(cols, 0.0))
+                row[key] += t.duration_s * 1e3
+        lines = [f"{'module':24s}" + "".join(f"{c:>11s}" for c in cols) + f"{'total':>11s}"]
+        for mod, row in sorted(per.items(), key=lambda kv: -sum(kv[1].values())):
+            lines.append(f"{mod:24s}" + "".join(f"{row[c]:11.1f}" for c in cols) + f"{sum(row.values()):11.1f}")
+        for name, e in self.failed.items():
+            lines.append(f"{name}: failed to load ({type(e).__name__}: {e})")
+        return "\n".join(lines)
+
+    def _timed(self, module: str, phase: str, fn: Callable[..., Any], *args: Any, detail: str = "") -> Any:
+        t0 = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self._record(module, phase, t0, time.perf_counter() - t0, detail)
+
+    def _record(self, module: str, phase: str, start_s: float, duration_s: float, detail: str = "") -> None:
+        t = PhaseTiming(module, phase, start_s, duration_s, threading.current_thread().name, detail)
+        with self._timings_lock:
+            self._timings.append(t)
+
+    def _timed_factory(self, module: str, spec: DockSpec) -> Callable[[Any], Any]:
+        factory = spec.factory
+        def build(parent: Any) -> Any:
+            return self._timed(module, "dock", factory, parent, detail=spec.object_name)
+        return build
+
+def _module_id(m: IModule) -> str:
+    return getattr(m, "module_id", type(m).__name__)
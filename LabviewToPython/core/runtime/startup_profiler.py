@@ -0,0 +1,209 @@
+# core/runtime/startup_profiler.py
+"""
+Startup profiling for app.py: import times, module lifecycle, time to first
+paint, written as a Chrome trace (chrome://tracing, https://ui.perfetto.dev).
+
+Enable with `python -m app --profile-startup[=trace.json]` or the
+LABAPP_PROFILE_STARTUP=trace.json environment variable. With
+--startup-budget-ms=N (LABAPP_STARTUP_BUDGET_MS) the app quits right after
+the first paint and exits with 1 if that took longer than N ms, so a CI job
+can catch startup regressions.
+
+Stdlib only: it is imported before PySide6 so those imports are measured too.
+"""
+from __future__ import annotations
+import builtins
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+DEFAULT_TRACE = "startup_trace.json"
+ENV_TRACE = "LABAPP_PROFILE_STARTUP"
+ENV_BUDGET = "LABAPP_STARTUP_BUDGET_MS"
+
+
+class StartupProfiler:
+    def __init__(self, path: str = DEFAULT_TRACE, budget_ms: Optional[float] = None) -> None:
+        self.path = path
+        self.budget_ms = budget_ms
+        self.t0 = time.perf_counter()
+        self.first_paint_s: Optional[float] = None
+        self._events: List[Dict[str, Any]] = []
+        self._threads: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._orig_import: Any = None
+
+    @classmethod
+    def from_argv(cls, argv: List[str]) -> Optional["StartupProfiler"]:
+        """Profiler if requested on the command line or environment (options are removed from argv)."""
+        path = os.environ.get(ENV_TRACE) or None
+        budget = os.environ.get(ENV_BUDGET)
+        for arg in list(argv[1:]):
+            if arg == "--profile-startup" or arg.startswith("--profile-startup="):
+                path = arg.partition("=")[2] or DEFAULT_TRACE
+                argv.remove(arg)
+            elif arg.startswith("--startup-budget-ms="):
+                budget = arg.partition("=")[2]
+                argv.remove(arg)
+        if path is None and budget is None:
+            return None
+        prof = cls(path or DEFAULT_TRACE, float(budget) if budget else None)
+        prof.install_import_hook()
+        return prof
+
+    # ---- recording ----
+    def add(self, name: str, cat: str, start_s: float, duration_s: float,
+            thread: Optional[str] = None, **args: Any) -> None:
+        """One complete ('X') event; times are time.perf_counter() values."""
+        tid = self._tid(thread)
+        ev = {"name": name, "cat": cat, "ph": "X", "pid": 1, "tid": tid,
+              "ts": (start_s - self.t0) * 1e6, "dur": duration_s * 1e6}
+        if args:
+            ev["args"] = args
+        with self._lock:
+            self._events.append(ev)
+
+    def mark(self, name: str, cat: str = "app", **args: Any) -> None:
+        ev = {"name": name, "cat": cat, "ph": "i", "s": "g", "pid": 1, "tid": self._tid(None),
+              "ts": (time.perf_counter() - self.t0) * 1e6}
+        if args:
+            ev["args"] = args
+        with self._lock:
+            self._events.append(ev)
+
+    @contextmanager
+    def span(self, name: str, cat: str = "app", **args: Any) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, cat, t0, time.perf_counter() - t0, **args)
+
+    def add_module_timings(self, timings: Iterable[Any]) -> None:
+        """ModuleManager.timings (PhaseTiming) -> events on the thread that ran them."""
+        for t in timings:
+            name = f"{t.module}.{t.phase}" + (f" {t.detail}" if t.detail and t.phase == "dock" else "")
+            self.add(name, "module", t.start_s, t.duration_s, thread=t.thread, module=t.module, phase=t.phase)
+
+    def add_service_timings(self, timings: Iterable[Any]) -> None:
+        """Container.timings() (ServiceTiming) -> one event per service construction."""
+        for t in timings:
+            self.add(t.service, "service", t.start_s, t.duration_s, thread=t.thread,
+                     lifetime=str(t.lifetime.value), scope=t.scope)
+
+    def _tid(self, thread: Optional[str]) -> int:
+        name = thread or threading.current_thread().name
+        with self._lock:
+            for tid, n in self._threads.items():
+                if n == name:
+                    return tid
+            tid = len(self._threads) + 1
+            self._threads[tid] = name
+            return tid
+
+    # ---- imports ----
+    def install_import_hook(self) -> None:
+        """Time every import that loads new modules (nested imports nest in the trace)."""
+        if self._orig_import is not None:
+            return
+        orig = self._orig_import = builtins.__import__
+        local = self._local
+
+        def timed_import(name: str, globals: Any = None, locals: Any = None, fromlist: Any = (), level: int = 0) -> Any:
+            n0 = len(sys.modules)
+            depth = getattr(local, "depth", 0)
+            local.depth = depth + 1
+            t0 = time.perf_counter()
+            try:
+                return orig(name, globals, locals, fromlist, level)
+            finally:
+                local.depth = depth
+                if len(sys.modules) > n0:
+                    if level and globals:
+                        name = f"{globals.get('__package__') or ''}.{name}".strip(".")
+                    self.add(name, "import", t0, time.perf_counter() - t0,
+                             new_modules=len(sys.modules) - n0, depth=depth)
+
+        builtins.__import__ = timed_import
+
+    def uninstall_import_hook(self) -> None:
+        if self._orig_import is not None:
+            builtins.__import__ = self._orig_import
+            self._orig_import = None
+
+    def import_summary(self, top: int = 15) -> List[tuple]:
+        """(package, ms) of outermost imports, largest first; LabviewToPython split per module package."""
+        per: Dict[str, float] = {}
+        with self._lock:
+            events = [e for e in self._events if e["cat"] == "import" and e["args"]["depth"] == 0]
+        for e in events:
+            parts = e["name"].split(".")
+            key = ".".join(parts[:3]) if parts[0] == "LabviewToPython" else parts[0]
+            per[key] = per.get(key, 0.0) + e["dur"] / 1e3
+        return sorted(per.items(), key=lambda kv: -kv[1])[:top]
+
+    # ---- first paint / output ----
+    def finish_on_first_paint(self, window: Any, module_timings: Any = None, service_timings: Any = None) -> None:
+        """
+        Record the first paint of `window`, then write the trace. module_timings
+        and service_timings are callables returning ModuleManager.timings and
+        Container.timings(), read at that moment so lazily built docks and
+        services are included.
+        """
+        from PySide6.QtCore import QEvent, QObject, QTimer
+        from PySide6.QtWidgets import QApplication
+
+        profiler = self
+
+        class _FirstPaint(QObject):
+            def eventFilter(self, obj: Any, event: Any) -> bool:
+                if event.type() == QEvent.Type.Paint and profiler.first_paint_s is None:
+                    profiler.first_paint_s = time.perf_counter() - profiler.t0
+                    window.removeEventFilter(self)
+                    QTimer.singleShot(0, done)   # after this paint has finished
+                return False
+
+        def done() -> None:
+            self.mark("first_paint", ms=round(self.first_paint_s * 1e3, 1))
+            if module_timings is not None:
+                self.add_module_timings(module_timings())
+            if service_timings is not None:
+                self.add_service_timings(service_timings())
+            self.uninstall_import_hook()
+            self.write()
+            print(self.report())
+            if self.budget_ms is not None:
+                QApplication.instance().exit(0 if self.within_budget() else 1)
+
+        self._paint_filter = _FirstPaint(window)
+        window.installEventFilter(self._paint_filter)
+
+    def within_budget(self) -> bool:
+        return self.budget_ms is None or (
+            self.first_paint_s is not None and self.first_paint_s * 1e3 <= self.budget_ms
+        )
+
+    def write(self, path: Optional[str] = None) -> str:
+        path = path or self.path
+        with self._lock:
+            meta = [{"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": n}}
+                    for tid, n in self._threads.items()]
+            events = meta + list(self._events)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return path
+
+    def report(self) -> str:
+        lines = [f"startup trace: {self.path}"]
+        if self.first_paint_s is not None:
+            verdict = "" if self.budget_ms is None else (
+                f"  (budget {self.budget_ms:.0f} ms: {'ok' if self.within_budget() else 'EXCEEDED'})")
+            lines.append(f"first paint after {self.first_paint_s * 1e3:.1f} ms{verdict}")
+        lines.append("slowest imports (ms):")
+        lines += [f"  {pkg:40s} {ms:8.1f}" for pkg, ms in self.import_summary()]
+        return "\n".join(lines)
@@ -11,6 +11,8 @@ class DockSpec:
     title: str
     factory: Callable[[QWidget], QWidget]
     area: Qt.DockWidgetArea = Qt.DockWidgetArea.LeftDockWidgetArea
+    lazy: bool = True   # run factory only when the dock is first shown
+    visible: bool = True   # False: starts hidden, shown from the View menu
 
 @dataclass
 class HostServices:
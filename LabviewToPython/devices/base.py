@@ -1,6 +1,15 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class CameraFrame:
+    image: Any                      # np.ndarray, HxW
+    frame_index: int
+    timestamp: float                # time.time() at grab
+    meta: Dict[str, Any] = field(default_factory=dict)
 
 
 class Camera(ABC):
@@ -14,6 +23,9 @@ class Camera(ABC):
     def close(self) -> None: ...
     @abstractmethod
     def set_params(self, **params: Any) -> None: ...
+    @abstractmethod
+    def grab(self, timeout_ms: int) -> Optional[CameraFrame]:
+        """Block until the next complete frame; None on timeout / incomplete frame."""
 
 
 class PressureSensor(ABC):
@@ -25,6 +37,32 @@ class PressureSensor(ABC):
     def info(self) -> Dict[str, Any]: ...
 
 
+class PolledPressureSensor(PressureSensor):
+    """
+    Request/response gauge with the two halves exposed, so a poller can put
+    several requests on the wire before reading the replies.
+    pipeline_depth: requests the device accepts before answering (1 = strict
+    request/response).
+    """
+    pipeline_depth: int = 1
+
+    @abstractmethod
+    def request(self) -> None:
+        """Send one read command."""
+    @abstractmethod
+    def response(self, timeout_s: float) -> Optional[float]:
+        """Next reply in Pa; None on timeout."""
+    @abstractmethod
+    def close(self) -> None: ...
+
+    def read(self) -> float:
+        self.request()
+        value = self.response(1.0)
+        if value is None:
+            raise TimeoutError("no reply from pressure gauge")
+        return value
+
+
 class Pump(ABC):
     @abstractmethod
     def connect(self) -> None: ...
@@ -0,0 +1,79 @@
+from __future__ import annotations
+from typing import Any, Dict, Optional
+
+from LabviewToPython.devices.base import PolledPressureSensor
+
+# reply unit (RU) -> Pa per unit
+_PA_PER_REPLY_UNIT = {
+    "TORR": 133.322368,
+    "MBAR": 100.0,
+    "PASCAL": 1.0,
+    "PA": 1.0,
+    "MICRON": 0.133322368,
+}
+
+
+class MKS500Gauge(PolledPressureSensor):
+    """
+    MKS 500-series gauge on a plain serial line (see test/mks500_test.py):
+    ASCII commands terminated by CR, one reply per command.
+
+    RD reads the pressure in the gauge's unit, RU reports that unit (read
+    once on connect). Replies come back in command order; pipeline_depth > 1
+    queues several RDs on the line for firmware that buffers commands.
+    """
+    def __init__(self, port: str, baudrate: int = 9600, timeout_s: float = 0.5,
+                 pipeline_depth: int = 1) -> None:
+        self.pipeline_depth = max(1, int(pipeline_depth))
+        self._port = port
+        self._baudrate = baudrate
+        self._timeout_s = timeout_s
+        self._serial: Any = None        # serial.Serial, imported on connect()
+        self._pa_per_unit = _PA_PER_REPLY_UNIT["TORR"]
+        self._unit = "TORR"
+
+    def connect(self) -> None:
+        try:
+            import serial
+        except ImportError as e:
+            raise RuntimeError("pyserial is not installed (pip install pyserial).") from e
+        self._serial = serial.Serial(
+            port=self._port, baudrate=self._baudrate,
+            timeout=self._timeout_s, write_timeout=self._timeout_s,
+        )
+        self._serial.reset_input_buffer()
+        self._serial.write(b"RU\r")
+        unit = self._readline(self._timeout_s)
+        if unit:
+            unit = unit.strip().upper()
+            if unit in _PA_PER_REPLY_UNIT:
+                self._unit, self._pa_per_unit = unit, _PA_PER_REPLY_UNIT[unit]
+
+    def close(self) -> None:
+        if self._serial is not None:
+            try: self._serial.close()
+            finally: self._serial = None
+
+    def request(self) -> None:
+        self._serial.write(b"RD\r")
+
+    def response(self, timeout_s: float) -> Optional[float]:
+        line = self._readline(timeout_s)
+        if line is None:
+            return None
+        try:
+            return float(line) * self._pa_per_unit
+        except ValueError:
+            raise ValueError(f"{self._port}: unexpected reply {line!r}") from None
+
+    def info(self) -> Dict[str, Any]:
+        return {"model": "MKS 500", "port": self._port, "baudrate": self._baudrate, "unit": self._unit}
+
+    def _readline(self, timeout_s: float) -> Optional[str]:
+        if self._serial.timeout != timeout_s:
+            self._serial.timeout = timeout_s
+        raw = self._serial.read_until(b"\r")
+        if not raw.endswith(b"\r"):
+            self._serial.reset_input_buffer()   # drop the partial reply so the next one lines up
+            return None
+        return raw[:-1].decode("ascii", errors="replace").strip()
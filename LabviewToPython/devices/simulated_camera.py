@@ -0,0 +1,211 @@
+from __future__ import annotations
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from LabviewToPython.devices.base import Camera, CameraFrame
+
+
+@dataclass
+class IonSimConfig:
+    """
+    Defaults give Mono8 frames with a dark level of ~4 and spots ~120 high:
+    detect them with a fixed threshold around 40 (SIMULATED_CAMERA_CONFIG in
+    test/ion_detection.py); ContourConfig's default threshold of 1 only
+    finds the noise floor.
+    """
+    width: int = 1440
+    height: int = 1080
+    fps: float = 100.0
+    pixel_format: str = "Mono8"     # "Mono8" | "Mono16"
+    ions_per_frame: float = 200.0   # Poisson mean
+    spot_sigma_px: float = 0.8      # Gaussian spot width
+    amplitude: float = 120.0        # mean peak height (Mono8 counts; scaled x256 for Mono16)
+    amplitude_spread: float = 0.3   # relative std of the peak height
+    background: float = 4.0         # mean dark level (Mono8 counts)
+    read_noise: float = 1.5         # Gaussian noise std (Mono8 counts)
+    hot_pixels: int = 20            # fixed pixels stuck near full scale
+    edge_margin: int = 3            # keep spots fully on the sensor
+    noise_bank: int = 8             # precomputed noise frames that are cycled
+    seed: Optional[int] = None
+
+
+class IonFrameSynthesizer:
+    """
+    Draws synthetic ion-detector frames with known hit positions.
+
+    Noise frames are precomputed once (noise_bank) and cycled, so rendering a
+    frame costs one copy plus the stamping of the spots; that keeps the
+    simulator well above the analysis rate even for 5 MP frames.
+    """
+    KERNEL = 5  # spot stamp size (odd)
+
+    def __init__(self, cfg: IonSimConfig) -> None:
+        if cfg.pixel_format not in ("Mono8", "Mono16"):
+            raise ValueError(f"unsupported pixel_format {cfg.pixel_format!r}")
+        self.cfg = cfg
+        self.dtype = np.dtype(np.uint8 if cfg.pixel_format == "Mono8" else np.uint16)
+        self.scale = 1.0 if self.dtype == np.uint8 else 256.0
+        self.max_value = float(np.iinfo(self.dtype).max)
+        self.rng = np.random.default_rng(cfg.seed)
+
+        shape = (cfg.height, cfg.width)
+        bank = self.rng.normal(cfg.background, cfg.read_noise, size=(max(1, cfg.noise_bank),) + shape)
+        self._noise = (bank * self.scale).astype(np.float32)
+
+        n = cfg.hot_pixels
+        self.hot_y = self.rng.integers(0, cfg.height, n)
+        self.hot_x = self.rng.integers(0, cfg.width, n)
+
+        k = self.KERNEL // 2
+        oy, ox = np.mgrid[-k:k + 1, -k:k + 1]
+        self._oy = oy.ravel().astype(np.float32)
+        self._ox = ox.ravel().astype(np.float32)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.cfg.height, self.cfg.width)
+
+    def render(self) -> Tuple[np.ndarray, np.ndarray]:
+        """One frame and its ground truth: (image HxW, truth (N,2) float32 as x, y)."""
+        cfg = self.cfg
+        h, w = self.shape
+        img = self._noise[self.rng.integers(0, self._noise.shape[0])].copy()
+
+        n = int(self.rng.poisson(cfg.ions_per_frame))
+        m = cfg.edge_margin
+        x = self.rng.uniform(m, w - 1 - m, n).astype(np.float32)
+        y = self.rng.uniform(m, h - 1 - m, n).astype(np.float32)
+        if n:
+            amp = cfg.amplitude * self.scale * np.clip(
+                self.rng.normal(1.0, cfg.amplitude_spread, n), 0.1, None
+            ).astype(np.float32)
+
+            # stamp a KERNELxKERNEL Gaussian around every (sub-pixel) centre
+            px = np.rint(x)[:, None] + self._ox[None, :]
+            py = np.rint(y)[:, None] + self._oy[None, :]
+            d2 = (px - x[:, None]) ** 2 + (py - y[:, None]) ** 2
+            val = amp[:, None] * np.exp(-d2 / (2.0 * cfg.spot_sigma_px ** 2))
+            flat = (py.astype(np.int64) * w + px.astype(np.int64)).ravel()
+            np.add.at(img.reshape(-1), flat, val.ravel())
+
+        img[self.hot_y, self.hot_x] = self.max_value * 0.95
+        np.clip(img, 0, self.max_value, out=img)
+        return img.astype(self.dtype), np.stack([x, y], axis=1)
+
+
+class SimulatedIonCamera(Camera):
+    """
+    Hardware-free stand-in for the Blackfly: use it with CameraService to run
+    and benchmark the whole pipeline on any machine.
+
+    grab() paces frames to cfg.fps like a free-running sensor: if the caller
+    is late, sensor frames are skipped (frame_index jumps) instead of queued.
+    CameraFrame.meta["truth"] holds the (N,2) true hit positions (x, y).
+    Keyword overrides apply to a copy of cfg; the caller's config is not changed.
+    """
+    def __init__(self, cfg: Optional[IonSimConfig] = None, **overrides: Any) -> None:
+        self._cfg = replace(cfg or IonSimConfig(), **overrides)
+        self._synth: Optional[IonFrameSynthesizer] = None
+        self._acquiring = False
+        self._t0 = 0.0
+        self._next_index = 0
+
+    @property
+    def config(self) -> IonSimConfig:
+        return self._cfg
+
+    def open(self) -> None:
+        self._synth = IonFrameSynthesizer(self._cfg)
+
+    def start(self) -> None:
+        self._acquiring = True
+        self._t0 = time.perf_counter()
+        self._next_index = 0
+
+    def stop(self) -> None:
+        self._acquiring = False
+
+    def close(self) -> None:
+        self.stop()
+        self._synth = None
+
+    def set_params(self, **params: Any) -> None:
+        """Any IonSimConfig field; shape/format/noise changes rebuild the synthesizer."""
+        rebuild = False
+        for k, v in params.items():
+            if not hasattr(self._cfg, k):
+                raise KeyError(f"unknown simulator parameter {k!r}")
+            setattr(self._cfg, k, v)
+            rebuild |= k not in ("fps", "ions_per_frame", "amplitude", "amplitude_spread")
+        if self._synth is not None:
+            if rebuild:
+                self._synth = IonFrameSynthesizer(self._cfg)
+            if "fps" in params and self._acquiring:
+                self.start()  # restart the sensor clock
+
+    def grab(self, timeout_ms: int) -> Optional[CameraFrame]:
+        if self._synth is None or not self._acquiring:
+            return None
+        period = 1.0 / float(self._cfg.fps)
+        now = time.perf_counter()
+
+        # free-running sensor: skip frames the caller was too late for
+        due = self._t0 + self._next_index * period
+        if now - due > period:
+            self._next_index = int((now - self._t0) / period)
+            due = self._t0 + self._next_index * period
+
+        wait = due - now
+        if wait > timeout_ms / 1000.0:
+            time.sleep(timeout_ms / 1000.0)
+            return None
+        if wait > 0:
+            time.sleep(wait)
+
+        image, truth = self._synth.render()
+        frame = CameraFrame(
+            image=image,
+            frame_index=self._next_index,
+            timestamp=time.time(),
+            meta={"truth": truth, "pixel_format": self._cfg.pixel_format},
+        )
+        self._next_index += 1
+        return frame
+
+
+def score_hits(
+    truth_xy: np.ndarray, det_x: np.ndarray, det_y: np.ndarray, tol_px: float = 1.5
+) -> Dict[str, float]:
+    """
+    Greedy nearest-neighbour match of detections to ground truth.
+    Returns counts (tp/fp/fn), precision, recall and the mean position error.
+    """
+    det = np.stack([np.asarray(det_x, np.float32), np.asarray(det_y, np.float32)], axis=1)
+    nt, nd = len(truth_xy), len(det)
+    if nt == 0 or nd == 0:
+        return {"tp": 0, "fp": nd, "fn": nt, "precision": float(nd == 0),
+                "recall": float(nt == 0), "mean_err_px": float("nan")}
+
+    d = np.hypot(truth_xy[:, None, 0] - det[None, :, 0], truth_xy[:, None, 1] - det[None, :, 1])
+    ti, di = np.nonzero(d <= tol_px)
+    order = np.argsort(d[ti, di], kind="stable")
+    used_t = np.zeros(nt, bool)
+    used_d = np.zeros(nd, bool)
+    errs = []
+    for t, k in zip(ti[order], di[order]):
+        if not used_t[t] and not used_d[k]:
+            used_t[t] = used_d[k] = True
+            errs.append(d[t, k])
+
+    tp = len(errs)
+    return {
+        "tp": tp,
+        "fp": nd - tp,
+        "fn": nt - tp,
+        "precision": tp / nd,
+        "recall": tp / nt,
+        "mean_err_px": float(np.mean(errs)) if errs else float("nan"),
+    }
@@ -0,0 +1,63 @@
+from __future__ import annotations
+import random
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from LabviewToPython.devices.base import PolledPressureSensor
+
+
+class SimulatedGauge(PolledPressureSensor):
+    """
+    Hardware-free stand-in for a serial gauge: each reply arrives latency_s
+    after its request. stuck=True makes the gauge stop answering and every
+    response() block for its full timeout, like an unplugged COM port;
+    hung=True makes response() ignore its timeout and block until hung is
+    cleared, like a driver wedged in a read.
+    """
+    def __init__(
+        self,
+        pressure_pa: float = 1.0e-4,
+        latency_s: float = 0.02,
+        noise: float = 0.01,
+        pipeline_depth: int = 1,
+        stuck: bool = False,
+        hung: bool = False,
+    ) -> None:
+        self.pressure_pa = pressure_pa
+        self.latency_s = latency_s
+        self.noise = noise
+        self.pipeline_depth = max(1, int(pipeline_depth))
+        self.stuck = stuck
+        self.hung = hung
+        self._pending: Deque[float] = deque()
+        self.requests = 0
+
+    def connect(self) -> None:
+        self._pending.clear()
+
+    def close(self) -> None:
+        self._pending.clear()
+
+    def request(self) -> None:
+        self.requests += 1
+        self._pending.append(time.perf_counter() + self.latency_s)
+
+    def response(self, timeout_s: float) -> Optional[float]:
+        while self.hung:
+            time.sleep(0.05)
+        if self.stuck or not self._pending:
+            time.sleep(timeout_s)
+            self._pending.clear()
+            return None
+        due = self._pending.popleft()
+        wait = due - time.perf_counter()
+        if wait > timeout_s:
+            time.sleep(timeout_s)
+            return None
+        if wait > 0:
+            time.sleep(wait)
+        return self.pressure_pa * (1.0 + random.gauss(0.0, self.noise))
+
+    def info(self) -> Dict[str, Any]:
+        return {"model": "simulated", "latency_s": self.latency_s, "stuck": self.stuck, "hung": self.hung}
@@ -0,0 +1,207 @@
+from __future__ import annotations
+import time
+from typing import Any, Optional, Tuple
+
+from LabviewToPython.devices.base import Camera, CameraFrame
+
+
+class SpinnakerCamera(Camera):
+    """
+    FLIR/Teledyne camera via PySpin (Blackfly S etc.).
+    Same setup as test/test2.py: NewestOnly stream buffers, continuous
+    acquisition, manual exposure and gain, Mono8 if possible.
+
+    roi=(x, y, w, h) programs the sensor ROI, so only that region is read out
+    and sent over USB; frames (and hit coordinates) are relative to it.
+    """
+    def __init__(
+        self,
+        index: int = 0,
+        exposure_us: float = 2000.0,
+        gain: float = 25.0,
+        force_mono8: bool = True,
+        roi: Optional[Tuple[int, int, int, int]] = None,
+    ) -> None:
+        self._index = index
+        self._exposure_us = float(exposure_us)
+        self._gain = float(gain)
+        self._force_mono8 = force_mono8
+        self._roi = tuple(int(v) for v in roi) if roi is not None else None
+
+        self._ps: Any = None            # PySpin module, imported on open()
+        self._system: Any = None
+        self._cam_list: Any = None
+        self._cam: Any = None
+        self._acquiring = False
+        self._frame_index = 0
+
+    # ---- lifecycle ----
+    def open(self) -> None:
+        try:
+            import PySpin
+        except ImportError as e:
+            raise RuntimeError("PySpin is not installed (see README, 'Installing PySpin').") from e
+        self._ps = PySpin
+
+        self._system = PySpin.System.GetInstance()
+        self._cam_list = self._system.GetCameras()
+        if self._cam_list.GetSize() <= self._index:
+            self.close()
+            raise RuntimeError("No camera detected. Check USB / Spinnaker install / permissions.")
+
+        self._cam = self._cam_list.GetByIndex(self._index)
+        self._cam.Init()
+
+        self._set_enum(self._cam.GetTLStreamNodeMap(), "StreamBufferHandlingMode", "NewestOnly")
+        self._set_enum(self._cam.GetNodeMap(), "AcquisitionMode", "Continuous")
+
+        if self._force_mono8 and self._cam.PixelFormat.GetAccessMode() == PySpin.RW:
+            try:
+                self._cam.PixelFormat.SetValue(PySpin.PixelFormat_Mono8)
+            except Exception:
+                pass  # keep the camera's format
+
+        self._apply_roi()
+        self._apply_exposure()
+
+    def start(self) -> None:
+        if self._cam is None or self._acquiring:
+            return
+        self._cam.BeginAcquisition()
+        self._acquiring = True
+
+    def stop(self) -> None:
+        if self._cam is None or not self._acquiring:
+            return
+        try:
+            self._cam.EndAcquisition()
+        finally:
+            self._acquiring = False
+
+    def close(self) -> None:
+        try:
+            self.stop()
+        except Exception:
+            pass
+        try:
+            if self._cam is not None:
+                self._cam.DeInit()
+        except Exception:
+            pass
+        # release references in this order (important with PySpin)
+        self._cam = None
+        try:
+            if self._cam_list is not None:
+                self._cam_list.Clear()
+        except Exception:
+            pass
+        self._cam_list = None
+        try:
+            if self._system is not None:
+                self._system.ReleaseInstance()
+        except Exception:
+            pass
+        self._system = None
+
+    # ---- parameters ----
+    def set_params(self, **params: Any) -> None:
+        """Supported: exposure_us, gain, roi ((x, y, w, h) or None for full sensor)."""
+        if "exposure_us" in params:
+            self._exposure_us = float(params["exposure_us"])
+        if "gain" in params:
+            self._gain = float(params["gain"])
+        if "roi" in params:
+            roi = params["roi"]
+            self._roi = tuple(int(v) for v in roi) if roi is not None else None
+        if self._cam is None:
+            return
+        if "roi" in params:
+            # Width/Height are locked while acquiring
+            was_acquiring = self._acquiring
+            self.stop()
+            self._apply_roi()
+            if was_acquiring:
+                self.start()
+        self._apply_exposure()
+
+    @property
+    def roi(self) -> Optional[Tuple[int, int, int, int]]:
+        """Sensor ROI actually programmed (after increment rounding), None = full sensor."""
+        return self._roi
+
+    # ---- acquisition ----
+    def grab(self, timeout_ms: int) -> Optional[CameraFrame]:
+        if self._cam is None or not self._acquiring:
+            return None
+        try:
+            img = self._cam.GetNextImage(int(timeout_ms))
+        except self._ps.SpinnakerException:
+            return None  # timeout
+        try:
+            if img.IsIncomplete():
+                return None
+            # copy: the driver buffer is reused as soon as it is released
+            image = img.GetNDArray().copy()
+        finally:
+            img.Release()
+
+        frame = CameraFrame(image=image, frame_index=self._frame_index, timestamp=time.time())
+        self._frame_index += 1
+        return frame
+
+    # ---- helpers ----
+    def _apply_exposure(self) -> None:
+        PySpin = self._ps
+        cam = self._cam
+        if cam.ExposureAuto.GetAccessMode() == PySpin.RW:
+            cam.ExposureAuto.SetValue(PySpin.ExposureAuto_Off)
+            time.sleep(0.05)
+        if cam.ExposureTime.GetAccessMode() == PySpin.RW:
+            exp = max(float(cam.ExposureTime.GetMin()), min(float(cam.ExposureTime.GetMax()), self._exposure_us))
+            cam.ExposureTime.SetValue(exp)
+        if cam.Gain.GetAccessMode() == PySpin.RW:
+            cam.Gain.SetValue(max(float(cam.Gain.GetMin()), min(float(cam.Gain.GetMax()), self._gain)))
+
+    def _apply_roi(self) -> None:
+        PySpin = self._ps
+        cam = self._cam
+        if cam.Width.GetAccessMode() != PySpin.RW or cam.Height.GetAccessMode() != PySpin.RW:
+            return
+        # offsets first to 0, so any Width/Height up to the sensor size is accepted
+        for node in (cam.OffsetX, cam.OffsetY):
+            if node.GetAccessMode() == PySpin.RW:
+                node.SetValue(0)
+        if self._roi is None:
+            cam.Width.SetValue(cam.Width.GetMax())
+            cam.Height.SetValue(cam.Height.GetMax())
+            return
+
+        x, y, w, h = self._roi
+        w = self._fit(cam.Width, w)
+        h = self._fit(cam.Height, h)
+        cam.Width.SetValue(w)
+        cam.Height.SetValue(h)
+        # the offset range depends on the size just set
+        x = self._fit(cam.OffsetX, x) if cam.OffsetX.GetAccessMode() == PySpin.RW else 0
+        y = self._fit(cam.OffsetY, y) if cam.OffsetY.GetAccessMode() == PySpin.RW else 0
+        if x:
+            cam.OffsetX.SetValue(x)
+        if y:
+            cam.OffsetY.SetValue(y)
+        self._roi = (x, y, w, h)
+
+    @staticmethod
+    def _fit(node: Any, value: int) -> int:
+        """Clamp to the node range and round down to its increment."""
+        lo, hi = int(node.GetMin()), int(node.GetMax())
+        inc = max(1, int(node.GetInc()))
+        value = max(lo, min(hi, int(value)))
+        return lo + (value - lo) // inc * inc
+
+    def _set_enum(self, nodemap: Any, node: str, entry: str) -> None:
+        PySpin = self._ps
+        n = PySpin.CEnumerationPtr(nodemap.GetNode(node))
+        if PySpin.IsReadable(n) and PySpin.IsWritable(n):
+            e = n.GetEntryByName(entry)
+            if PySpin.IsReadable(e):
+                n.SetIntValue(e.GetValue())
@@ -1,7 +1,19 @@
-from typing import List
-from LabviewToPython.core.interfaces.i_module import IModule
+import importlib
+from typing import List, Type, Union
+from LabviewToPython.core.abstractions.i_module import IModule
 from LabviewToPython.modules.registry import MODULES
 
+ModuleRef = Union[str, Type[IModule]]
+
+def load_entry_point(ref: ModuleRef) -> Type[IModule]:
+    """'package.module:Class' -> class (imports the module); classes pass through."""
+    if not isinstance(ref, str):
+        return ref
+    module_name, _, attr = ref.partition(":")
+    if not attr:
+        raise ValueError(f"entry point {ref!r} must look like 'package.module:Class'")
+    return getattr(importlib.import_module(module_name), attr)
+
 def discover_modules() -> List[IModule]:
     """Instantiate all modules without args; bus kommt in start(ctx)."""
-    return [cls() for cls in MODULES]
+    return [load_entry_point(ref)() for ref in MODULES]
@@ -1,8 +1,8 @@
 from __future__ import annotations
 from typing import Optional
-from LabviewToPython.core.interfaces.i_eventbus import IEventBus
+from LabviewToPython.core.abstractions.i_eventbus import IEventBus
 from LabviewToPython.core.types.host import AppContext, HostServices
-from LabviewToPython.core.interfaces.i_module import IModule, IDockModule, IMenuModule
+from LabviewToPython.core.abstractions.i_module import IModule, IDockModule, IMenuModule
 
 class ModuleBase(IModule):
     def __init__(self) -> None:
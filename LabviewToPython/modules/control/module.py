@@ -3,12 +3,13 @@ from typing import List
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QWidget
 from LabviewToPython.core.events.eventbus import IEventBus
-from LabviewToPython.core.interfaces.i_module import IModule
 from LabviewToPython.core.types.host import DockSpec
 from LabviewToPython.modules.common.bases import DockModuleBase
 from LabviewToPython.modules.control.control_view import ControlRootView
 
 class ControlModule(DockModuleBase):
+    thread_safe_start = True   # start() creates no Qt objects
+
     def __init__(self) -> None:
         super().__init__()
 
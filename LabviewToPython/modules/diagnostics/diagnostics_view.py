@@ -0,0 +1,93 @@
+from __future__ import annotations
+import time
+from typing import Any, Dict, List, Sequence
+from PySide6.QtWidgets import (
+    QFileDialog, QHBoxLayout, QHeaderView, QLabel, QPlainTextEdit, QPushButton,
+    QSplitter, QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget,
+)
+from PySide6.QtCore import Qt
+from LabviewToPython.modules.diagnostics.diagnostics_vm import DiagnosticsViewModel
+
+HANDLER_COLUMNS = ("topic", "handler", "rate_hz", "calls", "p50_ms", "p99_ms", "max_ms", "errors", "last_error")
+TOPIC_COLUMNS = ("topic", "rate_hz", "published")
+QUEUE_COLUMNS = ("topic", "handler", "mode", "depth", "max_depth", "lag_s", "max_lag_s", "dropped", "coalesced")
+
+class DiagnosticsRootView(QWidget):
+    """Live bus rates, slowest handlers first, queued subscriber lag; last traceback of the selected handler."""
+    def __init__(self, vm: DiagnosticsViewModel, parent=None) -> None:
+        super().__init__(parent)
+        self._vm = vm
+        self._handlers: List[Dict[str, Any]] = []
+
+        lay = QVBoxLayout(self)
+        bar = QHBoxLayout(); lay.addLayout(bar)
+        self._status = QLabel("EventBus instrumentation" if vm.available else "Bus is not instrumentable")
+        bar.addWidget(self._status)
+        bar.addStretch(1)
+        btn_reset = QPushButton("Reset", self); btn_reset.clicked.connect(vm.reset)
+        btn_dump = QPushButton("Dump…", self); btn_dump.clicked.connect(self._dump)
+        bar.addWidget(btn_reset); bar.addWidget(btn_dump)
+
+        split = QSplitter(Qt.Orientation.Vertical, self); lay.addWidget(split, 1)
+        self._topics = self._table(TOPIC_COLUMNS)
+        self._handler_table = self._table(HANDLER_COLUMNS)
+        self._queues = self._table(QUEUE_COLUMNS)
+        self._traceback = QPlainTextEdit(self); self._traceback.setReadOnly(True)
+        self._traceback.setPlaceholderText("Select a handler to see its last traceback")
+        for w in (self._topics, self._handler_table, self._queues, self._traceback):
+            split.addWidget(w)
+        self._handler_table.itemSelectionChanged.connect(self._show_traceback)
+
+        vm.updated.connect(self._on_update)
+        vm.start()
+
+    def _table(self, columns: Sequence[str]) -> QTableWidget:
+        t = QTableWidget(0, len(columns), self)
+        t.setHorizontalHeaderLabels(list(columns))
+        t.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        t.horizontalHeader().setStretchLastSection(True)
+        t.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        t.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        t.verticalHeader().setVisible(False)
+        return t
+
+    @staticmethod
+    def _fill(table: QTableWidget, columns: Sequence[str], rows: List[Dict[str, Any]]) -> None:
+        table.setRowCount(len(rows))
+        for r, row in enumerate(rows):
+            for c, key in enumerate(columns):
+                v = row.get(key)
+                text = f"{v:.3g}" if isinstance(v, float) else ("" if v is None else str(v))
+                table.setItem(r, c, QTableWidgetItem(text))
+
+    def _on_update(self, data: Dict[str, Any]) -> None:
+        selected = self._selected_key()
+        self._handlers = sorted(data["handlers"], key=lambda h: h["p99_ms"], reverse=True)
+        self._fill(self._topics, TOPIC_COLUMNS, data["topics"])
+        self._fill(self._handler_table, HANDLER_COLUMNS, self._handlers)
+        self._fill(self._queues, QUEUE_COLUMNS, [s for s in data["subscribers"] if s["mode"] != "sync"])
+        for r, h in enumerate(self._handlers):
+            if (h["topic"], h["handler"]) == selected:
+                self._handler_table.selectRow(r)
+        total = sum(t["rate_hz"] for t in data["topics"])
+        errors = sum(h["errors"] for h in self._handlers)
+        self._status.setText(f"{total:.0f} msg/s  {len(data['topics'])} topics  {errors} handler errors")
+
+    def _selected_key(self):
+        rows = self._handler_table.selectionModel().selectedRows()
+        if not rows or rows[0].row() >= len(self._handlers):
+            return None
+        h = self._handlers[rows[0].row()]
+        return (h["topic"], h["handler"])
+
+    def _show_traceback(self) -> None:
+        rows = self._handler_table.selectionModel().selectedRows()
+        if rows and rows[0].row() < len(self._handlers):
+            self._traceback.setPlainText(self._handlers[rows[0].row()]["last_traceback"] or "")
+
+    def _dump(self) -> None:
+        default = time.strftime("bus_stats_%Y%m%d_%H%M%S.json")
+        path, _ = QFileDialog.getSaveFileName(self, "Dump bus statistics", default, "JSON (*.json)")
+        if path:
+            self._vm.dump(path)
+            self._status.setText(f"Wrote {path}")
@@ -0,0 +1,60 @@
+from __future__ import annotations
+from typing import Any, Dict, Optional
+from PySide6.QtCore import QObject, QTimer, Signal
+from LabviewToPython.core.abstractions.i_eventbus import IEventBus
+from LabviewToPython.core.events.instrumentation import BusInstrumentation
+
+REFRESH_MS = 1000
+
+class DiagnosticsViewModel(QObject):
+    """
+    Polls the bus instrumentation once per REFRESH_MS and emits the snapshot.
+    Instrumentation costs every publish, so it is only switched on by start()
+    (the view calls it when the dock is first shown) and off again by stop().
+    """
+    updated = Signal(object)   # Dict[str, Any]: BusInstrumentation.snapshot() + "subscribers"
+
+    def __init__(self, bus: IEventBus) -> None:
+        super().__init__()
+        self._bus = bus
+        # only EventBus can be instrumented; other IEventBus implementations show nothing
+        self._instrument = getattr(bus, "instrument", None)
+        self._instr: Optional[BusInstrumentation] = None
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+
+    @property
+    def available(self) -> bool:
+        return self._instrument is not None
+
+    def start(self) -> None:
+        if not self.available:
+            return
+        if self._instr is None:
+            self._instr = self._instrument()
+        self._timer.start(REFRESH_MS)
+
+    def stop(self) -> None:
+        self._timer.stop()
+        if self._instr is not None:
+            self._instrument(False)
+            self._instr = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        if self._instr is None:
+            return {"topics": [], "handlers": [], "subscribers": []}
+        data = self._instr.snapshot()
+        data["subscribers"] = [vars(s) for s in self._bus.subscriber_stats()]   # type: ignore[attr-defined]
+        return data
+
+    def refresh(self) -> None:
+        self.updated.emit(self.snapshot())
+
+    def reset(self) -> None:
+        if self._instr is not None:
+            self._instr.reset()
+        self.refresh()
+
+    def dump(self, path: str) -> None:
+        if self._instr is not None:
+            self._instr.dump(path, extra={"subscribers": self.snapshot()["subscribers"]})
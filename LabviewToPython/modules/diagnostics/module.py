@@ -0,0 +1,45 @@
+from __future__ import annotations
+from typing import List, Optional
+from PySide6.QtCore import Qt
+from LabviewToPython.core.types.host import AppContext, DockSpec
+from LabviewToPython.modules.common.bases import DockModuleBase
+from LabviewToPython.modules.diagnostics.diagnostics_view import DiagnosticsRootView
+from LabviewToPython.modules.diagnostics.diagnostics_vm import DiagnosticsViewModel
+
+class DiagnosticsModule(DockModuleBase):
+    """
+    Shows EventBus instrumentation in a dock. The dock starts hidden (View
+    menu); instrumentation is switched on the first time it is shown and
+    stays on until the module stops.
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self._vm: Optional[DiagnosticsViewModel] = None
+
+    @property
+    def module_id(self) -> str: return "diagnostics"
+    @property
+    def display_name(self) -> str: return "Diagnostics"
+
+    @property
+    def vm(self) -> DiagnosticsViewModel:
+        assert self._vm is not None, "DiagnosticsModule.vm accessed before start(ctx)"
+        return self._vm
+
+    def start(self, ctx: AppContext) -> None:
+        super().start(ctx)
+        self._vm = DiagnosticsViewModel(ctx.bus)
+
+    def stop(self) -> None:
+        if self._vm is not None:
+            self._vm.stop()
+
+    def create_docks(self) -> List[DockSpec]:
+        return [DockSpec(
+            object_name="dock_diagnostics",
+            title="Diagnostics",
+            factory=lambda p: DiagnosticsRootView(self.vm, p),
+            area=Qt.DockWidgetArea.BottomDockWidgetArea,
+            lazy=True,      # the view starts the VM, which switches instrumentation on
+            visible=False,  # so a normal start runs uninstrumented
+        )]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from PySide6.QtCore import QObject
+from LabviewToPython.core.di.container import Container
 from LabviewToPython.core.events.eventbus import IEventBus
 from LabviewToPython.services.interfaces import ICameraService, IAnalysisService, IDataStore
 
@@ -9,6 +10,11 @@ class MeasureViewModel(QObject):
         super().__init__()
         self._bus = bus
 
+    @property
+    def camera(self) -> ICameraService:
+        """Constructed on first access (see MeasurementModule.start)."""
+        return Container.get(ICameraService)
+
     @property
     def title(self) -> str:
         return "Measurement"
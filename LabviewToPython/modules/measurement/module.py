@@ -4,10 +4,13 @@ from __future__ import annotations
 from typing import List, Optional
 from PySide6.QtCore import Qt
 
+from LabviewToPython.core.di.container import Container
 from LabviewToPython.core.types.host import DockSpec, AppContext
 from LabviewToPython.modules.common.bases import DockModuleBase
 from LabviewToPython.modules.measurement.measure_view import MeasurementView
 from LabviewToPython.modules.measurement.measure_vm import MeasureViewModel
+from LabviewToPython.services.camera_dummy import DummyCameraService
+from LabviewToPython.services.interfaces import ICameraService
 
 
 class MeasurementModule(DockModuleBase):
@@ -20,6 +23,11 @@ class MeasurementModule(DockModuleBase):
         super().__init__()
         self._measurement_vm: Optional[MeasureViewModel] = None
 
+    @property
+    def module_id(self) -> str: return "measurement"
+    @property
+    def display_name(self) -> str: return "Measurement"
+
     @property
     def measurement_vm(self) -> MeasureViewModel:
         assert self._measurement_vm is not None, "MeasureViewModel not initialized."
@@ -28,6 +36,10 @@ class MeasurementModule(DockModuleBase):
     # lifecycle: services / VM init
     def start(self, ctx: AppContext) -> None:
         super().start(ctx)
+        # Lazy: the camera is opened by whoever needs it first. A setup with a real
+        # device registers ICameraService (e.g. CameraService) before start_all().
+        if not Container.is_registered(ICameraService):
+            Container.register_singleton(ICameraService, DummyCameraService)
         # If your VM does not take bus/host, drop the args accordingly.
         self._measurement_vm = MeasureViewModel(bus=self.bus)
 
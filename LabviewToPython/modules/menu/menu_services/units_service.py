@@ -1,28 +1,51 @@
 from __future__ import annotations
-from LabviewToPython.core.enums.length_system import LengthSystem
-from LabviewToPython.core.enums.pressure_unit import PressureUnit
+from PySide6.QtCore import QSettings
+from LabviewToPython.core.domain.enums.units.length_system import LengthSystem
+from LabviewToPython.core.domain.enums.units.pressure_unit import PressureUnit
+from LabviewToPython.core.domain.quantities.units_context import UNITS, UnitsContext, UnitsListener
 
-class UnitsService:
+KEY_LENGTH = "units/length_system"
+KEY_PRESSURE = "units/pressure_unit"
 
-    def __init__(self) -> None:
-        self._length = LengthSystem.METRIC
-        self._pressure = PressureUnit.BAR
+class UnitsService:
+    """
+    Settings front end of a UnitsContext: loads the saved units once, writes
+    changes back to QSettings. Quantities only ever read the context.
+    """
+    def __init__(self, context: UnitsContext = UNITS) -> None:
+        self._ctx = context
+        s = QSettings()
+        self._ctx.set_length_system(_read(s, KEY_LENGTH, LengthSystem, context.length_system))
+        self._ctx.set_pressure_unit(_read(s, KEY_PRESSURE, PressureUnit, context.pressure_unit))
 
     @property
+    def context(self) -> UnitsContext:
+        return self._ctx
+
     def length_system(self) -> LengthSystem:
-        return self._length
-    @length_system.setter
-    def length_system(self, system: LengthSystem) -> None:
-        if system == self._length: return
-        self._length = system
+        return self._ctx.length_system
+
+    def set_length_system(self, system: LengthSystem) -> None:
+        if system == self._ctx.length_system: return
+        self._ctx.set_length_system(system)
+        QSettings().setValue(KEY_LENGTH, system.value)
 
-    @property
     def pressure_unit(self) -> PressureUnit:
-        return self._pressure
-    @pressure_unit.setter
-    def pressure_unit(self, unit: PressureUnit) -> None:
-        if unit == self._pressure: return
-        self._pressure = unit
-    
-
-    
+        return self._ctx.pressure_unit
+
+    def set_pressure_unit(self, unit: PressureUnit) -> None:
+        if unit == self._ctx.pressure_unit: return
+        self._ctx.set_pressure_unit(unit)
+        QSettings().setValue(KEY_PRESSURE, unit.value)
+
+    def subscribe(self, listener: UnitsListener) -> None:
+        self._ctx.subscribe(listener)
+
+    def unsubscribe(self, listener: UnitsListener) -> None:
+        self._ctx.unsubscribe(listener)
+
+def _read(s: QSettings, key: str, enum: type, default):
+    try:
+        return enum(str(s.value(key, default.value)))
+    except ValueError:
+        return default
@@ -27,7 +27,6 @@ class MenuModule(MenuModuleBase):
         super().__init__()
         # private Optionals
         self._theme: Optional[ThemeService] = None
-        self._units: Optional[UnitsService] = None
         self._layout: Optional[LayoutService] = None
 
         self._app_vm: Optional[AppSettingsViewModel] = None
@@ -36,6 +35,11 @@ class MenuModule(MenuModuleBase):
         self._app_dlg: Optional[AppSettingsDialog] = None
         self._layout_dlg: Optional[LayoutDialog] = None
 
+    @property
+    def module_id(self) -> str: return "menu"
+    @property
+    def display_name(self) -> str: return "Menu"
+
     # ------- Non-optional Properties with guards -------
     @property
     def theme(self) -> ThemeService:
@@ -44,8 +48,7 @@ class MenuModule(MenuModuleBase):
 
     @property
     def units(self) -> UnitsService:
-        assert self._units is not None, "UnitsService not initialized (call start(ctx) first)."
-        return self._units
+        return Container.get(UnitsService)
 
     @property
     def layout(self) -> LayoutService:
@@ -65,10 +68,11 @@ class MenuModule(MenuModuleBase):
     # ------- Lifecycle -------
     def start(self, ctx: AppContext) -> None:
         super().start(ctx)
-        self._theme = ThemeService()
-        self._units = UnitsService()
-        # global & typ-sicher registrieren
-        Container.register(UnitsService, self._units)
+        self._theme = ThemeService()   # applies the palette, so before the first paint
+        # global & typ-sicher registrieren; built right away on purpose: the constructor
+        # loads the saved units into UNITS, which must happen before the first paint
+        Container.register_singleton(UnitsService)
+        Container.get(UnitsService)
 
     def install_menus(self) -> None:
         # Services/VMs, die den Host brauchen:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from PySide6.QtCore import QObject, Signal, Slot
-from LabviewToPython.core.enums.length_system import LengthSystem
-from LabviewToPython.core.enums.pressure_unit import PressureUnit
+from LabviewToPython.core.domain.enums.units.length_system import LengthSystem
+from LabviewToPython.core.domain.enums.units.pressure_unit import PressureUnit
 from ..menu_services.units_service import UnitsService
 
 class UnitsViewModel():
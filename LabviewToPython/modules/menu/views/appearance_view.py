@@ -2,7 +2,7 @@ from __future__ import annotations
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PySide6.QtCore import Qt
 
-from LabviewToPython.designs.buttons.dual_button import DualChoiceButton
+from LabviewToPython.ui.designs.buttons.dual_button import DualChoiceButton
 
 from ..viewmodels.appearance_vm import AppearanceViewModel
 
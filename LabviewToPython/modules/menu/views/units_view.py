@@ -2,10 +2,10 @@ from __future__ import annotations
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QPushButton, QButtonGroup
 from PySide6.QtCore import Qt
 
-from LabviewToPython.designs.buttons.dual_button import DualChoiceButton
+from LabviewToPython.ui.designs.buttons.dual_button import DualChoiceButton
 
 from ..viewmodels.units_vm import UnitsViewModel
-from LabviewToPython.core.enums.pressure_unit import PressureUnit
+from LabviewToPython.core.domain.enums.units.pressure_unit import PressureUnit
 
 # Pfad so lassen, wie dein Ordner heißt:
 
@@ -7,6 +7,8 @@ from LabviewToPython.modules.common.bases import DockModuleBase
 from LabviewToPython.modules.pressure.pressure_view import PressureRootView
 
 class PressureModule(DockModuleBase):
+    thread_safe_start = True   # start() creates no Qt objects
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -1,15 +1,12 @@
-from typing import List, Type
-from LabviewToPython.core.interfaces.i_module import IModule
-from LabviewToPython.modules.measurement.module import MeasurementModule
-from LabviewToPython.modules.scan.module import ScanModule
-from LabviewToPython.modules.pressure.module import PressureModule
-from LabviewToPython.modules.control.module import ControlModule
-from LabviewToPython.modules.menu.module import MenuModule
+from typing import List
 
-MODULES: List[Type[IModule]] = [
-    MeasurementModule,
-    ScanModule,
-    PressureModule,
-    ControlModule,
-    MenuModule,   # Menüs nach den Docks
+# "package.module:Class" entry points; importing the registry imports no module,
+# ModuleManager.load_all() imports all of them at startup.
+MODULES: List[str] = [
+    "LabviewToPython.modules.measurement.module:MeasurementModule",
+    "LabviewToPython.modules.scan.module:ScanModule",
+    "LabviewToPython.modules.pressure.module:PressureModule",
+    "LabviewToPython.modules.control.module:ControlModule",
+    "LabviewToPython.modules.diagnostics.module:DiagnosticsModule",
+    "LabviewToPython.modules.menu.module:MenuModule",   # Menüs nach den Docks
 ]
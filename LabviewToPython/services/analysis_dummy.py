@@ -1,6 +1,7 @@
 from __future__ import annotations
 from LabviewToPython.services.interfaces import IAnalysisService
 from LabviewToPython.core.events.eventbus import IEventBus
+from LabviewToPython.core.events.topics import ANALYSIS_RESULT, AnalysisResult
 
 class DummyAnalysisService(IAnalysisService):
     def __init__(self, bus: IEventBus) -> None:
@@ -8,4 +9,4 @@ class DummyAnalysisService(IAnalysisService):
 
     def submit_frame(self, frame: object) -> None:
         # No-op; in a real impl, compute cos^2(theta) and publish results
-        self._bus.publish("analysis/result", {"ok": True})
+        self._bus.publish(ANALYSIS_RESULT, AnalysisResult(ok=True))
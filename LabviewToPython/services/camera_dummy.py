@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Any
 from PySide6.QtCore import QObject, QThread, QTimer, Signal
 from LabviewToPython.core.events.eventbus import IEventBus
+from LabviewToPython.core.events.topics import CAMERA_HEARTBEAT, CameraHeartbeat
 from LabviewToPython.services.interfaces import ICameraService
 
 
@@ -26,7 +27,7 @@ class _CameraWorker(QObject):
 
     def _on_timeout(self) -> None:
         # Publish a lightweight heartbeat instead of real frames (scaffold)
-        self._bus.publish("camera/heartbeat", {"ok": True})
+        self._bus.publish(CAMERA_HEARTBEAT, CameraHeartbeat(ok=True))
 
 
 class DummyCameraService(ICameraService):
@@ -0,0 +1,163 @@
+from __future__ import annotations
+import time
+from typing import Any, Dict, Optional
+from PySide6.QtCore import QObject, QThread, Slot
+from LabviewToPython.core.events.eventbus import IEventBus
+from LabviewToPython.core.events.topics import CAMERA_FRAME, CAMERA_STATS
+from LabviewToPython.core.domain.enums.frame_policy import FramePolicy
+from LabviewToPython.devices.base import Camera, CameraFrame
+from LabviewToPython.services.frame_queue import BoundedFrameQueue
+from LabviewToPython.services.interfaces import ICameraService
+
+GRAB_TIMEOUT_MS = 1000
+STATS_INTERVAL_S = 1.0
+
+
+class _AcquisitionWorker(QObject):
+    """Runs in its own QThread: grab -> queue, nothing else."""
+    def __init__(self, camera: Camera, frames: BoundedFrameQueue[CameraFrame]) -> None:
+        super().__init__()
+        self._camera = camera
+        self._frames = frames
+        self._running = False
+        self.grabbed = 0
+        self.timeouts = 0
+        self.error: Optional[str] = None
+
+    @Slot()
+    def run(self) -> None:
+        self._running = True
+        try:
+            while self._running:
+                frame = self._camera.grab(GRAB_TIMEOUT_MS)
+                if frame is None:
+                    self.timeouts += 1
+                    continue
+                self.grabbed += 1
+                # BLOCK: bounded wait so stop() is honoured even if nobody consumes
+                self._frames.put(frame, timeout=GRAB_TIMEOUT_MS / 1000.0)
+        except Exception as e:
+            self.error = str(e)
+
+    def stop(self) -> None:
+        self._running = False
+
+
+class _DeliveryWorker(QObject):
+    """Runs in its own QThread: queue -> bus ('camera/frame'), plus periodic 'camera/stats'."""
+    def __init__(self, service: "CameraService") -> None:
+        super().__init__()
+        self._service = service
+        self._running = False
+
+    @Slot()
+    def run(self) -> None:
+        self._running = True
+        bus = self._service.bus
+        frames = self._service.frames
+        next_stats = time.monotonic() + STATS_INTERVAL_S
+        while self._running:
+            frame = frames.get(timeout=0.1)
+            if frame is not None:
+                bus.publish(CAMERA_FRAME, frame)
+            if time.monotonic() >= next_stats:
+                bus.publish(CAMERA_STATS, self._service.stats())
+                next_stats += STATS_INTERVAL_S
+
+    def stop(self) -> None:
+        self._running = False
+
+
+class CameraService(ICameraService):
+    """
+    Camera service for a real device (see devices/spinnaker_camera.py).
+
+    - Acquisition owns its own thread and only pushes into a BoundedFrameQueue.
+    - A delivery thread publishes frames as 'camera/frame' (CameraFrame payload).
+      Set publish=False to pull from `frames` directly instead.
+    - policy decides what happens when consumers fall behind (FramePolicy);
+      skipped frames are counted and published with 'camera/stats'.
+    """
+    def __init__(
+        self,
+        bus: IEventBus,
+        camera: Camera,
+        policy: FramePolicy = FramePolicy.NEWEST_ONLY,
+        max_queued: int = 4,
+        publish: bool = True,
+    ) -> None:
+        self._bus = bus
+        self._camera = camera
+        self._frames: BoundedFrameQueue[CameraFrame] = BoundedFrameQueue(max_queued, policy)
+        self._publish = publish
+
+        self._acq_thread = QThread()
+        self._acq = _AcquisitionWorker(camera, self._frames)
+        self._acq.moveToThread(self._acq_thread)
+        self._acq_thread.started.connect(self._acq.run)
+
+        self._del_thread = QThread()
+        self._del = _DeliveryWorker(self)
+        self._del.moveToThread(self._del_thread)
+        self._del_thread.started.connect(self._del.run)
+
+        self._opened = False
+
+    @property
+    def bus(self) -> IEventBus:
+        return self._bus
+
+    @property
+    def frames(self) -> BoundedFrameQueue[CameraFrame]:
+        return self._frames
+
+    def open(self) -> None:
+        if not self._opened:
+            self._camera.open()
+            self._opened = True
+
+    def start(self) -> None:
+        if self._acq_thread.isRunning():
+            return
+        self.open()
+        self._frames.reopen()
+        self._camera.start()
+        self._acq_thread.start()
+        if self._publish:
+            self._del_thread.start()
+
+    def stop(self) -> None:
+        if self._acq_thread.isRunning():
+            # worker loop runs without an event loop: stop it directly, then join
+            self._acq.stop()
+            self._frames.close()
+            self._acq_thread.quit()
+            self._acq_thread.wait()
+            self._camera.stop()
+        if self._del_thread.isRunning():
+            self._del.stop()
+            self._del_thread.quit()
+            self._del_thread.wait()
+
+    def close(self) -> None:
+        self.stop()
+        if self._opened:
+            self._camera.close()
+            self._opened = False
+
+    def set_params(self, **params: Any) -> None:
+        self._camera.set_params(**params)
+
+    def stats(self) -> Dict[str, Any]:
+        q = self._frames.stats
+        return {
+            "policy": self._frames.policy.value,
+            "grabbed": self._acq.grabbed,
+            "timeouts": self._acq.timeouts,
+            "delivered": q.delivered,
+            "skipped": q.dropped,
+            "queued": q.depth,
+            "max_queued": q.max_depth,
+            "blocked_s": q.blocked_s,
+            "error": self._acq.error,
+        }
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Any, Dict
 from LabviewToPython.services.interfaces import IDataStore
 from LabviewToPython.core.events.eventbus import IEventBus
+from LabviewToPython.core.events.topics import STORE_META, STORE_RESULT, StoreWritten
 
 class DummyDataStore(IDataStore):
     def __init__(self, bus: IEventBus) -> None:
@@ -9,7 +10,7 @@ class DummyDataStore(IDataStore):
 
     def write_meta(self, record: Dict[str, Any]) -> None:
         # Scaffold: acknowledge write
-        self._bus.publish("store/meta", {"written": True})
+        self._bus.publish(STORE_META, StoreWritten())
 
     def write_result(self, record: Dict[str, Any]) -> None:
-        self._bus.publish("store/result", {"written": True})
+        self._bus.publish(STORE_RESULT, StoreWritten())
@@ -0,0 +1,101 @@
+from __future__ import annotations
+import time
+from collections import deque
+from dataclasses import dataclass
+from threading import Condition
+from typing import Deque, Generic, Optional, TypeVar
+
+from LabviewToPython.core.domain.enums.frame_policy import FramePolicy
+
+T = TypeVar("T")
+
+
+@dataclass
+class FrameQueueStats:
+    put: int = 0            # frames offered by the producer
+    delivered: int = 0      # frames taken by the consumer
+    dropped: int = 0        # frames skipped (replaced / discarded) by the policy
+    blocked_s: float = 0.0  # total time the producer waited (BLOCK policy)
+    depth: int = 0          # frames currently queued
+    max_depth: int = 0      # high-water mark
+
+
+class BoundedFrameQueue(Generic[T]):
+    """
+    Single-producer / single-consumer frame queue with a fixed capacity.
+
+    The policy decides what happens when the consumer falls behind:
+      - NEWEST_ONLY: capacity 1, a new frame replaces the queued one
+      - DROP_OLDEST: the oldest queued frame is discarded
+      - BLOCK:       put() waits for space (acquisition slows to the consumer)
+    Memory is bounded in every case; skipped frames are counted.
+    """
+    def __init__(self, maxsize: int = 4, policy: FramePolicy = FramePolicy.NEWEST_ONLY) -> None:
+        self._policy = FramePolicy(policy)
+        self._maxsize = 1 if self._policy == FramePolicy.NEWEST_ONLY else max(1, int(maxsize))
+        self._items: Deque[T] = deque()
+        self._cond = Condition()
+        self._stats = FrameQueueStats()
+        self._closed = False
+
+    @property
+    def policy(self) -> FramePolicy:
+        return self._policy
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def put(self, item: T, timeout: Optional[float] = None) -> bool:
+        """Offer a frame. Returns False only if BLOCK timed out or the queue is closed."""
+        with self._cond:
+            if self._closed:
+                return False
+            self._stats.put += 1
+            if len(self._items) >= self._maxsize:
+                if self._policy == FramePolicy.BLOCK:
+                    t0 = time.perf_counter()
+                    ok = self._cond.wait_for(
+                        lambda: self._closed or len(self._items) < self._maxsize, timeout
+                    )
+                    self._stats.blocked_s += time.perf_counter() - t0
+                    if not ok or self._closed:
+                        self._stats.dropped += 1
+                        return False
+                else:
+                    self._items.popleft()
+                    self._stats.dropped += 1
+            self._items.append(item)
+            self._stats.max_depth = max(self._stats.max_depth, len(self._items))
+            self._cond.notify_all()
+            return True
+
+    def get(self, timeout: Optional[float] = None) -> Optional[T]:
+        """Next frame, or None on timeout / after close()."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._closed or bool(self._items), timeout):
+                return None
+            if not self._items:
+                return None
+            item = self._items.popleft()
+            self._stats.delivered += 1
+            self._cond.notify_all()
+            return item
+
+    def close(self) -> None:
+        """Wake up both sides; further put() calls are rejected."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def reopen(self) -> None:
+        with self._cond:
+            self._closed = False
+            self._items.clear()
+
+    @property
+    def stats(self) -> FrameQueueStats:
+        with self._cond:
+            s = FrameQueueStats(**vars(self._stats))
+            s.depth = len(self._items)
+        return s
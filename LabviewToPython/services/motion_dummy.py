@@ -1,6 +1,7 @@
 from __future__ import annotations
 from LabviewToPython.services.interfaces import IMotionService
 from LabviewToPython.core.events.eventbus import IEventBus
+from LabviewToPython.core.events.topics import MOTION_POSITION, MotionPosition
 
 class DummyMotionService(IMotionService):
     def __init__(self, bus: IEventBus) -> None:
@@ -9,11 +10,11 @@ class DummyMotionService(IMotionService):
 
     def home(self) -> None:
         self._pos = 0.0
-        self._bus.publish("motion/position", {"position": self._pos})
+        self._bus.publish(MOTION_POSITION, MotionPosition(self._pos))
 
     def move_to(self, position: float) -> None:
         self._pos = float(position)
-        self._bus.publish("motion/position", {"position": self._pos})
+        self._bus.publish(MOTION_POSITION, MotionPosition(self._pos))
 
     def read_position(self) -> float:
         return self._pos
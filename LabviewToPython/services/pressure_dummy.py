@@ -1,6 +1,8 @@
 from __future__ import annotations
+import time
 from PySide6.QtCore import QObject, QThread, QTimer
 from LabviewToPython.core.events.eventbus import IEventBus
+from LabviewToPython.core.events.topics import PRESSURE_VALUE, PressureValue
 from LabviewToPython.services.interfaces import IPressureService
 
 class _PressureWorker(QObject):
@@ -24,7 +26,7 @@ class _PressureWorker(QObject):
     def _tick(self) -> None:
         # Publish synthetic value
         self._value *= 1.0  # keep constant in scaffold
-        self._bus.publish("pressure/value", {"channel": "dummy", "value": self._value, "unit": "Pa"})
+        self._bus.publish(PRESSURE_VALUE, PressureValue("dummy", self._value, "Pa", time.time()))
 
 class DummyPressureService(IPressureService):
     def __init__(self, bus: IEventBus) -> None:
@@ -0,0 +1,371 @@
+from __future__ import annotations
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from LabviewToPython.core.abstractions.i_eventbus import IEventBus
+from LabviewToPython.core.events.topics import (
+    PRESSURE_BATCH, PRESSURE_STATS, PRESSURE_VALUE, PressureBatch, PressureValue,
+)
+from LabviewToPython.devices.base import PolledPressureSensor
+from LabviewToPython.devices.mks500 import MKS500Gauge
+from LabviewToPython.services.interfaces import IPressureService
+
+PUBLISH_INTERVAL_S = 0.1
+STATS_INTERVAL_S = 1.0
+RECONNECT_S = 2.0
+STALL_AFTER = 3          # consecutive timeouts before a gauge counts as stalled
+JOIN_TIMEOUT_S = 2.0
+
+
+@dataclass
+class GaugeConfig:
+    channel: str
+    port: str
+    rate_hz: Optional[float] = None   # None: 1000 / interval_ms of start_polling()
+    baudrate: int = 9600
+    timeout_s: float = 0.5
+
+
+@dataclass
+class GaugeStats:
+    channel: str
+    port: str
+    target_hz: float
+    effective_hz: float = 0.0     # replies per second over the last stats interval
+    samples: int = 0
+    timeouts: int = 0
+    errors: int = 0
+    skipped: int = 0              # poll slots not issued: gauge still busy, or reconnecting
+    stalled: bool = False
+    last_pa: Optional[float] = None
+    last_latency_s: float = 0.0   # request -> reply
+    last_error: str = ""
+
+
+SensorFactory = Callable[[GaugeConfig], PolledPressureSensor]
+
+def mks500_factory(cfg: GaugeConfig) -> PolledPressureSensor:
+    """One MKS500Gauge (own serial.Serial) per config; RD carries no address, so one gauge per port."""
+    return MKS500Gauge(cfg.port, cfg.baudrate, cfg.timeout_s)
+
+
+class _Gauge:
+    """Scheduler-side state of one gauge; guarded by PressureService._lock."""
+    def __init__(self, cfg: GaugeConfig, sensor: PolledPressureSensor) -> None:
+        self.cfg = cfg
+        self.sensor = sensor
+        self.depth = max(1, int(getattr(sensor, "pipeline_depth", 1)))
+        self.period_s = 0.0
+        self.in_flight = 0
+        self.connected = False
+        self.retry_at = 0.0
+        self.consecutive_timeouts = 0
+        self.stats = GaugeStats(cfg.channel, cfg.port, 0.0)
+        self.rate_mark = (0.0, 0)      # (perf_counter, samples) at the last stats tick
+
+
+class _PortLane:
+    """
+    The only threads that touch one port: a writer sends requests as the
+    scheduler hands them over, a reader collects the replies in order, so
+    requests keep going out while an earlier reply is still awaited
+    (pipelining up to the gauge's depth). A port that hangs blocks only its
+    own lane; the scheduler keeps polling the other ports and counts the
+    slots it cannot issue here as skipped, and its watchdog reads the age of
+    the oldest unanswered request from waiting_since().
+    """
+    def __init__(self, port: str, service: "PressureService") -> None:
+        self.port = port
+        self._service = service
+        self._jobs: Deque[_Gauge] = deque()
+        self._sent: Deque[Tuple[_Gauge, float]] = deque()
+        self._reading: Optional[Tuple[_Gauge, float]] = None   # request whose reply is being read
+        self._cond = threading.Condition()
+        self._running = False
+        self._writer = threading.Thread(target=self._write_loop, name=f"pressure-{port}-tx", daemon=True)
+        self._reader = threading.Thread(target=self._read_loop, name=f"pressure-{port}-rx", daemon=True)
+
+    def start(self) -> None:
+        self._running = True
+        self._writer.start()
+        self._reader.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+    def join(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        for t in (self._writer, self._reader):
+            t.join(max(0.0, deadline - time.monotonic()))
+        alive = self._writer.is_alive() or self._reader.is_alive()
+        if not alive:
+            self._service._close_port(self.port)
+        return not alive
+
+    def submit(self, gauge: _Gauge) -> None:
+        with self._cond:
+            self._jobs.append(gauge)
+            self._cond.notify_all()
+
+    def _write_loop(self) -> None:
+        svc = self._service
+        while True:
+            with self._cond:
+                while self._running and not self._jobs:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                gauge = self._jobs.popleft()
+            try:
+                if not gauge.connected:
+                    gauge.sensor.connect()
+                    svc._connected(gauge)
+                gauge.sensor.request()
+            except Exception as e:
+                self._fail(gauge, 1, e)
+                continue
+            with self._cond:
+                self._sent.append((gauge, time.perf_counter()))
+                self._cond.notify_all()
+
+    def _read_loop(self) -> None:
+        svc = self._service
+        while True:
+            with self._cond:
+                while self._running and not self._sent:
+                    self._cond.wait()
+                if not self._sent:
+                    return
+                gauge, t_sent = self._reading = self._sent.popleft()
+            try:
+                pa = gauge.sensor.response(gauge.cfg.timeout_s)
+            except Exception as e:
+                self._reading = None
+                self._fail(gauge, 1 + self._drop(gauge), e)
+                continue
+            self._reading = None
+            svc._reply(gauge, pa, time.perf_counter() - t_sent)
+            if pa is None:
+                svc._release(gauge, self._drop(gauge))   # the reply stream is out of step
+
+    def waiting_since(self) -> Dict[_Gauge, float]:
+        """Send time of the oldest request per gauge that has no reply yet."""
+        with self._cond:
+            pending = list(self._sent)
+            if self._reading is not None:
+                pending.insert(0, self._reading)
+        since: Dict[_Gauge, float] = {}
+        for gauge, t_sent in pending:
+            since.setdefault(gauge, t_sent)
+        return since
+
+    def _drop(self, gauge: _Gauge) -> int:
+        """Forget requests still awaiting a reply from `gauge`."""
+        with self._cond:
+            kept = deque(e for e in self._sent if e[0] is not gauge)
+            n = len(self._sent) - len(kept)
+            self._sent = kept
+        return n
+
+    def _fail(self, gauge: _Gauge, lost: int, error: Exception) -> None:
+        try: gauge.sensor.close()
+        except Exception: pass
+        self._service._failed(gauge, lost, error)
+
+
+class PressureService(IPressureService):
+    """
+    Polls several request/response gauges (e.g. MKS 500 on COM ports).
+
+    - One scheduler thread issues polls at each gauge's own rate; every port
+      has its own I/O lane thread, so a stuck port only delays its gauges.
+      Gauges share a port only if their sensor_factory makes that possible
+      (addressed protocols); with mks500_factory every gauge needs its own.
+    - A gauge that is still busy when its next slot comes is not polled again
+      (no request pile-up); up to sensor.pipeline_depth requests are put on
+      the wire back to back before reading the replies.
+    - Every reply is bounded by GaugeConfig.timeout_s; after STALL_AFTER
+      consecutive timeouts the gauge is reported stalled, errors reconnect
+      after RECONNECT_S. A driver that ignores its timeout and never returns
+      is caught by the stats tick: a request unanswered for longer than
+      timeout_s (per pipelined request ahead of it) marks the gauge stalled too.
+    - Readings are published every publish_interval_s as one 'pressure/batch'
+      (PressureBatch) plus the newest value per channel on 'pressure/value';
+      'pressure/stats' carries GaugeStats per channel incl. the effective rate.
+    """
+    def __init__(
+        self,
+        bus: IEventBus,
+        gauges: Sequence[GaugeConfig] = (),
+        sensor_factory: SensorFactory = mks500_factory,
+        publish_interval_s: float = PUBLISH_INTERVAL_S,
+    ) -> None:
+        self._bus = bus
+        self._configs = list(gauges)
+        if sensor_factory is mks500_factory:
+            ports = [c.port for c in self._configs]
+            shared = sorted({p for p in ports if ports.count(p) > 1})
+            if shared:
+                raise ValueError(f"MKS 500 gauges cannot share a port (RD has no address): {', '.join(shared)}")
+        self._factory = sensor_factory
+        self._publish_interval_s = publish_interval_s
+        self._lock = threading.Lock()
+        self._gauges: List[_Gauge] = []
+        self._lanes: Dict[str, _PortLane] = {}
+        self._readings: List[PressureValue] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ---- IPressureService ----
+    def start_polling(self, interval_ms: int = 500) -> None:
+        if self._thread is not None:
+            return
+        default_hz = 1000.0 / max(1, interval_ms)
+        self._gauges = []
+        for cfg in self._configs:
+            g = _Gauge(cfg, self._factory(cfg))
+            g.period_s = 1.0 / (cfg.rate_hz or default_hz)
+            g.stats.target_hz = 1.0 / g.period_s
+            self._gauges.append(g)
+        self._lanes = {g.cfg.port: _PortLane(g.cfg.port, self) for g in self._gauges}
+        for lane in self._lanes.values():
+            lane.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._schedule, name="pressure-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop_polling(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        for lane in self._lanes.values():
+            lane.stop()
+        for lane in self._lanes.values():
+            lane.join(JOIN_TIMEOUT_S)   # a lane stuck in a driver call is left behind (daemon)
+        self._publish_readings()
+
+    def stats(self) -> Dict[str, GaugeStats]:
+        with self._lock:
+            return {g.cfg.channel: replace(g.stats) for g in self._gauges}
+
+    # ---- scheduler thread ----
+    def _schedule(self) -> None:
+        seq = itertools.count()
+        now = time.perf_counter()
+        heap: List[Tuple[float, int, _Gauge]] = [(now, next(seq), g) for g in self._gauges]
+        heapq.heapify(heap)
+        next_publish = now + self._publish_interval_s
+        next_stats = now + STATS_INTERVAL_S
+        for g in self._gauges:
+            g.rate_mark = (now, 0)
+
+        while not self._stop.is_set():
+            now = time.perf_counter()
+            while heap and heap[0][0] <= now:
+                due, _, g = heapq.heappop(heap)
+                self._poll(g, now)
+                nxt = due + g.period_s
+                if nxt <= now:   # fell behind: skip the missed slots instead of bursting
+                    missed = int((now - nxt) / g.period_s) + 1
+                    with self._lock:
+                        g.stats.skipped += missed
+                    nxt += missed * g.period_s
+                heapq.heappush(heap, (nxt, next(seq), g))
+            if now >= next_publish:
+                self._publish_readings()
+                next_publish += self._publish_interval_s
+                if next_publish <= now:
+                    next_publish = now + self._publish_interval_s
+            if now >= next_stats:
+                self._bus.publish(PRESSURE_STATS, self._tick_stats(now))
+                next_stats = now + STATS_INTERVAL_S
+            wake = min(heap[0][0] if heap else next_stats, next_publish, next_stats)
+            self._stop.wait(max(0.0, wake - time.perf_counter()))
+
+    def _poll(self, g: _Gauge, now: float) -> None:
+        with self._lock:
+            if g.in_flight >= g.depth or now < g.retry_at:
+                g.stats.skipped += 1
+                return
+            g.in_flight += 1
+        self._lanes[g.cfg.port].submit(g)
+
+    def _publish_readings(self) -> None:
+        with self._lock:
+            readings, self._readings = self._readings, []
+        if not readings:
+            return
+        self._bus.publish(PRESSURE_BATCH, PressureBatch(tuple(readings)))
+        latest: Dict[str, PressureValue] = {}
+        for r in readings:
+            latest[r.channel] = r
+        for r in latest.values():
+            self._bus.publish(PRESSURE_VALUE, r)
+
+    def _tick_stats(self, now: float) -> Dict[str, GaugeStats]:
+        waiting: Dict[_Gauge, float] = {}
+        for lane in self._lanes.values():
+            waiting.update(lane.waiting_since())
+        with self._lock:
+            for g in self._gauges:
+                t0, n0 = g.rate_mark
+                if now > t0:
+                    g.stats.effective_hz = (g.stats.samples - n0) / (now - t0)
+                g.rate_mark = (now, g.stats.samples)
+                age = now - waiting.get(g, now)
+                # watchdog: each of the depth replies ahead may take up to timeout_s;
+                # beyond that the lane is stuck inside a driver call
+                if age > g.cfg.timeout_s * g.depth:
+                    g.stats.stalled = True
+                    g.stats.last_error = f"no reply for {age:.1f} s"
+            return {g.cfg.channel: replace(g.stats) for g in self._gauges}
+
+    # ---- called from the port lanes ----
+    def _connected(self, g: _Gauge) -> None:
+        with self._lock:
+            g.connected = True
+
+    def _reply(self, g: _Gauge, pa: Optional[float], latency_s: float) -> None:
+        with self._lock:
+            g.in_flight -= 1
+            s = g.stats
+            if pa is None:
+                s.timeouts += 1
+                g.consecutive_timeouts += 1
+                if g.consecutive_timeouts >= STALL_AFTER:
+                    s.stalled = True
+                return
+            g.consecutive_timeouts = 0
+            s.stalled = False
+            s.samples += 1
+            s.last_pa = pa
+            s.last_latency_s = latency_s
+            self._readings.append(PressureValue(g.cfg.channel, pa, "Pa", time.time()))
+
+    def _release(self, g: _Gauge, n: int) -> None:
+        if n:
+            with self._lock:
+                g.in_flight -= n
+
+    def _failed(self, g: _Gauge, lost: int, error: Exception) -> None:
+        with self._lock:
+            g.in_flight -= lost
+            g.connected = False
+            g.retry_at = time.perf_counter() + RECONNECT_S
+            g.stats.errors += 1
+            g.stats.last_error = f"{type(error).__name__}: {error}"
+
+    def _close_port(self, port: str) -> None:
+        for g in self._gauges:
+            if g.cfg.port == port and g.connected:
+                g.connected = False
+                g.sensor.close()
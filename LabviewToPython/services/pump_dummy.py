@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Dict, Any
 from LabviewToPython.services.interfaces import IPumpService
 from LabviewToPython.core.events.eventbus import IEventBus
+from LabviewToPython.core.events.topics import PUMP_STATUS, PumpStatus
 
 class DummyPumpService(IPumpService):
     def __init__(self, bus: IEventBus) -> None:
@@ -10,11 +11,11 @@ class DummyPumpService(IPumpService):
 
     def start(self) -> None:
         self._running = True
-        self._bus.publish("pump/status", {"running": True})
+        self._bus.publish(PUMP_STATUS, PumpStatus(running=True))
 
     def stop(self) -> None:
         self._running = False
-        self._bus.publish("pump/status", {"running": False})
+        self._bus.publish(PUMP_STATUS, PumpStatus(running=False))
 
     def read_status(self) -> Dict[str, Any]:
         return {"running": self._running}
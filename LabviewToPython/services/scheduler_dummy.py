@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Dict, Any
 from LabviewToPython.services.interfaces import IScanScheduler
 from LabviewToPython.core.events.eventbus import IEventBus
+from LabviewToPython.core.events.topics import SCAN_STATUS, ScanStatus
 
 class DummyScanScheduler(IScanScheduler):
     def __init__(self, bus: IEventBus) -> None:
@@ -11,9 +12,9 @@ class DummyScanScheduler(IScanScheduler):
     def schedule(self, plan: Dict[str, Any]) -> None:
         self._active = True
         # Scaffold: immediately publish a "done"
-        self._bus.publish("scan/status", {"state": "done"})
+        self._bus.publish(SCAN_STATUS, ScanStatus("done"))
         self._active = False
 
     def stop(self) -> None:
         self._active = False
-        self._bus.publish("scan/status", {"state": "stopped"})
+        self._bus.publish(SCAN_STATUS, ScanStatus("stopped"))
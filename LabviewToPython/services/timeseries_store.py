@@ -0,0 +1,507 @@
+from __future__ import annotations
+import bisect
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from urllib.parse import quote, unquote
+
+import numpy as np
+
+from LabviewToPython.core.abstractions.i_eventbus import IEventBus
+from LabviewToPython.core.domain.quantities.arrays import PressureArray
+from LabviewToPython.core.domain.quantities.units_context import UnitsContext
+from LabviewToPython.core.events.topics import (
+    MOTION_POSITION, PRESSURE_BATCH, PUMP_STATUS, TEMPERATURE_VALUE,
+)
+
+DEFAULT_CAPACITY = 1 << 20      # ~29 h at 10 Hz, 16 MB per channel
+DEFAULT_CHUNK = 1 << 16         # samples per spill file
+CHUNK_DTYPE = np.dtype([("t", "<f8"), ("v", "<f8")])
+
+log = logging.getLogger(__name__)
+
+Sample = Tuple[str, float, float]                   # (channel, t, value)
+Extractor = Callable[[Any], Iterable[Sample]]
+
+
+class Downsampled(NamedTuple):
+    """Equal-width bins over [t0, t1); empty bins have count 0 and NaN values."""
+    t: np.ndarray        # bin centers
+    min: np.ndarray
+    max: np.ndarray
+    mean: np.ndarray
+    count: np.ndarray
+
+
+@dataclass
+class SeriesStats:
+    channel: str
+    samples: int          # in memory
+    capacity: int
+    total: int            # appended since start
+    out_of_order: int     # rejected: older than the newest sample
+    spilled: int          # handed to the spill writer
+    lost: int             # overwritten before they could be spilled
+    spill_errors: int = 0 # chunks that failed to write (dropped from disk, kept while in memory)
+    last_error: str = ""
+
+
+# ---- ring buffer ----
+class RingSeries:
+    """
+    One channel: preallocated timestamp/value arrays used as a ring.
+
+    Timestamps must not decrease (older samples are rejected and counted),
+    so the ring is two sorted segments and a time range is located with two
+    binary searches. Appends and queries take a short lock; queries copy at
+    most the requested range.
+    """
+    def __init__(self, channel: str, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.channel = channel
+        self._cap = int(capacity)
+        self._t = np.empty(self._cap, dtype=np.float64)
+        self._v = np.empty(self._cap, dtype=np.float64)
+        self._start = 0       # physical index of the oldest sample
+        self._n = 0
+        self._last_t = -np.inf
+        self._lock = threading.Lock()
+        self.total = 0
+        self.out_of_order = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._cap
+
+    def __len__(self) -> int:
+        return self._n
+
+    def append(self, t: float, v: float) -> None:
+        with self._lock:
+            if t < self._last_t:
+                self.out_of_order += 1
+                return
+            i = self._start + self._n
+            if i >= self._cap:
+                i -= self._cap
+            self._t[i] = t
+            self._v[i] = v
+            if self._n == self._cap:
+                self._start = i + 1 if i + 1 < self._cap else 0
+            else:
+                self._n += 1
+            self._last_t = t
+            self.total += 1
+
+    def extend(self, ts: Any, vs: Any) -> None:
+        ts = np.asarray(ts, dtype=np.float64)
+        vs = np.asarray(vs, dtype=np.float64)
+        if ts.size == 0:
+            return
+        if ts.size > 1 and np.any(ts[1:] < ts[:-1]):
+            order = np.argsort(ts, kind="stable")
+            ts, vs = ts[order], vs[order]
+        with self._lock:
+            keep = ts >= self._last_t
+            if not keep.all():
+                self.out_of_order += int(ts.size - keep.sum())
+                ts, vs = ts[keep], vs[keep]
+            m = ts.size
+            if m == 0:
+                return
+            self.total += m
+            if m > self._cap:
+                ts, vs, m = ts[-self._cap:], vs[-self._cap:], self._cap
+            i = (self._start + self._n) % self._cap
+            first = min(m, self._cap - i)
+            self._t[i:i + first] = ts[:first]
+            self._v[i:i + first] = vs[:first]
+            self._t[:m - first] = ts[first:]
+            self._v[:m - first] = vs[first:]
+            overflow = self._n + m - self._cap
+            if overflow > 0:
+                self._start = (self._start + overflow) % self._cap
+                self._n = self._cap
+            else:
+                self._n += m
+            self._last_t = float(ts[-1])
+
+    def time_span(self) -> Optional[Tuple[float, float]]:
+        with self._lock:
+            if self._n == 0:
+                return None
+            return float(self._t[self._start]), self._last_t
+
+    def range(self, t0: float = -np.inf, t1: float = np.inf) -> Tuple[np.ndarray, np.ndarray]:
+        """Copies of the samples with t0 <= t < t1, in time order."""
+        with self._lock:
+            i0 = self._search(t0)
+            i1 = self._search(t1)
+            return self._slice(i0, i1)
+
+    def last(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        with self._lock:
+            return self._slice(max(0, self._n - n), self._n)
+
+    # logical index = position in time order (0 = oldest)
+    def _segments(self) -> Tuple[slice, slice]:
+        end = self._start + self._n
+        if end <= self._cap:
+            return slice(self._start, end), slice(0, 0)
+        return slice(self._start, self._cap), slice(0, end - self._cap)
+
+    def _search(self, t: float) -> int:
+        a, b = self._segments()
+        ta = self._t[a]
+        if b.stop == 0 or (ta.size and t <= ta[-1]):
+            return int(np.searchsorted(ta, t, side="left"))
+        return ta.size + int(np.searchsorted(self._t[b], t, side="left"))
+
+    def _slice(self, i0: int, i1: int) -> Tuple[np.ndarray, np.ndarray]:
+        if i1 <= i0:
+            return np.empty(0), np.empty(0)
+        p0 = self._start + i0
+        p1 = self._start + i1
+        if p1 <= self._cap or p0 >= self._cap:
+            sl = slice(p0 % self._cap, (p1 - 1) % self._cap + 1)
+            return self._t[sl].copy(), self._v[sl].copy()
+        return (np.concatenate((self._t[p0:], self._t[:p1 - self._cap])),
+                np.concatenate((self._v[p0:], self._v[:p1 - self._cap])))
+
+
+def downsample(ts: np.ndarray, vs: np.ndarray, t0: float, t1: float, bins: int) -> Downsampled:
+    """
+    min/max/mean of time-sorted samples in `bins` equal bins over [t0, t1);
+    vectorized (searchsorted + ufunc.reduceat), no per-sample Python.
+    """
+    bins = max(1, int(bins))
+    edges = np.linspace(t0, t1, bins + 1)
+    bounds = np.searchsorted(ts, edges, side="left")
+    count = np.diff(bounds)
+    vmin = np.full(bins, np.nan)
+    vmax = np.full(bins, np.nan)
+    vmean = np.full(bins, np.nan)
+    full = count > 0
+    if full.any():
+        lo, hi = bounds[0], bounds[-1]
+        v = vs[lo:hi]
+        starts = bounds[:-1][full] - lo
+        vmin[full] = np.minimum.reduceat(v, starts)
+        vmax[full] = np.maximum.reduceat(v, starts)
+        vmean[full] = np.add.reduceat(v, starts) / count[full]
+    return Downsampled((edges[:-1] + edges[1:]) * 0.5, vmin, vmax, vmean, count)
+
+
+# ---- disk spill ----
+class _ChunkFiles:
+    """
+    Spilled samples of one channel: <root>/<channel>/<first sample no.>.npy,
+    structured (t, v) arrays in time order. Existing chunks are picked up on
+    start (TimeSeriesStore recreates their channels), so history survives a
+    restart. A chunk is written to <name>.tmp and renamed into place, so a
+    crash leaves at most a stray .tmp (removed on start); a chunk that still
+    cannot be read is logged and moved aside to <name>.bad.
+    """
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self._index: List[Tuple[float, float, str]] = []     # (t_first, t_last, path), sorted
+        self._lock = threading.Lock()
+        self._next = 0                                         # sample no. of the next chunk
+        if os.path.isdir(directory):
+            for name in sorted(os.listdir(directory)):
+                path = os.path.join(directory, name)
+                if name.endswith(".npy.tmp"):
+                    try: os.remove(path)     # write interrupted before the rename
+                    except OSError: pass
+                elif name.endswith(".npy"):
+                    try:
+                        first = int(name[:-4])
+                        rec = np.load(path, mmap_mode="r")
+                        if rec.dtype != CHUNK_DTYPE or rec.ndim != 1:
+                            raise ValueError(f"unexpected chunk layout {rec.dtype} {rec.shape}")
+                    except (OSError, ValueError) as e:
+                        self._set_aside(path, e)
+                        continue
+                    if rec.size:
+                        self._index.append((float(rec["t"][0]), float(rec["t"][-1]), path))
+                        self._next = max(self._next, first + rec.size)
+            self._index.sort()
+
+    @staticmethod
+    def _set_aside(path: str, error: Exception) -> None:
+        log.warning("skipping unreadable chunk %s: %s", path, error)
+        try: os.replace(path, path + ".bad")
+        except OSError: pass
+
+    def write(self, ts: np.ndarray, vs: np.ndarray) -> None:
+        """Called from the spill thread only."""
+        os.makedirs(self.directory, exist_ok=True)
+        rec = np.empty(ts.size, dtype=CHUNK_DTYPE)
+        rec["t"] = ts
+        rec["v"] = vs
+        path = os.path.join(self.directory, f"{self._next:012d}.npy")
+        tmp = path + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                np.save(f, rec)
+            os.replace(tmp, path)    # readers and the next start see whole chunks only
+        except BaseException:
+            try: os.remove(tmp)
+            except OSError: pass
+            raise
+        self._next += ts.size
+        with self._lock:
+            bisect.insort(self._index, (float(ts[0]), float(ts[-1]), path))
+
+    def range(self, t0: float, t1: float) -> Tuple[np.ndarray, np.ndarray]:
+        with self._lock:
+            hits = [p for first, last, p in self._index if last >= t0 and first < t1]
+        ts: List[np.ndarray] = []
+        vs: List[np.ndarray] = []
+        for path in hits:
+            rec = np.load(path, mmap_mode="r")
+            t = rec["t"]
+            i0, i1 = np.searchsorted(t, (t0, t1), side="left")
+            ts.append(np.array(t[i0:i1]))
+            vs.append(np.array(rec["v"][i0:i1]))
+        if not ts:
+            return np.empty(0), np.empty(0)
+        return np.concatenate(ts), np.concatenate(vs)
+
+
+# ---- store ----
+class _Channel:
+    def __init__(self, series: RingSeries, files: Optional[_ChunkFiles]) -> None:
+        self.series = series
+        self.files = files
+        self.spilled = 0      # samples handed to the spill writer
+        self.lost = 0
+        self.spill_errors = 0
+        self.last_error = ""
+
+
+class TimeSeriesStore:
+    """
+    History of slow-control channels (pressure, temperature, stage position,
+    pump state): one RingSeries per channel, created on first sample.
+
+    With spill_dir set, every chunk_size samples of a channel are written to
+    disk by a background thread (and the rest on flush()/close()); query()
+    and downsample() then reach back past the in-memory window transparently.
+    Channels already in spill_dir are recreated on start. A chunk that fails
+    to write is counted in SeriesStats.spill_errors and left out of the disk
+    history; the writer carries on with the next one.
+    attach(bus) records the standard topics, see DEFAULT_EXTRACTORS.
+    """
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        spill_dir: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK,
+    ) -> None:
+        if spill_dir is not None and capacity < 2 * chunk_size:
+            raise ValueError("capacity must be at least 2 * chunk_size when spilling")
+        self._capacity = capacity
+        self._spill_dir = spill_dir
+        self._chunk = chunk_size
+        self._channels: Dict[str, _Channel] = {}
+        self._lock = threading.Lock()
+        self._handlers: List[Tuple[IEventBus, str, Callable[[Any], None]]] = []
+
+        self._spill_q: Deque[Tuple[_Channel, np.ndarray, np.ndarray]] = deque()
+        self._spill_cond = threading.Condition()
+        self._running = spill_dir is not None
+        self._writer: Optional[threading.Thread] = None
+        if self._running:
+            for name in sorted(os.listdir(spill_dir)) if os.path.isdir(spill_dir) else ():
+                if os.path.isdir(os.path.join(spill_dir, name)):
+                    self._add(unquote(name))
+            self._writer = threading.Thread(target=self._write_loop, name="timeseries-spill", daemon=True)
+            self._writer.start()
+
+    # ---- writing ----
+    def append(self, channel: str, t: float, value: float) -> None:
+        ch = self._channels.get(channel) or self._add(channel)
+        ch.series.append(t, value)
+        if self._running and ch.series.total - ch.spilled >= self._chunk:
+            self._spill(ch, self._chunk)
+
+    def extend(self, channel: str, ts: Any, values: Any) -> None:
+        ch = self._channels.get(channel) or self._add(channel)
+        ch.series.extend(ts, values)
+        while self._running and ch.series.total - ch.spilled >= self._chunk:
+            self._spill(ch, self._chunk)
+
+    def _add(self, channel: str) -> _Channel:
+        with self._lock:
+            ch = self._channels.get(channel)
+            if ch is None:
+                files = None
+                if self._spill_dir is not None:
+                    files = _ChunkFiles(os.path.join(self._spill_dir, _dir_name(channel)))
+                ch = _Channel(RingSeries(channel, self._capacity), files)
+                self._channels = {**self._channels, channel: ch}
+            return ch
+
+    def _spill(self, ch: _Channel, n: int) -> None:
+        s = ch.series
+        with s._lock:
+            pending = s.total - ch.spilled
+            if pending > len(s):          # overwritten before we got to them
+                ch.lost += pending - len(s)
+                ch.spilled = s.total - len(s)
+                pending = len(s)
+            n = min(n, pending)
+            if n <= 0:
+                return
+            i0 = len(s) - pending
+            ts, vs = s._slice(i0, i0 + n)
+            ch.spilled += n
+            # still under the series lock: chunks of a channel are queued in sample order
+            with self._spill_cond:
+                self._spill_q.append((ch, ts, vs))
+                self._spill_cond.notify()
+
+    def _write_loop(self) -> None:
+        try:
+            while True:
+                with self._spill_cond:
+                    while self._running and not self._spill_q:
+                        self._spill_cond.wait()
+                    if not self._spill_q:
+                        return
+                    ch, ts, vs = self._spill_q.popleft()
+                assert ch.files is not None
+                try:
+                    ch.files.write(ts, vs)
+                except Exception as e:   # disk full, permissions, ...: drop this chunk, keep going
+                    ch.spill_errors += 1
+                    ch.last_error = f"{type(e).__name__}: {e}"
+                with self._spill_cond:
+                    self._spill_cond.notify_all()
+        finally:
+            # whatever ended the loop, stop spilling and release flush()/close()
+            with self._spill_cond:
+                self._running = False
+                self._spill_q.clear()
+                self._spill_cond.notify_all()
+
+    def flush(self) -> None:
+        """Spill the not yet written samples of every channel and wait for the disk."""
+        if self._writer is None:
+            return
+        for ch in list(self._channels.values()):
+            while self._running and ch.series.total > ch.spilled:
+                self._spill(ch, self._chunk)
+        with self._spill_cond:
+            while self._spill_q and self._running:
+                self._spill_cond.wait()
+
+    def close(self) -> None:
+        self.detach()
+        self.flush()
+        with self._spill_cond:
+            self._running = False
+            self._spill_cond.notify_all()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+
+    # ---- reading ----
+    def channels(self) -> List[str]:
+        return list(self._channels)
+
+    def series(self, channel: str) -> RingSeries:
+        return self._channels[channel].series
+
+    def query(self, channel: str, t0: float = -np.inf, t1: float = np.inf) -> Tuple[np.ndarray, np.ndarray]:
+        """(t, value) arrays with t0 <= t < t1, from memory and, if needed, disk."""
+        ch = self._channels.get(channel)
+        if ch is None:
+            return np.empty(0), np.empty(0)
+        span = ch.series.time_span()
+        mem_t0 = span[0] if span is not None else np.inf
+        if ch.files is None or t0 >= mem_t0:
+            return ch.series.range(t0, t1)
+        disk_t, disk_v = ch.files.range(t0, min(t1, mem_t0))
+        mem_t, mem_v = ch.series.range(mem_t0, t1)
+        return np.concatenate((disk_t, mem_t)), np.concatenate((disk_v, mem_v))
+
+    def query_pressure(
+        self, channel: str, t0: float = -np.inf, t1: float = np.inf, units: Optional[UnitsContext] = None,
+    ) -> Tuple[np.ndarray, PressureArray]:
+        """query() of a pressure channel (stored in Pa); .display() gives the plot values in the user's unit."""
+        ts, vs = self.query(channel, t0, t1)
+        return ts, PressureArray.from_pa(vs, units, copy=False)   # vs is already a fresh array
+
+    def downsample(self, channel: str, t0: float, t1: float, bins: int) -> Downsampled:
+        """Plot-ready min/max/mean envelope of [t0, t1) in `bins` bins."""
+        ts, vs = self.query(channel, t0, t1)
+        return downsample(ts, vs, t0, t1, bins)
+
+    def stats(self) -> Dict[str, SeriesStats]:
+        return {
+            name: SeriesStats(name, len(ch.series), ch.series.capacity, ch.series.total,
+                              ch.series.out_of_order, ch.spilled, ch.lost, ch.spill_errors, ch.last_error)
+            for name, ch in self._channels.items()
+        }
+
+    # ---- event bus ----
+    def attach(self, bus: IEventBus, extractors: Optional[Dict[str, Extractor]] = None) -> None:
+        """Record `topic -> samples` extractors (default: DEFAULT_EXTRACTORS)."""
+        for topic, extract in (extractors or DEFAULT_EXTRACTORS).items():
+            handler = self._make_handler(extract)
+            bus.subscribe(topic, handler)
+            self._handlers.append((bus, topic, handler))
+
+    def detach(self) -> None:
+        for bus, topic, handler in self._handlers:
+            bus.unsubscribe(topic, handler)
+        self._handlers.clear()
+
+    def _make_handler(self, extract: Extractor) -> Callable[[Any], None]:
+        def on_event(payload: Any) -> None:
+            per: Dict[str, Tuple[List[float], List[float]]] = {}
+            for channel, t, v in extract(payload):
+                ts, vs = per.setdefault(channel, ([], []))
+                ts.append(t)
+                vs.append(v)
+            for channel, (ts, vs) in per.items():
+                if len(ts) == 1:
+                    self.append(channel, ts[0], vs[0])
+                else:
+                    self.extend(channel, ts, vs)
+        return on_event
+
+
+def _stamp(t: float) -> float:
+    return t if t > 0.0 else time.time()
+
+def _pressure_batch(batch: Any) -> Iterable[Sample]:
+    return [(f"pressure/{r.channel}", _stamp(r.timestamp), r.value) for r in batch.readings]
+
+def _temperature(ev: Any) -> Iterable[Sample]:
+    return [(f"temperature/{ev.channel}", _stamp(ev.timestamp), ev.value)]
+
+def _motion(ev: Any) -> Iterable[Sample]:
+    return [("motion/position", time.time(), ev.position)]
+
+def _pump(ev: Any) -> Iterable[Sample]:
+    return [("pump/running", time.time(), 1.0 if ev.running else 0.0)]
+
+# pressure/value is not listed: PressureService publishes every reading in
+# pressure/batch already. Add it for services that only publish single values.
+DEFAULT_EXTRACTORS: Dict[str, Extractor] = {
+    PRESSURE_BATCH: _pressure_batch,
+    TEMPERATURE_VALUE: _temperature,
+    MOTION_POSITION: _motion,
+    PUMP_STATUS: _pump,
+}
+
+
+def _dir_name(channel: str) -> str:
+    """Reversible (unquote) so channels can be recreated from spill_dir on start."""
+    return quote(channel, safe="")
@@ -35,7 +35,15 @@ class MainWindow(QMainWindow):
     def _add_dock(self, spec: DockSpec) -> QDockWidget:
         dock = QDockWidget(spec.title, self)
         dock.setObjectName(spec.object_name)
-        dock.setWidget(spec.factory(dock))
+        if spec.lazy:
+            # build the content the first time the dock becomes visible (tabs behind others stay empty)
+            def build(visible: bool) -> None:
+                if visible and dock.widget() is None:
+                    dock.visibilityChanged.disconnect(build)
+                    dock.setWidget(spec.factory(dock))
+            dock.visibilityChanged.connect(build)
+        else:
+            dock.setWidget(spec.factory(dock))
         features = (QDockWidget.DockWidgetFeature.DockWidgetMovable
                     | QDockWidget.DockWidgetFeature.DockWidgetFloatable
                     | QDockWidget.DockWidgetFeature.DockWidgetClosable)
@@ -43,12 +51,16 @@ class MainWindow(QMainWindow):
         dock.setAllowedAreas(Qt.DockWidgetArea.AllDockWidgetAreas)
         dock.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, False)
         self.addDockWidget(spec.area, dock)
+        if not spec.visible:
+            dock.hide()
         self._docks[spec.object_name] = dock
         return dock
 
     def _auto_tabify(self) -> None:
         left, right = [], []
         for d in self._docks.values():
+            if d.isHidden():
+                continue   # hidden by default (DockSpec.visible); stays out of the tab stacks
             (left if ("Scan" in d.windowTitle() or "Measurement" in d.windowTitle()) else right).append(d)
         for stack in (left, right):
             for a, b in zip(stack, stack[1:]): self.tabifyDockWidget(a, b)
@@ -0,0 +1,43 @@
+"""
+CompositeAccumulator in decay mode over many half-lives.
+
+The lazy decay keeps a growing gain; past ~126 half-lives it would exceed
+the float32 range of display()'s buffer. Runs 2000 half-lives and checks
+counts() and display() against a float64 reference decayed every frame.
+
+    python composite_decay_test.py
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from ion_detection import CompositeAccumulator, HitBatch  # noqa: E402
+
+
+def test_decay_long_run(half_life: float = 5.0, half_lives: int = 2000) -> None:
+    shape = (16, 16)
+    rng = np.random.default_rng(0)
+    acc = CompositeAccumulator(shape, mode="decay", half_life=half_life)
+    ref = np.zeros(shape)
+    decay = 0.5 ** (1.0 / half_life)
+
+    for frame in range(int(half_life * half_lives)):
+        cx = rng.integers(0, shape[1], 5, dtype=np.int32)
+        cy = rng.integers(0, shape[0], 5, dtype=np.int32)
+        acc.add(HitBatch.from_frame(cx, cy, np.ones(5, np.int32), np.ones(5, np.float32), frame))
+        ref *= decay
+        np.add.at(ref, (cy, cx), 1.0)
+
+        if frame % 500 == 0 or frame == int(half_life * half_lives) - 1:
+            np.testing.assert_allclose(acc.counts, ref, rtol=1e-9, atol=1e-12)
+            img = acc.display()
+            expected = np.clip(np.round(ref * (255.0 / ref.max())), 0, 255)
+            assert img.max() == 255, f"frame {frame}: display max {img.max()}"
+            assert np.abs(img.astype(int) - expected).max() <= 1, f"frame {frame}: display off"
+
+
+if __name__ == "__main__":
+    test_decay_long_run()
+    print("ok")
@@ -0,0 +1,95 @@
+"""
+EventBus publish throughput: N publishing threads x M synchronous subscribers.
+
+Every thread publishes to its own topic (like one device thread per
+instrument), all subscribers are trivial, so the numbers measure the bus
+itself. 'legacy' is the previous implementation (RLock + list copy per
+publish) for comparison.
+
+    python eventbus_bench.py --threads 1 2 4 8 --subscribers 1 4 16 --seconds 1
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from threading import RLock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from LabviewToPython.core.events.eventbus import EventBus  # noqa: E402
+
+
+class LegacyBus:
+    def __init__(self) -> None:
+        self._subs = defaultdict(list)
+        self._lock = RLock()
+
+    def subscribe(self, topic, handler) -> None:
+        with self._lock:
+            self._subs[topic].append(handler)
+
+    def publish(self, topic, payload=None) -> None:
+        with self._lock:
+            handlers = list(self._subs.get(topic, []))
+        for h in handlers:
+            try:
+                h(payload)
+            except Exception:
+                pass
+
+
+def run(bus, n_threads: int, n_subs: int, seconds: float) -> float:
+    """Total publishes per second over all threads."""
+    def handler(payload) -> None:
+        pass
+
+    topics = [f"device{i}/value" for i in range(n_threads)]
+    for t in topics:
+        for _ in range(n_subs):
+            bus.subscribe(t, handler)
+
+    counts = [0] * n_threads
+    start = threading.Barrier(n_threads + 1)
+    stop = threading.Event()
+
+    def publisher(i: int) -> None:
+        topic, publish, n = topics[i], bus.publish, 0
+        start.wait()
+        while not stop.is_set():
+            for _ in range(1000):
+                publish(topic, n)
+            n += 1000
+        counts[i] = n
+
+    threads = [threading.Thread(target=publisher, args=(i,)) for i in range(n_threads)]
+    for th in threads:
+        th.start()
+    start.wait()
+    t0 = time.perf_counter()
+    time.sleep(seconds)
+    stop.set()
+    for th in threads:
+        th.join()
+    return sum(counts) / (time.perf_counter() - t0)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--threads", nargs="+", type=int, default=[1, 2, 4, 8])
+    ap.add_argument("--subscribers", nargs="+", type=int, default=[1, 4, 16])
+    ap.add_argument("--seconds", type=float, default=1.0)
+    args = ap.parse_args()
+
+    print(f"{'threads':>7s} {'subs':>5s} {'legacy pub/s':>14s} {'EventBus pub/s':>15s} {'speedup':>8s}")
+    for n in args.threads:
+        for m in args.subscribers:
+            legacy = run(LegacyBus(), n, m, args.seconds)
+            bus = EventBus()
+            cow = run(bus, n, m, args.seconds)
+            bus.shutdown()
+            print(f"{n:7d} {m:5d} {legacy:14,.0f} {cow:15,.0f} {cow / legacy:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass
+class FramePoolStats:
+    slots: int = 0              # preallocated frame buffers
+    allocations: int = 0        # buffers allocated by the pool (only at construction)
+    acquired: int = 0           # successful acquire() calls
+    exhausted: int = 0          # acquire() calls that found no free slot
+    in_use: int = 0             # slots currently held by someone
+
+
+class PooledFrame:
+    """
+    One slot of a FramePool, handed out by reference.
+
+    The slot is reference counted: acquire() returns it with one reference,
+    every additional holder calls retain(), every holder calls release()
+    exactly once. When the count drops to zero the slot goes back to the
+    pool and its array may be overwritten by the next acquire().
+    """
+    __slots__ = ("_pool", "slot", "array", "frame_index", "timestamp", "_refs")
+
+    def __init__(self, pool: "FramePool", slot: int, array: np.ndarray) -> None:
+        self._pool = pool
+        self.slot = slot
+        self.array = array
+        self.frame_index = 0
+        self.timestamp = 0.0
+        self._refs = 0
+
+    @property
+    def pool(self) -> "FramePool":
+        return self._pool
+
+    def retain(self) -> "PooledFrame":
+        self._pool._retain(self)
+        return self
+
+    def release(self) -> None:
+        self._pool._release(self)
+
+    def __enter__(self) -> "PooledFrame":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+class FramePool:
+    """
+    Fixed set of preallocated frame buffers that are recycled.
+
+    frames may be passed in to place the slots in existing memory (e.g. a
+    SharedFrameRing, so analysis workers read the very buffer acquisition
+    wrote); otherwise one (n_slots, *shape) block is allocated up front.
+    Nothing is allocated after construction: when every slot is in use,
+    acquire() returns None (or waits, if block=True) and the caller drops
+    the frame.
+    """
+
+    def __init__(
+        self,
+        shape: Tuple[int, ...],
+        dtype=np.uint8,
+        n_slots: int = 8,
+        frames: Optional[np.ndarray] = None,
+    ) -> None:
+        self.shape = tuple(int(s) for s in shape)
+        self.dtype = np.dtype(dtype)
+
+        if frames is None:
+            frames = np.empty((int(n_slots),) + self.shape, dtype=self.dtype)
+            allocations = 1
+        else:
+            if frames.shape[1:] != self.shape or frames.dtype != self.dtype:
+                raise ValueError("frames must have shape (n_slots, *shape) and matching dtype")
+            allocations = 0
+        self._frames = frames
+
+        self._cond = threading.Condition()
+        self._items = [PooledFrame(self, i, frames[i]) for i in range(frames.shape[0])]
+        self._free: Deque[int] = deque(range(frames.shape[0]))
+        self._stats = FramePoolStats(slots=frames.shape[0], allocations=allocations)
+
+    @property
+    def n_slots(self) -> int:
+        return len(self._items)
+
+    @property
+    def stats(self) -> FramePoolStats:
+        with self._cond:
+            s = FramePoolStats(**vars(self._stats))
+            s.in_use = len(self._items) - len(self._free)
+        return s
+
+    def owns(self, frame: PooledFrame) -> bool:
+        return frame.pool is self
+
+    def acquire(self, block: bool = False, timeout: Optional[float] = None) -> Optional[PooledFrame]:
+        with self._cond:
+            if not self._free and block:
+                self._cond.wait_for(lambda: bool(self._free), timeout)
+            if not self._free:
+                self._stats.exhausted += 1
+                return None
+            item = self._items[self._free.popleft()]
+            item._refs = 1
+            self._stats.acquired += 1
+            return item
+
+    # ---- refcounting (via PooledFrame) ----
+    def _retain(self, item: PooledFrame) -> None:
+        with self._cond:
+            if item._refs <= 0:
+                raise RuntimeError(f"retain() on released slot {item.slot}")
+            item._refs += 1
+
+    def _release(self, item: PooledFrame) -> None:
+        with self._cond:
+            if item._refs <= 0:
+                raise RuntimeError(f"release() on already released slot {item.slot}")
+            item._refs -= 1
+            if item._refs == 0:
+                self._free.append(item.slot)
+                self._cond.notify()
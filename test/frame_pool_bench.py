@@ -0,0 +1,114 @@
+"""
+Frame handoff benchmark: copy-per-frame vs. FramePool.
+
+A producer thread imitates the PySpin loop (driver buffer -> GetNDArray ->
+hand to consumer) at a fixed frame rate, a consumer thread holds each frame
+briefly and lets it go. Reports achieved fps, handoff cost per frame,
+buffer allocations per second and peak traced memory.
+
+    python frame_pool_bench.py --fps 120 --seconds 5 --shape 1080 1440
+"""
+import argparse
+import queue
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+
+from frame_pool import FramePool
+
+
+def run(mode: str, fps: float, seconds: float, shape, n_slots: int) -> dict:
+    driver_buffer = np.random.default_rng(0).integers(0, 255, size=shape, dtype=np.uint8)
+    pool = FramePool(shape, np.uint8, n_slots) if mode == "pool" else None
+    q: "queue.Queue" = queue.Queue(maxsize=n_slots)
+    allocations = 0
+    dropped = 0
+    produced = 0
+    handoff_s = 0.0
+
+    def consumer() -> None:
+        while True:
+            item = q.get()
+            if item is None:
+                return
+            frame = item.array if pool is not None else item
+            _ = int(frame[0, 0])        # touch it
+            time.sleep(0.001)          # pretend to display
+            if pool is not None:
+                item.release()
+
+    tracemalloc.start()
+    t_cons = threading.Thread(target=consumer, daemon=True)
+    t_cons.start()
+
+    period = 1.0 / fps
+    t0 = time.perf_counter()
+    next_t = t0
+    while time.perf_counter() - t0 < seconds:
+        src = driver_buffer  # img.GetNDArray()
+        h0 = time.perf_counter()
+        if pool is None:
+            item = src.copy()
+            allocations += 1
+        else:
+            item = pool.acquire()
+            if item is not None:
+                np.copyto(item.array, src)
+        handoff_s += time.perf_counter() - h0
+
+        if item is None:
+            dropped += 1
+        else:
+            try:
+                q.put_nowait(item)
+                produced += 1
+            except queue.Full:
+                dropped += 1
+                if pool is not None:
+                    item.release()
+
+        next_t += period
+        delay = next_t - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+    elapsed = time.perf_counter() - t0
+    q.put(None)
+    t_cons.join()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if pool is not None:
+        allocations = pool.stats.allocations
+    frame_mb = driver_buffer.nbytes / 1e6
+    return {
+        "mode": mode,
+        "fps": produced / elapsed,
+        "dropped": dropped,
+        "handoff_us": 1e6 * handoff_s / max(1, produced + dropped),
+        "allocs_per_s": allocations / elapsed,
+        "alloc_mb_per_s": allocations * frame_mb / elapsed,
+        "peak_traced_mb": peak / 1e6,
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--fps", type=float, default=120.0)
+    ap.add_argument("--seconds", type=float, default=5.0)
+    ap.add_argument("--shape", type=int, nargs=2, default=(1080, 1440), metavar=("H", "W"))
+    ap.add_argument("--slots", type=int, default=8)
+    args = ap.parse_args()
+
+    print(f"{'mode':6s} {'fps':>8s} {'dropped':>8s} {'handoff us':>11s} "
+          f"{'allocs/s':>9s} {'alloc MB/s':>11s} {'peak MB':>8s}")
+    for mode in ("copy", "pool"):
+        r = run(mode, args.fps, args.seconds, tuple(args.shape), args.slots)
+        print(f"{r['mode']:6s} {r['fps']:8.1f} {r['dropped']:8d} {r['handoff_us']:11.1f} "
+              f"{r['allocs_per_s']:9.1f} {r['alloc_mb_per_s']:11.1f} {r['peak_traced_mb']:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 import cv2
 import numpy as np
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from collections import deque
+from functools import lru_cache
+from typing import Deque, List, Tuple, Optional, Sequence, Union
 
 
 @dataclass
@@ -12,6 +14,245 @@ class Hit:
     roundness: float
 
 
+@dataclass
+class HitBatch:
+    """
+    Columnar replacement for List[Hit].
+
+    Every column is its own contiguous, typed NumPy array, so a batch with
+    thousands of hits holds six arrays instead of thousands of objects.
+    frame_index and timestamp are stored per hit so batches of different
+    frames can be concatenated and still be told apart.
+
+    Indexing follows NumPy: a slice returns a zero-copy view on the same
+    buffers, a boolean mask / index array returns a copy, an int returns a Hit.
+    """
+    cx: np.ndarray              # int32
+    cy: np.ndarray              # int32
+    area: np.ndarray            # int32 (truncated contour area, like Hit.area)
+    roundness: np.ndarray       # float32
+    frame_index: np.ndarray     # int64
+    timestamp: np.ndarray       # float64, seconds
+
+    def __len__(self) -> int:
+        return int(self.cx.shape[0])
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return Hit(
+                cx=int(self.cx[key]),
+                cy=int(self.cy[key]),
+                area=int(self.area[key]),
+                roundness=float(self.roundness[key]),
+            )
+        return HitBatch(*(col[key] for col in self._columns()))
+
+    # ---- construction ----
+    @classmethod
+    def empty(cls) -> "HitBatch":
+        return cls(
+            cx=np.empty(0, dtype=np.int32),
+            cy=np.empty(0, dtype=np.int32),
+            area=np.empty(0, dtype=np.int32),
+            roundness=np.empty(0, dtype=np.float32),
+            frame_index=np.empty(0, dtype=np.int64),
+            timestamp=np.empty(0, dtype=np.float64),
+        )
+
+    @classmethod
+    def from_frame(
+        cls,
+        cx: np.ndarray,
+        cy: np.ndarray,
+        area: np.ndarray,
+        roundness: np.ndarray,
+        frame_index: int = 0,
+        timestamp: float = 0.0,
+    ) -> "HitBatch":
+        """Build a batch for one frame; dtypes are converted only if needed."""
+        n = int(np.shape(cx)[0])
+        return cls(
+            cx=np.ascontiguousarray(cx, dtype=np.int32),
+            cy=np.ascontiguousarray(cy, dtype=np.int32),
+            area=np.ascontiguousarray(area, dtype=np.int32),
+            roundness=np.ascontiguousarray(roundness, dtype=np.float32),
+            frame_index=np.full(n, frame_index, dtype=np.int64),
+            timestamp=np.full(n, timestamp, dtype=np.float64),
+        )
+
+    @classmethod
+    def from_hits(cls, hits: Sequence[Hit], frame_index: int = 0, timestamp: float = 0.0) -> "HitBatch":
+        return cls.from_frame(
+            cx=np.fromiter((h.cx for h in hits), dtype=np.int32, count=len(hits)),
+            cy=np.fromiter((h.cy for h in hits), dtype=np.int32, count=len(hits)),
+            area=np.fromiter((h.area for h in hits), dtype=np.int32, count=len(hits)),
+            roundness=np.fromiter((h.roundness for h in hits), dtype=np.float32, count=len(hits)),
+            frame_index=frame_index,
+            timestamp=timestamp,
+        )
+
+    @classmethod
+    def concatenate(cls, batches: Sequence["HitBatch"]) -> "HitBatch":
+        if len(batches) == 0:
+            return cls.empty()
+        if len(batches) == 1:
+            return batches[0]
+        cols = zip(*(b._columns() for b in batches))
+        return cls(*(np.concatenate(c) for c in cols))
+
+    # ---- access ----
+    def xy(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(x, y) arrays for plotting, no copy."""
+        return self.cx, self.cy
+
+    def frame(self, frame_index: int) -> "HitBatch":
+        """Hits of one frame. Zero-copy if the batch is ordered by frame_index."""
+        fi = self.frame_index
+        if len(fi) > 1 and np.any(fi[1:] < fi[:-1]):
+            return self[fi == frame_index]
+        lo, hi = np.searchsorted(fi, [frame_index, frame_index + 1])
+        return self[int(lo):int(hi)]
+
+    def to_hits(self) -> List[Hit]:
+        """Convert to the per-hit representation (slow; for compatibility only)."""
+        return [
+            Hit(cx=int(x), cy=int(y), area=int(a), roundness=float(r))
+            for x, y, a, r in zip(self.cx, self.cy, self.area, self.roundness)
+        ]
+
+    # ---- persistence ----
+    def save(self, file) -> None:
+        """Write all columns to an .npz file (path or open binary file)."""
+        np.savez(file, **{name: col for name, col in zip(HIT_COLUMNS, self._columns())})
+
+    @classmethod
+    def load(cls, file) -> "HitBatch":
+        with np.load(file) as data:
+            return cls(*(data[name] for name in HIT_COLUMNS))
+
+    def _columns(self) -> Tuple[np.ndarray, ...]:
+        return (self.cx, self.cy, self.area, self.roundness, self.frame_index, self.timestamp)
+
+
+HIT_COLUMNS = ("cx", "cy", "area", "roundness", "frame_index", "timestamp")
+
+
+_MAX_GAIN = 1e30   # decay: float32 tops out at ~3.4e38
+
+
+class CompositeAccumulator:
+    """
+    Hit-count image ("composit") with wide counters.
+
+    Modes:
+      - "total":  cumulative counts since reset (uint32 / uint64, no wrap-around)
+      - "window": counts of the last `window` add() calls (one call = one frame)
+      - "decay":  exponentially decaying counts with a half-life in frames
+
+    add() costs O(hits), never O(pixels): the window keeps the flat indices
+    of the frames it still covers, and decay is applied lazily through one
+    global scale factor instead of multiplying the whole image every frame.
+    display() builds the uint8 view on demand into reused buffers.
+    """
+    MODES = ("total", "window", "decay")
+
+    def __init__(
+        self,
+        shape: Tuple[int, int],
+        dtype=np.uint32,
+        mode: str = "total",
+        window: int = 1000,
+        half_life: float = 1000.0,
+    ) -> None:
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}")
+        self.shape = (int(shape[0]), int(shape[1]))
+        self.mode = mode
+        self.window = int(window)
+        self.half_life = float(half_life)
+
+        # decay needs fractional counts
+        self._counts = np.zeros(self.shape, dtype=np.float64 if mode == "decay" else np.dtype(dtype))
+        self._flat = self._counts.reshape(-1)
+        self._one = self._counts.dtype.type(1)  # typed increment keeps np.add.at on its fast path
+        self._history: Deque[np.ndarray] = deque()
+        self._gain = 1.0        # decay: weight of a hit added now, relative to stored units
+        self._decay = 0.5 ** (1.0 / self.half_life)
+        self._frames = 0
+
+        self._fbuf: Optional[np.ndarray] = None
+        self._u8: Optional[np.ndarray] = None
+
+    @property
+    def frames(self) -> int:
+        return self._frames
+
+    def reset(self) -> None:
+        self._counts.fill(0)
+        self._history.clear()
+        self._gain = 1.0
+        self._frames = 0
+
+    def add(self, hits: HitBatch) -> None:
+        """Accumulate one frame of hits."""
+        flat = hits.cy.astype(np.intp) * self.shape[1] + hits.cx
+        self._frames += 1
+
+        if self.mode == "total":
+            np.add.at(self._flat, flat, self._one)
+        elif self.mode == "window":
+            np.add.at(self._flat, flat, self._one)
+            self._history.append(flat)
+            if len(self._history) > self.window:
+                np.subtract.at(self._flat, self._history.popleft(), self._one)
+        else:
+            # stored = true / decay^t  ->  a hit now weighs 1 / decay^t
+            self._gain /= self._decay
+            # renormalize long before display()'s float32 buffer would overflow
+            if self._gain > _MAX_GAIN:
+                self._flat *= 1.0 / self._gain
+                self._gain = 1.0
+            np.add.at(self._flat, flat, np.float64(self._gain))
+
+    @property
+    def counts(self) -> np.ndarray:
+        """
+        Current counts. For total/window this is the live buffer (no copy);
+        for decay it is a new float array.
+        """
+        if self.mode == "decay":
+            return self._counts * (1.0 / self._gain)
+        return self._counts
+
+    def display(self, vmax: Optional[float] = None) -> np.ndarray:
+        """
+        uint8 view scaled so that vmax (default: current maximum) maps to 255.
+        The returned array is reused by the next call.
+        """
+        if self._u8 is None:
+            self._fbuf = np.empty(self.shape, dtype=np.float32)
+            self._u8 = np.empty(self.shape, dtype=np.uint8)
+
+        stored_max = float(self._counts.max())
+        if vmax is None:
+            vmax = stored_max / self._gain if self.mode == "decay" else stored_max
+        if vmax <= 0:
+            self._u8.fill(0)
+            return self._u8
+
+        scale = 255.0 / vmax
+        if self.mode == "decay":
+            scale /= self._gain
+        # scale in float64, then narrow: the float32 buffer only ever holds 0..255+
+        np.multiply(self._counts, scale, out=self._fbuf, casting="unsafe")
+        # counts are >= 0, so convertScaleAbs is a saturating cast to uint8
+        cv2.convertScaleAbs(self._fbuf, dst=self._u8)
+        return self._u8
+
+
+Composit = Union[np.ndarray, CompositeAccumulator]
+
+
 @dataclass
 class ContourConfig:
     adaptive: bool = False
@@ -21,13 +262,27 @@ class ContourConfig:
     contour_min_size: int = 1              # minimum number of points in contour
     contour_min_area: int = 0              # inclusive lower area cut
     contour_max_area: int = 3      # inclusive upper area cut
+    # non-uint8 frames (Mono12/Mono16):
+    normalization: str = "minmax"          # "minmax": per-frame float rescale (legacy), "fixed": fixed range
+    bit_depth: int = 16                    # "fixed": significant bits of the pixel format (12 for Mono12)
+    input_range: Optional[Tuple[int, int]] = None   # "fixed": (lo, hi) -> 0..255, default (0, 2^bit_depth - 1)
+    # region of interest, in frame pixels (hits are always reported in frame pixels):
+    roi: Optional[Tuple[int, int, int, int]] = None          # (x, y, w, h) rectangle that is analysed
+    roi_circle: Optional[Tuple[float, float, float]] = None  # (cx, cy, r) mask; alone it also sets the rectangle
+    binning: int = 1                       # software bxb binning (block mean); area cuts apply to binned pixels
+
+
+# Detection preset for SimulatedIonCamera / IonFrameSynthesizer with the default
+# IonSimConfig (dark level ~4 +- 1.5, spots ~120 high, up to ~30 px): the default
+# threshold_value=1 sits in the noise floor and merges everything into one blob.
+SIMULATED_CAMERA_CONFIG = ContourConfig(threshold_value=40, contour_max_area=30)
 
 
 def threshold_and_extract_hits(
     frame: np.ndarray,
     config: ContourConfig = ContourConfig(),
-    composit: Optional[np.ndarray] = None,
-) -> Tuple[np.ndarray, np.ndarray, List[Hit]]:
+    composit: Optional[Composit] = None,
+) -> Tuple[np.ndarray, Composit, List[Hit]]:
     """
     Python version of your C++ logic:
 
@@ -38,8 +293,12 @@ def threshold_and_extract_hits(
           * compute centroid via moments
           * compute area and perimeter
           * apply area bounds + bounds check
-          * increment composit[cy, cx] by 1 (uint8 wrap-around like C++)
           * store Hit(cx, cy, area, roundness)
+      - composit[cy, cx] += 1 for all hits at once (see accumulate_composit)
+
+    With config.roi / roi_circle / binning only that part of the frame is
+    thresholded and contoured (see _analysis_image); hit coordinates are
+    mapped back to frame pixels.
 
     Parameters
     ----------
@@ -47,18 +306,252 @@ def threshold_and_extract_hits(
         Grayscale (H,W) or BGR (H,W,3).
     config : ContourConfig
         Parameters matching the C++ code.
-    composit : np.ndarray | None
-        Optional uint8 accumulator image of shape (H,W). If None, a new one is created.
+    composit : np.ndarray | CompositeAccumulator | None
+        Optional uint8 accumulator image of shape (H,W) (wraps at 255 like C++),
+        or a CompositeAccumulator. If None, a new uint8 image is created.
 
     Returns
     -------
     frame_threshold : np.ndarray
-        Thresholded binary image (uint8, 0/255).
-    composit : np.ndarray
-        uint8 accumulator image where composit[cy,cx] += 1 for each accepted contour.
+        Thresholded binary image (uint8, 0/255) of the analysed (ROI, binned) region.
+    composit : np.ndarray | CompositeAccumulator
+        The accumulator passed in (or the new uint8 image), with composit[cy,cx] += 1
+        for each accepted contour.
     hits : List[Hit]
         List of extracted hit entries.
     """
+    frame_threshold, origin = _analysis_image(frame, config)
+    height, width = frame_threshold.shape[:2]
+    composit = _check_composit(composit, frame.shape[0], frame.shape[1])
+    contours = _find_contours(frame_threshold)
+
+    hits: List[Hit] = []
+
+    # --- Process contours ---
+    for contour in contours:
+        if int(contour.shape[0]) < int(config.contour_min_size):
+            continue
+
+        m = cv2.moments(contour)
+        m00 = m.get("m00", 0.0)
+        if m00 == 0.0:
+            continue
+
+        cx = int(m["m10"] / m00)
+        cy = int(m["m01"] / m00)
+
+        area = float(cv2.contourArea(contour))
+        perimeter = float(cv2.arcLength(contour, True))
+
+        # Area cuts (C++: if (area < min || area > max) continue;)
+        if area < float(config.contour_min_area) or area > float(config.contour_max_area):
+            continue
+
+        # Bounds check
+        if cx < 0 or cy < 0 or cx >= width or cy >= height:
+            continue
+
+        # C++: roundness = (perimeter^2)/area - 4*pi
+        # (Your code uses ~3141.59265359 which looks like 1000*pi; assume you intended pi.)
+        # We'll use pi here.
+        if area > 0:
+            roundness = (perimeter * perimeter) / area - 4.0 * np.pi
+        else:
+            roundness = float("inf")
+
+        cx, cy = _to_frame(cx, cy, origin)
+        hits.append(Hit(cx=cx, cy=cy, area=int(area), roundness=float(roundness)))
+
+    accumulate_composit(composit, HitBatch.from_hits(hits))
+    return frame_threshold, composit, hits
+
+
+def extract_hits_batch(
+    frame: np.ndarray,
+    config: ContourConfig = ContourConfig(),
+    composit: Optional[Composit] = None,
+    frame_index: int = 0,
+    timestamp: float = 0.0,
+) -> Tuple[np.ndarray, Composit, HitBatch]:
+    """
+    Batch version of threshold_and_extract_hits.
+
+    Same thresholding and findContours call, but the per-contour
+    cv2.moments / contourArea / arcLength calls are replaced by one
+    vectorized pass over all contour points:
+
+      - all contours are concatenated into one (N,2) point array
+      - shoelace terms (the ones cv2.moments uses for contours) are summed
+        per contour with np.add.reduceat -> m00, m10, m01, area
+      - edge lengths are summed the same way -> perimeter
+      - the ContourConfig cuts are applied as boolean masks
+
+    Contour points are integers, so m00/m10/m01 are exact and the accepted
+    hits are identical to the contour loop (roundness may differ in the last
+    bits because the perimeter is summed in a different order).
+
+    Pixel-based blob statistics (cv2.connectedComponentsWithStats) are not
+    used on purpose: they count pixels, while the contour path cuts on the
+    polygon area through the pixel centres (a single pixel has area 0), so
+    they would accept a different set of hits.
+
+    frame_index and timestamp are copied into the returned HitBatch so
+    batches of several frames can be concatenated.
+
+    Returns
+    -------
+    frame_threshold : np.ndarray
+        Thresholded binary image (uint8, 0/255) of the analysed (ROI, binned) region.
+    composit : np.ndarray | CompositeAccumulator
+        Accumulator (see threshold_and_extract_hits), incremented at every accepted hit.
+    hits : HitBatch
+        Accepted hits as contiguous arrays.
+    """
+    frame_threshold, origin = _analysis_image(frame, config)
+    height, width = frame_threshold.shape[:2]
+    composit = _check_composit(composit, frame.shape[0], frame.shape[1])
+    contours = _find_contours(frame_threshold)
+
+    if len(contours) == 0:
+        hits = HitBatch.empty()
+        accumulate_composit(composit, hits)  # still counts as a frame for window/decay
+        return frame_threshold, composit, hits
+
+    lengths = np.fromiter(map(len, contours), dtype=np.int64, count=len(contours))
+    pts = np.concatenate(contours).reshape(-1, 2).astype(np.int64)
+    x = pts[:, 0]
+    y = pts[:, 1]
+
+    # index of the previous point on the same (closed) contour
+    starts = np.cumsum(lengths) - lengths
+    prev = np.arange(pts.shape[0], dtype=np.int64) - 1
+    prev[starts] = starts + lengths - 1
+    xp = x[prev]
+    yp = y[prev]
+
+    # shoelace terms, same as OpenCV's contourMoments
+    dxy = xp * y - x * yp
+    a00 = np.add.reduceat(dxy, starts)
+    a10 = np.add.reduceat(dxy * (xp + x), starts)
+    a01 = np.add.reduceat(dxy * (yp + y), starts)
+    perimeter = np.add.reduceat(np.hypot(x - xp, y - yp), starts)
+
+    keep = (lengths >= int(config.contour_min_size)) & (a00 != 0)
+
+    # cv2.moments: m00 = |a00|/2, m10 = a10/6 * sign(a00)
+    sign = np.where(a00 < 0, -1.0, 1.0)
+    m00 = np.abs(a00).astype(np.float64) * 0.5
+    m00_safe = np.where(keep, m00, 1.0)
+    cx_f = (a10 * sign * (1.0 / 6.0)) / m00_safe
+    cy_f = (a01 * sign * (1.0 / 6.0)) / m00_safe
+    area = m00  # contourArea == |a00|/2
+
+    keep &= (area >= float(config.contour_min_area)) & (area <= float(config.contour_max_area))
+    # int() truncates toward zero; keep negative centroids out like the loop does
+    keep &= (cx_f > -1.0) & (cy_f > -1.0)
+    cx = np.trunc(cx_f).astype(np.int64)
+    cy = np.trunc(cy_f).astype(np.int64)
+    keep &= (cx < width) & (cy < height)
+
+    area = area[keep]
+    perimeter = perimeter[keep]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        roundness = np.where(
+            area > 0, (perimeter * perimeter) / area - 4.0 * np.pi, np.inf
+        )
+
+    cx, cy = _to_frame(cx[keep], cy[keep], origin)
+    hits = HitBatch.from_frame(
+        cx=cx,
+        cy=cy,
+        area=area,
+        roundness=roundness,
+        frame_index=frame_index,
+        timestamp=timestamp,
+    )
+    accumulate_composit(composit, hits)
+    return frame_threshold, composit, hits
+
+
+def accumulate_composit(composit: Composit, hits: HitBatch) -> Composit:
+    """
+    composit[cy,cx] += 1 for every hit in the batch, in place.
+    A plain uint8 image wraps at 255 like C++; a CompositeAccumulator does not.
+    """
+    if isinstance(composit, CompositeAccumulator):
+        composit.add(hits)
+    else:
+        np.add.at(composit, (hits.cy, hits.cx), np.uint8(1))
+    return composit
+
+
+# ---- shared steps ----
+
+def _analysis_image(frame: np.ndarray, config: ContourConfig) -> Tuple[np.ndarray, Tuple[int, int, int]]:
+    """
+    Crop to the ROI (a view, no copy), bin, convert to 8 bit, threshold and
+    apply the circular mask. Returns the binary image and the origin
+    (x0, y0, binning) that maps its pixels back to frame pixels.
+    """
+    if frame is None or not isinstance(frame, np.ndarray):
+        raise TypeError("frame must be a numpy array")
+    if frame.ndim not in (2, 3):
+        raise ValueError("frame must be HxW (grayscale) or HxWx3 (BGR)")
+
+    b = max(1, int(config.binning))
+    x0, y0, x1, y1 = _roi_bounds(config, frame.shape[0], frame.shape[1])
+    # whole number of bxb blocks
+    x1 = x0 + (x1 - x0) // b * b
+    y1 = y0 + (y1 - y0) // b * b
+    if x1 <= x0 or y1 <= y0:
+        raise ValueError("ROI does not overlap the frame")
+
+    img = frame[y0:y1, x0:x1]
+    if b > 1:
+        img = cv2.resize(img, ((x1 - x0) // b, (y1 - y0) // b), interpolation=cv2.INTER_AREA)
+
+    binary = _threshold(_to_gray_u8(img, config), config)
+    if config.roi_circle is not None:
+        cx, cy, r = (float(v) for v in config.roi_circle)
+        mask = _circle_mask(binary.shape[:2], x0, y0, b, cx, cy, r)
+        cv2.bitwise_and(binary, mask, dst=binary)
+    return binary, (x0, y0, b)
+
+
+def _roi_bounds(config: ContourConfig, height: int, width: int) -> Tuple[int, int, int, int]:
+    if config.roi is not None:
+        x, y, w, h = (int(v) for v in config.roi)
+    elif config.roi_circle is not None:
+        cx, cy, r = (float(v) for v in config.roi_circle)
+        x, y = int(np.floor(cx - r)), int(np.floor(cy - r))
+        w = h = int(np.ceil(2.0 * r)) + 2
+    else:
+        return 0, 0, width, height
+    return max(0, x), max(0, y), min(width, x + w), min(height, y + h)
+
+
+@lru_cache(maxsize=8)
+def _circle_mask(shape: Tuple[int, int], x0: int, y0: int, b: int, cx: float, cy: float, r: float) -> np.ndarray:
+    """0/255 mask in analysis pixels; pixel centres inside the circle are kept. Cached, read-only."""
+    h, w = shape
+    ys = y0 + np.arange(h) * b + (b - 1) / 2.0
+    xs = x0 + np.arange(w) * b + (b - 1) / 2.0
+    inside = (xs[None, :] - cx) ** 2 + (ys[:, None] - cy) ** 2 <= r * r
+    mask = np.where(inside, np.uint8(255), np.uint8(0))
+    mask.setflags(write=False)
+    return mask
+
+
+def _to_frame(cx, cy, origin: Tuple[int, int, int]):
+    """Analysis pixel -> frame pixel (ints or int arrays); a binned pixel maps to its block centre."""
+    x0, y0, b = origin
+    if b == 1 and x0 == 0 and y0 == 0:
+        return cx, cy
+    half = (b - 1) // 2
+    return x0 + cx * b + half, y0 + cy * b + half
+
+
+def _to_gray_u8(frame: np.ndarray, config: ContourConfig = ContourConfig()) -> np.ndarray:
     if frame is None or not isinstance(frame, np.ndarray):
         raise TypeError("frame must be a numpy array")
 
@@ -70,8 +563,17 @@ def threshold_and_extract_hits(
     else:
         raise ValueError("frame must be HxW (grayscale) or HxWx3 (BGR)")
 
+    if config.normalization not in ("minmax", "fixed"):
+        raise ValueError("normalization must be 'minmax' or 'fixed'")
+
     # Ensure uint8 (OpenCV thresholding expects 8-bit single channel)
-    if gray.dtype != np.uint8:
+    if gray.dtype == np.uint16 and config.normalization == "fixed":
+        # native 16-bit path: one saturating scale pass, same mapping for every frame
+        lo, hi = _fixed_range(config)
+        if lo > 0:
+            gray = cv2.subtract(gray, lo)
+        gray_u8 = cv2.convertScaleAbs(gray, alpha=255.0 / (hi - lo))
+    elif gray.dtype != np.uint8:
         g = gray.astype(np.float32)
         g = np.nan_to_num(g)
         gmin, gmax = float(np.min(g)), float(np.max(g))
@@ -81,16 +583,32 @@ def threshold_and_extract_hits(
     else:
         gray_u8 = gray
 
-    height, width = gray_u8.shape[:2]
+    return gray_u8
 
-    # --- composit init ---
-    if composit is None:
-        composit = np.zeros((height, width), dtype=np.uint8)
+
+def _fixed_range(config: ContourConfig) -> Tuple[int, int]:
+    if config.input_range is not None:
+        lo, hi = int(config.input_range[0]), int(config.input_range[1])
     else:
-        if composit.shape != (height, width) or composit.dtype != np.uint8:
-            raise ValueError("composit must be uint8 with shape (H,W) matching frame")
+        lo, hi = 0, (1 << int(config.bit_depth)) - 1
+    if hi <= lo:
+        raise ValueError("input_range must satisfy lo < hi")
+    return lo, hi
+
+
+def _check_composit(composit: Optional[Composit], height: int, width: int) -> Composit:
+    if composit is None:
+        return np.zeros((height, width), dtype=np.uint8)
+    if isinstance(composit, CompositeAccumulator):
+        if composit.shape != (height, width):
+            raise ValueError("CompositeAccumulator shape must match frame (H,W)")
+        return composit
+    if composit.shape != (height, width) or composit.dtype != np.uint8:
+        raise ValueError("composit must be uint8 with shape (H,W) matching frame")
+    return composit
+
 
-    # --- Thresholding ---
+def _threshold(gray_u8: np.ndarray, config: ContourConfig) -> np.ndarray:
     if not config.adaptive:
         _, frame_threshold = cv2.threshold(
             gray_u8, config.threshold_value, 255, cv2.THRESH_BINARY
@@ -111,50 +629,13 @@ def threshold_and_extract_hits(
             gray_u8, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY, block, C
         )
 
-    # --- Find contours ---
+    return frame_threshold
+
+
+def _find_contours(frame_threshold: np.ndarray) -> Sequence[np.ndarray]:
     res = cv2.findContours(frame_threshold,  cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
     if len(res) == 2:
         contours, _hier = res
     else:
         _img, contours, _hier = res
-
-    hits: List[Hit] = []
-
-    # --- Process contours ---
-    for contour in contours:
-        if int(contour.shape[0]) < int(config.contour_min_size):
-            continue
-
-        m = cv2.moments(contour)
-        m00 = m.get("m00", 0.0)
-        if m00 == 0.0:
-            continue
-
-        cx = int(m["m10"] / m00)
-        cy = int(m["m01"] / m00)
-
-        area = float(cv2.contourArea(contour))
-        perimeter = float(cv2.arcLength(contour, True))
-
-        # Area cuts (C++: if (area < min || area > max) continue;)
-        if area < float(config.contour_min_area) or area > float(config.contour_max_area):
-            continue
-
-        # Bounds check
-        if cx < 0 or cy < 0 or cx >= width or cy >= height:
-            continue
-
-        # composit[cy,cx] += 1 with uint8 wrap-around like C++
-        composit[cy, cx] = np.uint8(int(composit[cy, cx]) + 1)
-
-        # C++: roundness = (perimeter^2)/area - 4*pi
-        # (Your code uses ~3141.59265359 which looks like 1000*pi; assume you intended pi.)
-        # We'll use pi here.
-        if area > 0:
-            roundness = (perimeter * perimeter) / area - 4.0 * np.pi
-        else:
-            roundness = float("inf")
-
-        hits.append(Hit(cx=cx, cy=cy, area=int(area), roundness=float(roundness)))
-
-    return frame_threshold, composit, hits
+    return contours
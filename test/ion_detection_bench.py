@@ -0,0 +1,218 @@
+"""
+Benchmark suite for the ion-detection hot path.
+
+Times every stage of ion_detection on synthetic frames (see
+LabviewToPython/devices/simulated_camera.py) across frame sizes, hit
+densities and dtypes:
+
+    normalize            to 8 bit (uint16 only: the float min/max rescale)
+    normalize_fixed      to 8 bit with the fixed-range 16-bit path
+    threshold_fixed      cv2.threshold
+    threshold_adaptive   cv2.adaptiveThreshold
+    contours             cv2.findContours
+    pipeline_loop        threshold_and_extract_hits (per-contour loop)
+    pipeline_batch       extract_hits_batch (vectorized)
+    pipeline_batch_fixed extract_hits_batch with normalization="fixed"
+    pipeline_batch_roi   extract_hits_batch on the central quarter, circular mask
+    pipeline_batch_bin2  extract_hits_batch with 2x2 software binning
+    composite_u8         accumulate hits into the legacy uint8 composit
+    composite            CompositeAccumulator.add (uint32)
+    composite_display    CompositeAccumulator.display (uint8 view)
+
+Per stage: latency percentiles (p50/p90/p99, ms) from a timing pass, and
+transient allocations (peak bytes above baseline) from a separate
+tracemalloc pass so tracing does not distort the timings. Results go to a
+JSON file that --compare can diff against a previous run.
+
+    python ion_detection_bench.py --quick
+    python ion_detection_bench.py --out bench.json --compare old.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from LabviewToPython.devices.simulated_camera import IonFrameSynthesizer, IonSimConfig  # noqa: E402
+
+from ion_detection import (  # noqa: E402
+    SIMULATED_CAMERA_CONFIG,
+    CompositeAccumulator,
+    ContourConfig,
+    _find_contours,
+    _threshold,
+    _to_gray_u8,
+    accumulate_composit,
+    extract_hits_batch,
+    threshold_and_extract_hits,
+)
+
+
+SIZES = {"vga": (480, 640), "1.6mp": (1080, 1440), "5mp": (2048, 2448)}
+DENSITIES = (10, 200, 2000)
+DTYPES = ("uint8", "uint16")
+
+CFG_FIXED = SIMULATED_CAMERA_CONFIG
+CFG_FIXED_RANGE = ContourConfig(threshold_value=40, contour_max_area=30, normalization="fixed")
+CFG_BIN2 = ContourConfig(threshold_value=40, contour_max_area=30, binning=2)
+CFG_ADAPTIVE = ContourConfig(adaptive=True, adaptive_blocksize=15, adaptive_shift=20.0, contour_max_area=30)
+
+
+def make_frames(shape, ions: int, dtype: str, n: int, seed: int = 0) -> List[np.ndarray]:
+    synth = IonFrameSynthesizer(IonSimConfig(
+        height=shape[0], width=shape[1], ions_per_frame=ions, seed=seed, noise_bank=2,
+        pixel_format="Mono8" if dtype == "uint8" else "Mono16",
+    ))
+    return [synth.render()[0] for _ in range(n)]
+
+
+def time_stage(fn: Callable[[int], object], n_inputs: int, repeat: int) -> np.ndarray:
+    fn(0)  # warm-up
+    lat = []
+    for r in range(repeat):
+        for i in range(n_inputs):
+            t0 = time.perf_counter()
+            fn(i)
+            lat.append(time.perf_counter() - t0)
+    return np.asarray(lat)
+
+
+def alloc_stage(fn: Callable[[int], object], n_inputs: int) -> int:
+    """Largest transient allocation (bytes above baseline) over one call per input."""
+    tracemalloc.start()
+    peak = 0
+    for i in range(n_inputs):
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        out = fn(i)
+        _, p = tracemalloc.get_traced_memory()
+        peak = max(peak, p - base)
+        del out
+    tracemalloc.stop()
+    return int(peak)
+
+
+def bench_case(size: str, ions: int, dtype: str, n_frames: int, repeat: int) -> Dict:
+    shape = SIZES[size]
+    frames = make_frames(shape, ions, dtype, n_frames)
+    grays = [_to_gray_u8(f) for f in frames]
+    binaries = [_threshold(g, CFG_FIXED) for g in grays]
+    hits = [extract_hits_batch(f, CFG_FIXED)[2] for f in frames]
+    composit = np.zeros(shape, dtype=np.uint8)
+    h, w = shape
+    cfg_roi = ContourConfig(threshold_value=40, contour_max_area=30,
+                            roi=(w // 4, h // 4, w // 2, h // 2), roi_circle=(w / 2, h / 2, h / 4))
+    accumulator = CompositeAccumulator(shape)
+
+    stages: Dict[str, Callable[[int], object]] = {
+        "normalize": lambda i: _to_gray_u8(frames[i]),
+        "normalize_fixed": lambda i: _to_gray_u8(frames[i], CFG_FIXED_RANGE),
+        "threshold_fixed": lambda i: _threshold(grays[i], CFG_FIXED),
+        "threshold_adaptive": lambda i: _threshold(grays[i], CFG_ADAPTIVE),
+        "contours": lambda i: _find_contours(binaries[i]),
+        "pipeline_loop": lambda i: threshold_and_extract_hits(frames[i], CFG_FIXED, composit),
+        "pipeline_batch": lambda i: extract_hits_batch(frames[i], CFG_FIXED, composit),
+        "pipeline_batch_fixed": lambda i: extract_hits_batch(frames[i], CFG_FIXED_RANGE, composit),
+        "pipeline_batch_roi": lambda i: extract_hits_batch(frames[i], cfg_roi, composit),
+        "pipeline_batch_bin2": lambda i: extract_hits_batch(frames[i], CFG_BIN2, composit),
+        "composite_u8": lambda i: accumulate_composit(composit, hits[i]),
+        "composite": lambda i: accumulator.add(hits[i]),
+        "composite_display": lambda i: accumulator.display(),
+    }
+
+    result = {
+        "size": size, "shape": list(shape), "ions_per_frame": ions, "dtype": dtype,
+        "hits_per_frame": float(np.mean([len(h) for h in hits])),
+        "stages": {},
+    }
+    for name, fn in stages.items():
+        lat = time_stage(fn, n_frames, repeat) * 1e3
+        result["stages"][name] = {
+            "mean_ms": float(lat.mean()),
+            "p50_ms": float(np.percentile(lat, 50)),
+            "p90_ms": float(np.percentile(lat, 90)),
+            "p99_ms": float(np.percentile(lat, 99)),
+            "alloc_peak_bytes": alloc_stage(fn, n_frames),
+        }
+    for name in ("pipeline_loop", "pipeline_batch", "pipeline_batch_fixed"):
+        result[f"fps_{name[9:]}"] = 1e3 / result["stages"][name]["mean_ms"]
+    return result
+
+
+def case_key(r: Dict) -> str:
+    return f"{r['size']}/{r['ions_per_frame']}/{r['dtype']}"
+
+
+def print_case(r: Dict, ref: Dict = None) -> None:
+    print(f"\n{case_key(r)}  ({r['hits_per_frame']:.0f} hits/frame)  "
+          f"fps loop {r['fps_loop']:.1f}  batch {r['fps_batch']:.1f}  "
+          f"batch/fixed {r.get('fps_batch_fixed', float('nan')):.1f}")
+    print(f"  {'stage':20s} {'p50 ms':>8s} {'p90 ms':>8s} {'p99 ms':>8s} {'alloc MB':>9s}"
+          + ("  vs ref" if ref else ""))
+    for name, s in r["stages"].items():
+        line = (f"  {name:20s} {s['p50_ms']:8.3f} {s['p90_ms']:8.3f} {s['p99_ms']:8.3f} "
+                f"{s['alloc_peak_bytes'] / 1e6:9.2f}")
+        if ref and name in ref["stages"]:
+            line += f"  x{s['p50_ms'] / max(ref['stages'][name]['p50_ms'], 1e-9):.2f}"
+        print(line)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", nargs="+", default=list(SIZES), choices=list(SIZES))
+    ap.add_argument("--densities", nargs="+", type=int, default=list(DENSITIES))
+    ap.add_argument("--dtypes", nargs="+", default=list(DTYPES), choices=list(DTYPES))
+    ap.add_argument("--frames", type=int, default=10, help="distinct frames per case")
+    ap.add_argument("--repeat", type=int, default=3, help="timing passes over the frames")
+    ap.add_argument("--quick", action="store_true", help="vga + 1.6mp, 200 hits, 5 frames x 2")
+    ap.add_argument("--out", default="ion_detection_bench.json")
+    ap.add_argument("--compare", help="previous result file; prints p50 ratios")
+    args = ap.parse_args()
+
+    if args.quick:
+        if args.sizes == list(SIZES):
+            args.sizes = ["vga", "1.6mp"]
+        if args.densities == list(DENSITIES):
+            args.densities = [200]
+        args.frames, args.repeat = 5, 2
+
+    ref = {}
+    if args.compare:
+        with open(args.compare) as f:
+            ref = {case_key(r): r for r in json.load(f)["results"]}
+
+    results = []
+    for size in args.sizes:
+        for ions in args.densities:
+            for dtype in args.dtypes:
+                r = bench_case(size, ions, dtype, args.frames, args.repeat)
+                print_case(r, ref.get(case_key(r)))
+                results.append(r)
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "machine": {
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "opencv": cv2.__version__,
+        },
+        "settings": {"frames": args.frames, "repeat": args.repeat},
+        "results": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nwrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
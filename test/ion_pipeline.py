@@ -0,0 +1,314 @@
+import multiprocessing as mp
+import os
+import queue
+import threading
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Deque, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from frame_pool import FramePool, PooledFrame
+from ion_detection import ContourConfig, HitBatch, extract_hits_batch
+
+
+RingSpec = Tuple[str, Tuple[int, ...], str, int]   # (shm name, frame shape, dtype str, n_slots)
+
+
+class SharedFrameRing:
+    """
+    n_slots frames of one fixed shape/dtype in a single SharedMemory block.
+
+    The creating process owns the block (close + unlink); workers attach by
+    name via spec() / attach() and only see NumPy views on the slots, so a
+    frame is written once and never pickled.
+    """
+
+    def __init__(
+        self,
+        shape: Tuple[int, ...],
+        dtype=np.uint8,
+        n_slots: int = 8,
+        name: Optional[str] = None,
+    ) -> None:
+        self.shape = tuple(int(s) for s in shape)
+        self.dtype = np.dtype(dtype)
+        self.n_slots = int(n_slots)
+        self._owner = name is None
+
+        frame_bytes = int(np.prod(self.shape)) * self.dtype.itemsize
+        if self._owner:
+            self._shm = shared_memory.SharedMemory(create=True, size=frame_bytes * self.n_slots)
+        else:
+            self._shm = _attach_shm(name)
+
+        self._frames = np.ndarray(
+            (self.n_slots,) + self.shape, dtype=self.dtype, buffer=self._shm.buf
+        )
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def spec(self) -> RingSpec:
+        return (self.name, self.shape, self.dtype.str, self.n_slots)
+
+    @classmethod
+    def attach(cls, spec: RingSpec) -> "SharedFrameRing":
+        name, shape, dtype, n_slots = spec
+        return cls(shape, dtype, n_slots, name=name)
+
+    @property
+    def frames(self) -> np.ndarray:
+        """(n_slots, *shape) view on the whole block."""
+        return self._frames
+
+    def slot(self, i: int) -> np.ndarray:
+        """Writable view on slot i (no copy)."""
+        return self._frames[i]
+
+    def close(self) -> None:
+        self._frames = None  # drop the view before releasing the buffer
+        try:
+            self._shm.close()
+        except BufferError:
+            pass  # a consumer still holds a view; the mapping goes away with it
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _attach_shm(name: str) -> shared_memory.SharedMemory:
+    # Python >= 3.13: don't let the worker's resource tracker unlink the parent's block
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+@dataclass
+class AnalysisStats:
+    submitted: int = 0          # frames accepted into the ring
+    copied: int = 0             # of those, frames that had to be copied into a slot
+    dropped: int = 0            # frames rejected because every slot was busy
+    completed: int = 0          # results handed back in order
+    errors: int = 0             # frames whose analysis raised in a worker
+    lost: int = 0               # frames in flight in a worker process that died (skipped)
+    restarts: int = 0           # worker processes respawned after dying
+    queue_depth: int = 0        # frames in the ring waiting for / inside a worker
+    reorder_depth: int = 0      # finished results waiting for an earlier frame
+
+
+class AnalysisStage:
+    """
+    Runs extract_hits_batch on a pool of worker processes.
+
+    Frames live in a FramePool whose slots are the SharedFrameRing, so a
+    producer that fills a slot from stage.pool hands it over by reference;
+    any other array is copied into a free slot first. Only the slot number
+    is queued; workers analyse the slot in shared memory and send back a
+    small HitBatch. results() returns the batches in the order the frames were
+    submitted; ordering uses a private submit sequence number, so frame
+    indices may have gaps (camera drops) or repeat.
+
+    A worker process that dies (segfault in cv2, OOM kill) is noticed by
+    results(): the frame it was analysing is skipped and counted as lost,
+    its slot is released and the worker is respawned.
+
+    If all slots are busy the frame is dropped and counted, so a slow
+    analysis never blocks acquisition and memory stays at n_slots frames.
+    """
+
+    def __init__(
+        self,
+        shape: Tuple[int, ...],
+        dtype=np.uint8,
+        config: ContourConfig = ContourConfig(),
+        n_workers: Optional[int] = None,
+        n_slots: Optional[int] = None,
+    ) -> None:
+        self._n_workers = max(1, int(n_workers or (os.cpu_count() or 2) - 1))
+        self._ring = SharedFrameRing(shape, dtype, n_slots or 2 * self._n_workers + 2)
+        self._pool = FramePool(shape, dtype, frames=self._ring.frames)
+        self._config = config
+
+        self._ctx = mp.get_context("spawn")
+        self._tasks = self._ctx.Queue()
+        self._results = self._ctx.Queue()
+        # per worker: sequence number of the frame it is analysing, -1 if idle
+        self._busy = self._ctx.Array("q", [-1] * self._n_workers, lock=False)
+        self._procs: List[mp.Process] = [self._spawn(i) for i in range(self._n_workers)]
+
+        self._lock = threading.Lock()
+        self._seq = 0                                      # next submit sequence number
+        self._held: Dict[int, PooledFrame] = {}            # seq -> slot reference held for the worker
+        self._order: Deque[int] = deque()                  # submitted sequence numbers, FIFO
+        self._done: Dict[int, Optional[HitBatch]] = {}     # seq -> finished (None: lost), not yet released
+        self._stats = AnalysisStats()
+        self._started = False
+
+    def _spawn(self, i: int) -> mp.Process:
+        return self._ctx.Process(
+            target=_worker_main,
+            args=(i, self._ring.spec(), self._config, self._tasks, self._results, self._busy),
+            daemon=True,
+            name=f"ion-analysis-{i}",
+        )
+
+    # ---- lifecycle ----
+    def start(self) -> None:
+        if self._started:
+            return
+        for p in self._procs:
+            p.start()
+        self._started = True
+
+    def stop(self, timeout: float = 2.0) -> None:
+        if self._started:
+            for _ in self._procs:
+                self._tasks.put(None)
+            for p in self._procs:
+                p.join(timeout)
+                if p.is_alive():
+                    p.terminate()
+            self._started = False
+        self._held.clear()
+        self._ring.close()
+
+    # ---- producer side ----
+    @property
+    def pool(self) -> FramePool:
+        """Pool over the shared ring; fill a slot from here to submit without a copy."""
+        return self._pool
+
+    def submit(
+        self,
+        frame: Union[np.ndarray, PooledFrame],
+        frame_index: Optional[int] = None,
+        timestamp: Optional[float] = None,
+    ) -> bool:
+        """
+        Queue one frame; returns False (and counts a drop) if the ring is full.
+
+        A PooledFrame from self.pool is retained, not copied; the caller keeps
+        its own reference and releases it as usual. frame_index / timestamp
+        default to the PooledFrame's fields.
+        """
+        if isinstance(frame, PooledFrame):
+            if frame_index is None:
+                frame_index = frame.frame_index
+            if timestamp is None:
+                timestamp = frame.timestamp
+        if frame_index is None:
+            raise ValueError("frame_index is required for plain arrays")
+
+        if isinstance(frame, PooledFrame) and self._pool.owns(frame):
+            item = frame.retain()
+        else:
+            item = self._pool.acquire()
+            if item is None:
+                with self._lock:
+                    self._stats.dropped += 1
+                return False
+            np.copyto(item.array, frame.array if isinstance(frame, PooledFrame) else frame)
+            with self._lock:
+                self._stats.copied += 1
+
+        with self._lock:
+            seq = self._seq
+            self._seq += 1
+            self._held[seq] = item
+            self._order.append(seq)
+            self._stats.submitted += 1
+        self._tasks.put((seq, item.slot, int(frame_index), float(timestamp or 0.0)))
+        return True
+
+    # ---- consumer side ----
+    def results(self, timeout: float = 0.0) -> List[HitBatch]:
+        """
+        Collect finished frames and return those that are next in order.
+        Non-blocking by default; with timeout > 0 waits for the first result.
+        """
+        block = timeout > 0
+        while True:
+            try:
+                seq, hits, failed = self._results.get(block, timeout)
+            except queue.Empty:
+                break
+            block = False
+            with self._lock:
+                item = self._held.pop(seq, None)
+                if item is None:
+                    continue    # already written off as lost
+                self._done[seq] = hits
+                if failed:
+                    self._stats.errors += 1
+            item.release()
+        if self._started:
+            self._reap()
+
+        ready: List[HitBatch] = []
+        with self._lock:
+            while self._order and self._order[0] in self._done:
+                hits = self._done.pop(self._order.popleft())
+                if hits is not None:
+                    ready.append(hits)
+            self._stats.completed += len(ready)
+        return ready
+
+    def _reap(self) -> None:
+        """Skip the frame of every dead worker, release its slot, start a replacement."""
+        for i, p in enumerate(self._procs):
+            if p.exitcode is None:
+                continue
+            seq, self._busy[i] = self._busy[i], -1
+            with self._lock:
+                item = self._held.pop(seq, None) if seq >= 0 else None
+                if item is not None:
+                    self._done[seq] = None
+                    self._stats.lost += 1
+                self._stats.restarts += 1
+            if item is not None:
+                item.release()
+            self._procs[i] = self._spawn(i)
+            self._procs[i].start()
+
+    @property
+    def stats(self) -> AnalysisStats:
+        with self._lock:
+            s = AnalysisStats(**vars(self._stats))
+            s.reorder_depth = len(self._done)
+            s.queue_depth = len(self._order) - s.reorder_depth
+        return s
+
+    @property
+    def n_workers(self) -> int:
+        return self._n_workers
+
+
+def _worker_main(worker: int, spec: RingSpec, config: ContourConfig, tasks, results, busy) -> None:
+    ring = SharedFrameRing.attach(spec)
+    composit = np.zeros(ring.shape[:2], dtype=np.uint8)   # scratch; the parent accumulates
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            seq, slot, frame_index, timestamp = task
+            busy[worker] = seq
+            try:
+                _, _, hits = extract_hits_batch(
+                    ring.slot(slot), config, composit,
+                    frame_index=frame_index, timestamp=timestamp,
+                )
+                failed = False
+            except Exception:
+                hits = HitBatch.empty()
+                failed = True
+            results.put((seq, hits, failed))
+            busy[worker] = -1
+    finally:
+        ring.close()
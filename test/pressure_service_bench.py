@@ -0,0 +1,63 @@
+"""
+PressureService with simulated gauges: per-channel target vs. effective rate.
+
+One gauge per port: two fast gauges on COM1/COM4, one slow gauge on COM2
+needs pipelining to reach its rate, and the gauge on COM3 never answers
+(stuck port). The driver on COM5 hangs in its read and never returns;
+the stats watchdog must still report it stalled. The other channels
+should stay at their target rates regardless.
+
+    python pressure_service_bench.py --seconds 5
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from LabviewToPython.core.events.eventbus import EventBus  # noqa: E402
+from LabviewToPython.core.events.topics import PRESSURE_BATCH, PRESSURE_STATS  # noqa: E402
+from LabviewToPython.devices.simulated_gauge import SimulatedGauge  # noqa: E402
+from LabviewToPython.services.pressure_service import GaugeConfig, PressureService  # noqa: E402
+
+GAUGES = [
+    (GaugeConfig("chamber", "COM1", rate_hz=50), SimulatedGauge(latency_s=0.01)),
+    (GaugeConfig("foreline", "COM4", rate_hz=20), SimulatedGauge(latency_s=0.002)),
+    (GaugeConfig("source", "COM2", rate_hz=40, timeout_s=0.2), SimulatedGauge(latency_s=0.05, pipeline_depth=3)),
+    (GaugeConfig("stuck", "COM3", rate_hz=10, timeout_s=0.3), SimulatedGauge(stuck=True)),
+    (GaugeConfig("hung", "COM5", rate_hz=10, timeout_s=0.3), SimulatedGauge(hung=True)),
+]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--seconds", type=float, default=5.0)
+    args = ap.parse_args()
+
+    sensors = {cfg.channel: sensor for cfg, sensor in GAUGES}
+    bus = EventBus()
+    batches = []
+    bus.subscribe(PRESSURE_BATCH, lambda b: batches.append(len(b.readings)))
+
+    def on_stats(stats) -> None:
+        print("  ".join(f"{ch}: {s.effective_hz:5.1f}/{s.target_hz:4.0f} Hz"
+                        f"{' STALLED' if s.stalled else ''}" for ch, s in stats.items()))
+    bus.subscribe(PRESSURE_STATS, on_stats)
+
+    svc = PressureService(bus, [cfg for cfg, _ in GAUGES], sensor_factory=lambda cfg: sensors[cfg.channel])
+    svc.start_polling()
+    time.sleep(args.seconds)
+    stalled = {ch for ch, s in svc.stats().items() if s.stalled}
+    assert stalled == {"stuck", "hung"}, f"stalled: {sorted(stalled)}"
+    sensors["hung"].hung = False   # let the wedged lane finish so stop_polling can join it
+    t0 = time.perf_counter()
+    svc.stop_polling()
+    print(f"stop took {(time.perf_counter() - t0) * 1e3:.0f} ms; "
+          f"{len(batches)} batches, {sum(batches)} readings")
+    for ch, s in svc.stats().items():
+        print(f"{ch:10s} samples={s.samples:5d} timeouts={s.timeouts:4d} skipped={s.skipped:4d} "
+              f"errors={s.errors} latency={s.last_latency_s * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
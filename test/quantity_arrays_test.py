@@ -0,0 +1,74 @@
+"""
+PressureArray / LengthArray behaviour, and the pressure history they feed
+to plots through TimeSeriesStore.query_pressure().
+
+    python quantity_arrays_test.py
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from LabviewToPython.core.domain.enums.units.length_system import LengthSystem  # noqa: E402
+from LabviewToPython.core.domain.enums.units.pressure_unit import PressureUnit  # noqa: E402
+from LabviewToPython.core.domain.quantities.arrays import LengthArray, PressureArray  # noqa: E402
+from LabviewToPython.core.domain.quantities.pressure import Pressure  # noqa: E402
+from LabviewToPython.core.domain.quantities.units_context import UnitsContext  # noqa: E402
+from LabviewToPython.services.timeseries_store import TimeSeriesStore  # noqa: E402
+
+
+def test_copy_and_shape() -> None:
+    a = np.array([1.0, 2.0])
+    p = PressureArray.from_pa(a)
+    a[0] = 99.0
+    assert p.pa.tolist() == [1.0, 2.0], "from_pa copies by default"
+    assert not p.pa.flags.writeable
+
+    shared = PressureArray.from_pa(a, copy=False)
+    a[1] = 5.0
+    assert shared.pa.tolist() == [99.0, 5.0], "copy=False wraps the caller's buffer"
+
+    assert PressureArray(3.0).pa.tolist() == [3.0]
+    assert len(LengthArray.from_meters(0.5)) == 1
+    for bad in (lambda: PressureArray.from_pa(np.ones((2, 3))),
+                lambda: PressureArray.from_pa(np.ones((2, 3)), copy=False),
+                lambda: LengthArray(np.ones((2, 2)))):
+        try:
+            bad()
+        except ValueError:
+            continue
+        raise AssertionError("2-D input must be rejected")
+
+
+def test_units_and_items() -> None:
+    units = UnitsContext(PressureUnit.TORR)
+    p = PressureArray([1.0, 2.0], PressureUnit.TORR, units)
+    np.testing.assert_allclose(p.pa, [133.322368, 266.644736], rtol=1e-6)
+    values, label = p.display()
+    np.testing.assert_allclose(values, [1.0, 2.0], rtol=1e-9)
+    assert label == p.unit
+    assert isinstance(p[0], Pressure)
+    assert len(p[::2]) == 1
+
+    codes = [PressureArray.unit_code(PressureUnit.PA), PressureArray.unit_code(PressureUnit.TORR)]
+    np.testing.assert_allclose(PressureArray.from_mixed([100.0, 1.0], codes).pa, [100.0, 133.322368], rtol=1e-6)
+    np.testing.assert_allclose(LengthArray([1.0], LengthSystem.METRIC).meters, [1.0])
+
+
+def test_store_feeds_plots() -> None:
+    units = UnitsContext(PressureUnit.TORR)
+    store = TimeSeriesStore(capacity=64)
+    store.extend("pressure/chamber", np.arange(4.0), 133.322368 * np.arange(4.0))
+    ts, p = store.query_pressure("pressure/chamber", 1.0, 3.0, units)
+    assert ts.tolist() == [1.0, 2.0]
+    values, label = p.display()
+    np.testing.assert_allclose(values, [1.0, 2.0], rtol=1e-6)
+    assert label == units.pressure[2]
+
+
+if __name__ == "__main__":
+    test_copy_and_shape()
+    test_units_and_items()
+    test_store_feeds_plots()
+    print("ok")
@@ -0,0 +1,64 @@
+"""
+BusRecorder on a pattern: records 'pressure/*', replays to exact subscribers.
+
+Every record must carry the concrete topic it was published on (so typed
+events use their codec, not pickle) and reach a 'pressure/value'
+subscriber on replay.
+
+    python recording_test.py
+"""
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from LabviewToPython.core.events.eventbus import EventBus  # noqa: E402
+from LabviewToPython.core.events.recording import (  # noqa: E402
+    _REC, KIND_EVENT, KIND_SESSION, MAGIC, BusRecorder, BusReplayer, read_records,
+)
+from LabviewToPython.core.events.topics import PRESSURE_STATS, PRESSURE_VALUE, PressureValue  # noqa: E402
+
+
+def _kinds(path: str):
+    """topic -> record kinds used for it in the file."""
+    kinds = {}
+    with open(path, "rb") as f:
+        f.read(len(MAGIC))
+        while True:
+            head = f.read(_REC.size)
+            if len(head) < _REC.size:
+                return kinds
+            body_len, kind, _, name_len = _REC.unpack(head)
+            raw = f.read(body_len)
+            if kind != KIND_SESSION:
+                kinds.setdefault(raw[:name_len].decode("utf-8"), set()).add(kind)
+
+
+def test_pattern_record_replay() -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bus.rec")
+    bus = EventBus()
+    rec = BusRecorder(bus, path, ["pressure/*"])
+    rec.start()
+    values = [PressureValue("chamber", 1e-6 * i, "Pa", float(i)) for i in range(5)]
+    for v in values:
+        bus.publish(PRESSURE_VALUE, v)
+    bus.publish(PRESSURE_STATS, {"chamber": {"samples": 5}})
+    rec.stop()
+
+    topics = [r.topic for r in read_records(path)]
+    assert topics == [PRESSURE_VALUE] * 5 + [PRESSURE_STATS], topics
+    assert _kinds(path)[PRESSURE_VALUE] == {KIND_EVENT}, "typed events must use their codec"
+    assert len(list(read_records(path, ["pressure/*"]))) == 6
+
+    replay_bus = EventBus()
+    got, stats = [], []
+    replay_bus.subscribe(PRESSURE_VALUE, got.append)
+    replay_bus.subscribe(PRESSURE_STATS, stats.append)
+    BusReplayer(replay_bus, path, speed=0).run()
+    assert got == values, got
+    assert stats == [{"chamber": {"samples": 5}}], stats
+
+
+if __name__ == "__main__":
+    test_pattern_record_replay()
+    print("ok")
@@ -1,17 +1,19 @@
 # AcquireAndDisplay_PySide6_PyQtGraph.py
 import sys
 import time
+from typing import Callable
 
 import numpy as np
 import PySpin
 import cv2
 
-from PySide6.QtCore import QObject, QThread, Signal, Slot
+from PySide6.QtCore import QObject, QThread, QTimer, Signal, Slot
 from PySide6.QtWidgets import QApplication, QMainWindow, QMessageBox
 
 import pyqtgraph as pg
 
-from ion_detection import threshold_and_extract_hits
+from frame_pool import FramePool, PooledFrame
+from ion_pipeline import AnalysisStage
 
 
 
@@ -22,17 +24,28 @@ EXPOSURE_US = 2000.0          # manual exposure in microseconds
 TIMEOUT_MS = 1000             # GetNextImage timeout
 FORCE_MONO8 = True            # simplest/fastest for display
 gain_set = 25
+ANALYSIS_WORKERS = 3          # ion-detection worker processes
+FRAME_SLOTS = 2 * ANALYSIS_WORKERS + 6   # pooled frame buffers (analysis + display + in flight)
+RESULT_POLL_MS = 10           # how often finished analysis results are collected
+DISPLAY_FPS = 30.0            # GUI refresh target; newer frames replace older ones in between
+DISPLAY_MAX_PIXELS = 1_000_000   # larger frames are downsampled (block mean) for display only
+SENSOR_ROI = None             # (x, y, w, h) sensor readout region, None = full sensor (less USB + CPU when set)
 
 class CameraWorker(QObject):
-    frame_ready = Signal(object)     # emits numpy array
+    frame_ready = Signal(object)     # emits PooledFrame (receiver must release() it)
     status = Signal(str)
     finished = Signal()
 
-    def __init__(self, exposure_us: float):
+    def __init__(self, exposure_us: float, pool_factory: Callable[[tuple, np.dtype], FramePool]):
         super().__init__()
         self._exposure_us = float(exposure_us)
         self._running = False
 
+        # Pool is created on the first frame, once the image format is known
+        self._pool_factory = pool_factory
+        self._pool: FramePool | None = None
+        self.dropped = 0
+
         self._system = None
         self._cam_list = None
         self._cam = None
@@ -103,10 +116,36 @@ class CameraWorker(QObject):
             except Exception:
                 self.status.emit("Warning: Could not force PixelFormat=Mono8 (continuing).")
 
+        if SENSOR_ROI is not None:
+            self._set_sensor_roi(*SENSOR_ROI)
+
         self._cam.BeginAcquisition()
         self.status.emit("Acquisition started.")
 
+    def _set_sensor_roi(self, x: int, y: int, w: int, h: int):
+        """Sensor ROI; must be set before BeginAcquisition. Values are rounded to the node increments."""
+        def fit(node, value):
+            lo, hi, inc = int(node.GetMin()), int(node.GetMax()), max(1, int(node.GetInc()))
+            return lo + (max(lo, min(hi, int(value))) - lo) // inc * inc
+
+        cam = self._cam
+        if cam.Width.GetAccessMode() != PySpin.RW or cam.Height.GetAccessMode() != PySpin.RW:
+            self.status.emit("Warning: sensor ROI not writable (continuing with full frame).")
+            return
+        # offsets to 0 first so the new size is always valid, then size, then offsets
+        cam.OffsetX.SetValue(0)
+        cam.OffsetY.SetValue(0)
+        cam.Width.SetValue(fit(cam.Width, w))
+        cam.Height.SetValue(fit(cam.Height, h))
+        cam.OffsetX.SetValue(fit(cam.OffsetX, x))
+        cam.OffsetY.SetValue(fit(cam.OffsetY, y))
+        self.status.emit(
+            f"Sensor ROI x={cam.OffsetX.GetValue()} y={cam.OffsetY.GetValue()} "
+            f"w={cam.Width.GetValue()} h={cam.Height.GetValue()}"
+        )
+
     def _acquire_loop(self):
+        frame_index = 0
         while self._running:
             img = self._cam.GetNextImage(TIMEOUT_MS)
 
@@ -114,11 +153,23 @@ class CameraWorker(QObject):
                 img.Release()
                 continue
 
-            frame = img.GetNDArray()  # Mono8 -> HxW uint8
+            src = img.GetNDArray()  # Mono8 -> HxW uint8, view on the driver buffer
+            if self._pool is None:
+                self._pool = self._pool_factory(src.shape, src.dtype)
+
+            # Copy into a recycled pool slot (no allocation) before the driver buffer goes back
+            buf = self._pool.acquire()
+            if buf is not None:
+                np.copyto(buf.array, src)
             img.Release()
 
-            # Emit a *copy* to decouple from any internal buffers
-            self.frame_ready.emit(frame.copy())
+            frame_index += 1
+            if buf is None:
+                self.dropped += 1   # every slot still held: consumers are behind
+                continue
+            buf.frame_index = frame_index - 1
+            buf.timestamp = time.time()
+            self.frame_ready.emit(buf)
 
     def _cleanup(self):
         # End acquisition + deinit
@@ -179,10 +230,34 @@ class MainWindow(QMainWindow):
         self._vb.addItem(self._img_item2)
 
         self.statusBar().showMessage("Starting camera...")
+        self._frame_index = 0
+        self._shown: PooledFrame | None = None   # slot currently referenced by the ImageItem
+        self._pending: PooledFrame | None = None  # newest frame not yet drawn
+        self._pending_hits = None                 # newest HitBatch not yet drawn
+        self._ranged = False
+
+        # Display is coalesced to DISPLAY_FPS: on_frame only keeps the newest frame,
+        # the timer draws it, so repaints never run at camera rate.
+        self._acquired = 0
+        self._displayed = 0
+        self._stale = 0
+        self._rate_t0 = time.perf_counter()
+        self._rate_counts = (0, 0)
+        self._fps_acq = 0.0
+        self._fps_disp = 0.0
+        self._display_timer = QTimer(self)
+        self._display_timer.timeout.connect(self._refresh_display)
+        self._display_timer.start(max(1, int(round(1000.0 / DISPLAY_FPS))))
+
+        # Analysis runs in worker processes; created on the first frame (needs the shape)
+        self._stage: AnalysisStage | None = None
+        self._result_timer = QTimer(self)
+        self._result_timer.timeout.connect(self._collect_results)
+        self._result_timer.start(RESULT_POLL_MS)
 
         # Worker thread
         self._thread = QThread(self)
-        self._worker = CameraWorker(exposure_us=exposure_us)
+        self._worker = CameraWorker(exposure_us=exposure_us, pool_factory=self._make_pool)
         self._worker.moveToThread(self._thread)
 
         self._worker.frame_ready.connect(self.on_frame)
@@ -194,24 +269,92 @@ class MainWindow(QMainWindow):
         self._thread.started.connect(self._worker.start)
         self._thread.start()
 
+    def _make_pool(self, shape: tuple, dtype: np.dtype) -> FramePool:
+        """Called from the camera thread on the first frame: frames are acquired straight into the analysis ring."""
+        stage = AnalysisStage(shape, dtype, n_workers=ANALYSIS_WORKERS, n_slots=FRAME_SLOTS)
+        stage.start()
+        self._stage = stage
+        return stage.pool
+
     @Slot(object)
     #-------------------------------------------------------PLOTTING HERE
-    def on_frame(self, frame: np.ndarray): 
-        # frame is uint8 HxW (Mono8)
-        _, _, hits = threshold_and_extract_hits(frame)
-        
-        print('Found ',len(hits))
-        ions_x = []
-        ions_y = []
-        for hit in hits:
-            ions_x.append(hit.cx)
-            ions_y.append(hit.cy)
-        
-        self._img_item.setImage(frame, autoLevels=False)
-        self._img_item2.setData(ions_x,ions_y)
-        # Optional: auto-range on first frame
-        if self._vb.autoRangeEnabled()[0]:
+    def on_frame(self, frame: PooledFrame):
+        # frame.array is uint8 HxW (Mono8), living in the shared analysis ring.
+        # Every frame is analysed; only the newest one is kept for display.
+        if self._stage is not None:
+            self._stage.submit(frame)
+        self._frame_index = frame.frame_index
+        self._acquired += 1
+
+        if self._pending is not None:
+            self._pending.release()   # never drawn: a newer frame arrived first
+            self._stale += 1
+        self._pending = frame
+
+    @Slot()
+    def _collect_results(self):
+        if self._stage is None:
+            return
+        batches = self._stage.results()
+        if batches:
+            self._pending_hits = batches[-1]   # newest analysed frame; results arrive in frame order
+
+    @Slot()
+    def _refresh_display(self):
+        frame, self._pending = self._pending, None
+        if frame is not None:
+            self._show_frame(frame)
+        hits, self._pending_hits = self._pending_hits, None
+        if hits is not None:
+            self._img_item2.setData(x=hits.cx, y=hits.cy)
+
+        now = time.perf_counter()
+        if now - self._rate_t0 >= 1.0:
+            acq0, disp0 = self._rate_counts
+            dt = now - self._rate_t0
+            self._fps_acq = (self._acquired - acq0) / dt
+            self._fps_disp = (self._displayed - disp0) / dt
+            self._rate_t0, self._rate_counts = now, (self._acquired, self._displayed)
+            self._update_status()
+
+    def _show_frame(self, frame: PooledFrame):
+        img = frame.array
+        h, w = img.shape[:2]
+        step = int(np.ceil(np.sqrt(h * w / DISPLAY_MAX_PIXELS)))
+        if step > 1:
+            # downsampled copy: the slot can go back to the pool right away
+            small = cv2.resize(img, (w // step, h // step), interpolation=cv2.INTER_AREA)
+            self._img_item.setImage(small, autoLevels=False)
+            frame.release()
+            frame = None
+        else:
+            self._img_item.setImage(img, autoLevels=False)
+        # keep image pixels in frame coordinates so the hit overlay lines up
+        self._img_item.setRect(0, 0, w, h)
+
+        # ImageItem keeps a reference to a full-size array: hold that slot until the next draw
+        if self._shown is not None:
+            self._shown.release()
+        self._shown = frame
+        self._displayed += 1
+
+        if not self._ranged:
             self._vb.autoRange()
+            self._ranged = True
+
+    def _update_status(self):
+        dropped = self._worker.dropped
+        queue = reorder = 0
+        if self._stage is not None:
+            st = self._stage.stats
+            dropped += st.dropped
+            queue, reorder = st.queue_depth, st.reorder_depth
+        hits = self._img_item2.data
+        self.statusBar().showMessage(
+            f"frame {int(self._frame_index)}  hits {len(hits)}  "
+            f"acquired {self._fps_acq:.0f} fps  displayed {self._fps_disp:.0f} fps  "
+            f"stale {self._stale}  queue {queue}  reorder {reorder}  dropped {dropped}"
+        )
 
     def closeEvent(self, event):
         # Stop worker and wait for thread to finish
@@ -226,6 +369,15 @@ class MainWindow(QMainWindow):
             self._thread.quit()
             self._thread.wait(2000)
 
+        self._result_timer.stop()
+        self._display_timer.stop()
+        for held in (self._shown, self._pending):
+            if held is not None:
+                held.release()
+        self._shown = self._pending = None
+        if self._stage is not None:
+            self._stage.stop()
+
         super().closeEvent(event)
 
 
@@ -0,0 +1,59 @@
+"""
+TimeSeriesStore restart over a spill directory with damaged chunks.
+
+A truncated chunk, a chunk cut off inside its data, a non-array file and a
+stray .tmp from an interrupted write must not stop the store from starting:
+the bad chunks are moved aside as .bad, the .tmp is removed, and every
+intact chunk is still queried.
+
+    python timeseries_spill_test.py
+"""
+import logging
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from LabviewToPython.services.timeseries_store import TimeSeriesStore  # noqa: E402
+
+CHANNEL = "pressure/chamber"
+
+
+def test_restart_skips_bad_chunks() -> None:
+    root = tempfile.mkdtemp()
+    store = TimeSeriesStore(capacity=64, spill_dir=root, chunk_size=16)
+    for i in range(0, 96, 4):                  # six chunks of 16 samples
+        store.extend(CHANNEL, np.arange(i, i + 4.0), np.arange(i, i + 4.0))
+    store.close()
+    (folder,) = os.listdir(root)
+    folder = os.path.join(root, folder)
+    chunks = sorted(os.listdir(folder))
+    assert len(chunks) == 6 and all(n.endswith(".npy") for n in chunks), chunks
+
+    with open(os.path.join(folder, chunks[1]), "r+b") as f:
+        f.truncate(100)                        # inside the header
+    with open(os.path.join(folder, chunks[3]), "r+b") as f:
+        f.truncate(200)                        # inside the data
+    with open(os.path.join(folder, "000000009999.npy"), "wb") as f:
+        f.write(b"not an array")
+    with open(os.path.join(folder, "000000000096.npy.tmp"), "wb") as f:
+        f.write(b"half a chunk")
+
+    store = TimeSeriesStore(capacity=64, spill_dir=root, chunk_size=16)
+    ts, vs = store.query(CHANNEL, 0.0, 1000.0)
+    expected = np.concatenate([np.arange(16.0 * k, 16.0 * k + 16) for k in (0, 2, 4, 5)])
+    assert ts.tolist() == expected.tolist(), ts
+    assert vs.tolist() == expected.tolist()
+    store.close()
+
+    left = sorted(os.listdir(folder))
+    assert left == sorted([chunks[0], chunks[1] + ".bad", chunks[2], chunks[3] + ".bad",
+                           chunks[4], chunks[5], "000000009999.npy.bad"]), left
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    test_restart_skips_bad_chunks()
+    print("ok")
@@ -0,0 +1,58 @@
+"""
+TimeSeriesStore: 24 h of 10 Hz pressure, ingested in 100 ms batches like
+PressureService publishes them, then plotted as a min/max/mean envelope.
+
+With --spill the ring only holds the last part of the day and the rest is
+read back from the chunk files.
+
+    python timeseries_store_bench.py --hours 24 --rate 10 --bins 2000 --spill
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from LabviewToPython.services.timeseries_store import TimeSeriesStore  # noqa: E402
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--hours", type=float, default=24.0)
+    ap.add_argument("--rate", type=float, default=10.0)
+    ap.add_argument("--bins", type=int, default=2000)
+    ap.add_argument("--spill", action="store_true")
+    args = ap.parse_args()
+
+    n = int(args.hours * 3600 * args.rate)
+    t = time.time() - n / args.rate + np.arange(n) / args.rate
+    v = 1e-6 * (1.0 + 0.1 * np.sin(np.arange(n) / 5000.0))
+    batch = max(1, int(args.rate / 10))
+
+    spill_dir = tempfile.mkdtemp() if args.spill else None
+    store = TimeSeriesStore(capacity=(1 << 18) if args.spill else n, spill_dir=spill_dir)
+    try:
+        t0 = time.perf_counter()
+        for i in range(0, n, batch):
+            store.extend("pressure/chamber", t[i:i + batch], v[i:i + batch])
+        store.flush()
+        print(f"ingest {n} samples: {time.perf_counter() - t0:.2f} s")
+
+        for label, lo in (("1 min", t[-1] - 60), ("1 h", t[-1] - 3600), ("all", t[0])):
+            t0 = time.perf_counter()
+            d = store.downsample("pressure/chamber", lo, t[-1] + 1, args.bins)
+            print(f"downsample {label:6s} -> {args.bins} bins: {(time.perf_counter() - t0) * 1e3:7.1f} ms "
+                  f"({int(d.count.sum())} samples)")
+        print(store.stats()["pressure/chamber"])
+    finally:
+        store.close()
+        if spill_dir is not None:
+            shutil.rmtree(spill_dir)
+
+
+if __name__ == "__main__":
+    main()